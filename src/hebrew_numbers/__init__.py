@@ -4,25 +4,91 @@
 """
 
 from ._version import version as _version
+from .cache import CacheInfo, ConversionCache
+from .formatters import (
+    NumberFormatter,
+    NumberForms,
+    all_forms,
+    compile_cardinal,
+    compile_count_noun,
+    compile_count_prefix,
+    compile_indefinite,
+    compile_ordinal,
+)
 from .hebrew_numbers import (
     ConstructState,
     GrammaticalGender,
     InvalidNumberError,
     cardinal_number,
+    cardinal_number_bytes,
+    cardinal_numbers,
     count_noun,
+    count_nouns,
     count_prefix,
+    count_prefixes,
+    factorize,
     indefinite_number,
+    indefinite_numbers,
+    iter_cardinal,
+    iter_indefinite,
+    iter_ordinal,
     ordinal_number,
+    ordinal_numbers,
+    split_triads,
+    try_cardinal_number,
+    write_cardinal,
+    write_cardinal_bytes,
+    write_count_noun,
+    write_count_prefix,
+    write_indefinite,
+    write_ordinal,
 )
+from .normalize import normalize_digits
+from .parallel import convert_parallel
+from .parsing import NumberMatch, ParsedNumber, extract_numbers, parse_number
 
 __version__ = _version
 __all__ = [
+    "CacheInfo",
     "ConstructState",
+    "ConversionCache",
     "GrammaticalGender",
     "InvalidNumberError",
+    "NumberFormatter",
+    "NumberForms",
+    "NumberMatch",
+    "ParsedNumber",
+    "all_forms",
     "cardinal_number",
+    "cardinal_number_bytes",
+    "cardinal_numbers",
+    "compile_cardinal",
+    "compile_count_noun",
+    "compile_count_prefix",
+    "compile_indefinite",
+    "compile_ordinal",
+    "convert_parallel",
     "count_noun",
+    "count_nouns",
     "count_prefix",
+    "count_prefixes",
+    "extract_numbers",
+    "factorize",
     "indefinite_number",
+    "indefinite_numbers",
+    "iter_cardinal",
+    "iter_indefinite",
+    "iter_ordinal",
+    "normalize_digits",
     "ordinal_number",
+    "ordinal_numbers",
+    "parse_number",
+    "split_triads",
+    "try_cardinal_number",
+    "write_cardinal",
+    "write_cardinal_bytes",
+    "write_count_noun",
+    "write_count_prefix",
+    "write_indefinite",
+    "write_ordinal",
 ]
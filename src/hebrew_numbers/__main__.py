@@ -0,0 +1,6 @@
+"""Run the command-line interface, with `python -m hebrew_numbers`."""
+
+from .cli import app
+
+if __name__ == "__main__":
+    raise SystemExit(app(prog="hebrew-numbers"))
@@ -0,0 +1,309 @@
+"""Converting many numbers without blocking an asyncio event loop.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from .formatters import (
+    NumberFormatter,
+    compile_cardinal,
+    compile_count_noun,
+    compile_count_prefix,
+    compile_indefinite,
+    compile_ordinal,
+)
+from .hebrew_numbers import _checked_batch
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
+    from .hebrew_numbers import ConstructState, GrammaticalGender
+
+__all__ = [
+    "acardinal_numbers",
+    "acount_nouns",
+    "acount_prefixes",
+    "aformat_many",
+    "aindefinite_numbers",
+    "aiter_format",
+    "aordinal_numbers",
+]
+
+# the numbers converted between checks of the clock, when yielding by time
+_CLOCK_BLOCK = 64
+
+
+def _check_scheduling(yield_every: int, yield_interval: float | None) -> None:
+    if yield_every < 1:
+        raise ValueError("yield_every must be positive")
+    if yield_interval is not None and yield_interval <= 0:
+        raise ValueError("yield_interval must be positive")
+
+
+async def _format_blocks(
+    formatter: NumberFormatter,
+    batch: Sequence[int],
+    yield_every: int,
+    yield_interval: float | None,
+) -> AsyncIterator[list[str]]:
+    """Convert a validated batch in blocks, yielding to the loop between blocks."""
+    format_ = formatter._format  # noqa: SLF001
+    block = yield_every
+    if yield_interval is not None:
+        block = min(block, _CLOCK_BLOCK)
+    deadline = 0.0
+    if yield_interval is not None:
+        deadline = time.perf_counter() + yield_interval
+    pending = 0
+    for start in range(0, len(batch), block):
+        results = [format_(n) for n in batch[start : start + block]]
+        yield results
+        pending += len(results)
+        if pending >= yield_every or (
+            yield_interval is not None and time.perf_counter() >= deadline
+        ):
+            await asyncio.sleep(0)
+            pending = 0
+            if yield_interval is not None:
+                deadline = time.perf_counter() + yield_interval
+
+
+async def aformat_many(  # noqa: PLR0913
+    formatter: NumberFormatter,
+    numbers: Iterable[int],
+    *,
+    yield_every: int = 1000,
+    yield_interval: float | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_above: int | None = None,
+    out: list[str] | None = None,
+) -> list[str]:
+    """Convert many numbers with a formatter, letting other tasks run meanwhile.
+
+    Like `formatter.many(numbers)`, the numbers are validated before any of them is
+    converted. The conversion then returns control to the event loop every
+    `yield_every` numbers, and, if `yield_interval` is given, whenever that much
+    time has passed since it last did. A batch of more than `offload_above` numbers
+    is validated and converted in an executor instead, and its results are appended
+    to `out` in the event loop once the executor is done.
+
+    Args:
+        formatter: A formatter, created by one of the `compile_*` functions.
+        numbers: Integers to convert.
+        yield_every: Number of numbers to convert between yields to the loop.
+        yield_interval: Longest time, in seconds, to convert between yields to the
+            loop. The clock is checked every few dozen numbers.
+        executor: Executor for the offloaded batches. The default executor of the
+            loop, a thread pool, is used by default.
+        offload_above: Size of the largest batch to convert in the event loop.
+            By default, all batches are converted in the event loop.
+        out: List to append the results to. A new list is used by default.
+
+    Returns:
+        The list of results.
+
+    Raises:
+        InvalidNumberError: If any of the numbers is not supported by the formatter.
+            Nothing is converted in that case.
+        ValueError: If yield_every or yield_interval is not positive.
+
+    Examples:
+        >>> import asyncio
+        >>> from hebrew_numbers import compile_ordinal
+        >>> asyncio.run(aformat_many(compile_ordinal("f"), [1, 2], yield_every=1))
+        ['ראשונה', 'שנייה']
+    """
+    _check_scheduling(yield_every, yield_interval)
+    if out is None:
+        out = []
+    if offload_above is not None:
+        if not isinstance(numbers, (list, tuple, range)):
+            numbers = list(numbers)
+        if len(numbers) > offload_above:
+            loop = asyncio.get_running_loop()
+            # the executor returns a new list, so `out` is only touched by the loop
+            out.extend(await loop.run_in_executor(executor, _many, formatter, numbers))
+            return out
+    batch = _checked_batch(numbers, formatter._check)  # noqa: SLF001
+    async for results in _format_blocks(formatter, batch, yield_every, yield_interval):
+        out.extend(results)
+    return out
+
+
+def _many(formatter: NumberFormatter, numbers: Sequence[int]) -> list[str]:
+    """Validate and convert a batch, in an executor."""
+    batch = _checked_batch(numbers, formatter._check)  # noqa: SLF001
+    return list(map(formatter._format, batch))  # noqa: SLF001
+
+
+async def aiter_format(
+    formatter: NumberFormatter,
+    numbers: Iterable[int],
+    *,
+    yield_every: int = 1000,
+    yield_interval: float | None = None,
+) -> AsyncIterator[str]:
+    """Convert many numbers with a formatter, as an asynchronous generator.
+
+    The numbers are validated when the generator starts, and converted in blocks,
+    yielding to the event loop like `aformat_many`.
+    See `aformat_many` for the arguments.
+
+    Raises:
+        InvalidNumberError: If any of the numbers is not supported by the formatter.
+            Nothing is yielded in that case.
+        ValueError: If yield_every or yield_interval is not positive.
+
+    Examples:
+        >>> import asyncio
+        >>> from hebrew_numbers import compile_indefinite
+        >>> async def collect():
+        ...     return [text async for text in aiter_format(compile_indefinite(), [7])]
+        >>> asyncio.run(collect())
+        ['שבע']
+    """
+    _check_scheduling(yield_every, yield_interval)
+    batch = _checked_batch(numbers, formatter._check)  # noqa: SLF001
+    async for results in _format_blocks(formatter, batch, yield_every, yield_interval):
+        for text in results:
+            yield text
+
+
+async def acardinal_numbers(  # noqa: PLR0913
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+    *,
+    yield_every: int = 1000,
+    yield_interval: float | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_above: int | None = None,
+    out: list[str] | None = None,
+) -> list[str]:
+    """Convert many numbers like `cardinal_numbers`, letting other tasks run meanwhile.
+
+    See `aformat_many` for the scheduling arguments.
+
+    Examples:
+        >>> import asyncio
+        >>> asyncio.run(acardinal_numbers([1, 2], "f", construct=False))
+        ['אחת', 'שתיים']
+    """
+    return await aformat_many(
+        compile_cardinal(gender, construct),
+        numbers,
+        yield_every=yield_every,
+        yield_interval=yield_interval,
+        executor=executor,
+        offload_above=offload_above,
+        out=out,
+    )
+
+
+async def aindefinite_numbers(  # noqa: PLR0913
+    numbers: Iterable[int],
+    *,
+    yield_every: int = 1000,
+    yield_interval: float | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_above: int | None = None,
+    out: list[str] | None = None,
+) -> list[str]:
+    """Convert many numbers like `indefinite_numbers`, letting other tasks run.
+
+    See `aformat_many` for the scheduling arguments.
+    """
+    return await aformat_many(
+        compile_indefinite(),
+        numbers,
+        yield_every=yield_every,
+        yield_interval=yield_interval,
+        executor=executor,
+        offload_above=offload_above,
+        out=out,
+    )
+
+
+async def aordinal_numbers(  # noqa: PLR0913
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    yield_every: int = 1000,
+    yield_interval: float | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_above: int | None = None,
+    out: list[str] | None = None,
+) -> list[str]:
+    """Convert many numbers like `ordinal_numbers`, letting other tasks run.
+
+    See `aformat_many` for the scheduling arguments.
+    """
+    return await aformat_many(
+        compile_ordinal(gender),
+        numbers,
+        yield_every=yield_every,
+        yield_interval=yield_interval,
+        executor=executor,
+        offload_above=offload_above,
+        out=out,
+    )
+
+
+async def acount_prefixes(  # noqa: PLR0913
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    yield_every: int = 1000,
+    yield_interval: float | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_above: int | None = None,
+    out: list[str] | None = None,
+) -> list[str]:
+    """Convert many numbers like `count_prefixes`, letting other tasks run.
+
+    See `aformat_many` for the scheduling arguments.
+    """
+    return await aformat_many(
+        compile_count_prefix(gender, definite=definite),
+        numbers,
+        yield_every=yield_every,
+        yield_interval=yield_interval,
+        executor=executor,
+        offload_above=offload_above,
+        out=out,
+    )
+
+
+async def acount_nouns(  # noqa: PLR0913
+    numbers: Iterable[int],
+    singular_form: str,
+    plural_form: str,
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    yield_every: int = 1000,
+    yield_interval: float | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_above: int | None = None,
+    out: list[str] | None = None,
+) -> list[str]:
+    """Convert many numbers like `count_nouns`, letting other tasks run.
+
+    See `aformat_many` for the scheduling arguments.
+    """
+    return await aformat_many(
+        compile_count_noun(singular_form, plural_form, gender, definite=definite),
+        numbers,
+        yield_every=yield_every,
+        yield_interval=yield_interval,
+        executor=executor,
+        offload_above=offload_above,
+        out=out,
+    )
@@ -0,0 +1,349 @@
+"""Converting integer arrays to Apache Arrow string arrays.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as exc:
+    msg = (
+        "pyarrow is required for Arrow output of Hebrew numbers. "
+        "Install with: pip install hebrew-numbers[arrow]"
+    )
+    raise ImportError(msg) from exc
+
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast, overload
+
+import numpy as np
+
+from .hebrew_numbers import (
+    _ORDINALS,
+    ConstructState,
+    GrammaticalGender,
+    InvalidNumberError,
+    _group_table,
+    _joined_triad_table,
+    _table_cache,
+    _trailing_triad_table,
+)
+from .numpy import _as_integer_array, _check_positive, _magnitudes, factorize
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import numpy.typing as npt
+
+    from .formatters import _Form
+    from .numpy import _IntegerArray
+
+    _StringArray = pa.StringArray | pa.LargeStringArray
+    _DictionaryArray = pa.DictionaryArray[
+        pa.lib.Int32Type, pa.lib.StringType | pa.lib.LargeStringType
+    ]
+
+__all__ = ["to_arrow"]
+
+# the largest data buffer of a `pa.string()` array, with its 32-bit offsets
+_MAX_STRING_BYTES = 2**31 - 1
+# the numbers whose fragments are gathered and concatenated at a time
+_CHUNK_SIZE = 65536
+
+
+class _Fragments(NamedTuple):
+    """A table of UTF-8 fragments, and the length of each one in bytes."""
+
+    strings: pa.StringArray
+    lengths: npt.NDArray[np.int64]
+
+    @classmethod
+    def from_strings(cls, strings: list[str]) -> _Fragments:
+        array = pa.array(strings, pa.string())
+        lengths = np.asarray(pc.binary_length(array), dtype=np.int64)
+        lengths.flags.writeable = False
+        return cls(array, lengths)
+
+
+@_table_cache
+def _low_fragments(
+    form: _Form,
+    grammatical_gender: GrammaticalGender,
+    construct_state: ConstructState,
+    definite: bool,  # noqa: FBT001
+) -> _Fragments:
+    """Fragments of the last triad of a form, as a table of 2000 entries.
+
+    Entry `t` holds the triad when it is the whole number.
+    Entry `1000 + t` holds the triad when it follows a higher group, with its
+    separator.
+    """
+    whole = list(_joined_triad_table(grammatical_gender, construct_state))
+    if form == "indefinite":
+        whole[0] = "אפס"
+    elif form == "ordinal":
+        whole[1:11] = _ORDINALS[grammatical_gender]
+    elif form == "count_prefix":
+        # GRAMMAR RULE: always using construct form for 2, and for definite nouns
+        # up to 10
+        construct = _joined_triad_table(grammatical_gender, ConstructState.CONSTRUCT)
+        last = 10 if definite else 2
+        whole[2 : last + 1] = construct[2 : last + 1]
+    return _Fragments.from_strings([*whole, *_trailing_triad_table(grammatical_gender)])
+
+
+@_table_cache
+def _group_fragments(scale: int) -> _Fragments:
+    """Fragments of a group of thousands or above, as a table of 3000 entries.
+
+    Entry `t` holds the group when it is the first part of the number.
+    Entry `1000 + t` holds the group when it follows another group, with its
+    separator.
+    Entry `2000 + t` holds the group when it also ends the number, with the "and"
+    separator.
+    """
+    groups = _group_table(scale)
+    following = [f" {group}" if group else "" for group in groups]
+    ending = [f" ו{group}" if group else "" for group in groups]  # noqa: RUF001
+    return _Fragments.from_strings([*groups, *following, *ending])
+
+
+@_table_cache
+def _sign_fragments() -> _Fragments:
+    """Fragments of the sign of an indefinite number, by whether it is negative."""
+    return _Fragments.from_strings(["", "מינוס "])
+
+
+def _levels(
+    magnitudes: npt.NDArray[np.uint64],
+    negative: npt.NDArray[np.bool_] | None,
+    low_fragments: _Fragments,
+) -> Iterator[tuple[_Fragments, npt.NDArray[np.intp]]]:
+    """Yield a table of fragments, and the entry of each number in it, per level.
+
+    The levels are yielded from the last triad up, as in `hebrew_numbers.numpy`.
+    """
+    rest, low = np.divmod(magnitudes, np.uint64(1000))
+    has_groups = rest > 0
+    yield low_fragments, has_groups * 1000 + low.astype(np.intp)
+    ends_number = low == 0
+    scale = 1
+    while has_groups.any():
+        rest, t = np.divmod(rest, np.uint64(1000))
+        has_higher = rest > 0
+        variant = has_higher * (1 + ends_number).astype(np.intp)
+        yield _group_fragments(scale), variant * 1000 + t.astype(np.intp)
+        ends_number &= t == 0
+        has_groups = has_higher
+        scale += 1
+    if negative is not None and negative.any():
+        yield _sign_fragments(), negative.astype(np.intp)
+
+
+def _join(
+    magnitudes: npt.NDArray[np.uint64],
+    negative: npt.NDArray[np.bool_] | None,
+    low_fragments: _Fragments,
+) -> pa.StringArray:
+    """Concatenate the fragments of a chunk of numbers, in Arrow."""
+    levels = [
+        fragments.strings.take(indices)
+        for fragments, indices in _levels(magnitudes, negative, low_fragments)
+    ]
+    levels.reverse()
+    # the last argument is the separator, which the stubs do not accept as a str
+    joined = pc.binary_join_element_wise(*levels, "")  # type: ignore[call-overload]
+    return cast("pa.StringArray", joined)
+
+
+def _convert(
+    arr: _IntegerArray,
+    form: _Form,
+    low_fragments: _Fragments,
+    validity: pa.Buffer | None = None,
+) -> _StringArray:
+    """Translate a validated 1-D array, building the buffers of its Arrow array.
+
+    Like `hebrew_numbers.numpy`, the numbers are split into triads with vectorized
+    integer division, and each triad selects a fragment from a table of UTF-8
+    strings. A first pass sums the lengths of the fragments into the offsets of
+    the result, and a second pass concatenates the fragments of each chunk in Arrow
+    and copies them into the data buffer, so no Python string is created for any of
+    the numbers, and the memory used beyond the result is that of a single chunk.
+    """
+    magnitudes = _magnitudes(arr)
+    negative = None
+    if form == "indefinite":
+        # negate through uint64, as the minimal int64 has no positive counterpart
+        negative = arr < 0
+        magnitudes = magnitudes.copy()
+        np.negative(magnitudes, out=magnitudes, where=negative)
+    chunks = [
+        (start, min(start + _CHUNK_SIZE, len(arr)))
+        for start in range(0, len(arr), _CHUNK_SIZE)
+    ]
+    offsets = np.zeros(len(arr) + 1, dtype=np.int64)
+    for start, stop in chunks:
+        sign = None if negative is None else negative[start:stop]
+        lengths = offsets[start + 1 : stop + 1]
+        for fragments, indices in _levels(magnitudes[start:stop], sign, low_fragments):
+            lengths += fragments.lengths[indices]
+    np.cumsum(offsets, out=offsets)
+    # use 64-bit offsets only when the result does not fit 32-bit ones
+    string_type: pa.DataType
+    if offsets[-1] <= _MAX_STRING_BYTES:
+        string_type = pa.string()
+        offsets_buffer = pa.py_buffer(offsets.astype(np.int32).data)
+    else:
+        string_type = pa.large_string()
+        offsets_buffer = pa.py_buffer(offsets.data)
+    data = np.empty(offsets[-1], dtype=np.uint8)
+    for start, stop in chunks:
+        sign = None if negative is None else negative[start:stop]
+        joined = _join(magnitudes[start:stop], sign, low_fragments)
+        size = offsets[stop] - offsets[start]
+        if size:
+            # a string array with any bytes always has a data buffer
+            joined_data = joined.buffers()[2]
+            assert joined_data is not None  # noqa: S101
+            data[offsets[start] : offsets[stop]] = np.frombuffer(
+                memoryview(joined_data), dtype=np.uint8, count=size
+            )
+    result = pa.Array.from_buffers(
+        string_type,
+        len(arr),
+        [validity, offsets_buffer, pa.py_buffer(data.data)],
+    )
+    return cast("_StringArray", result)
+
+
+def _resolve(
+    form: _Form,
+    gender: GrammaticalGender | str | None,
+    construct: ConstructState | bool,  # noqa: FBT001
+) -> tuple[GrammaticalGender, ConstructState]:
+    """Validate the arguments of a form, and resolve its gender and construct state."""
+    if form not in {"cardinal", "indefinite", "ordinal", "count_prefix"}:
+        raise ValueError(f"Invalid form: {form}")
+    if form == "indefinite":
+        grammatical_gender = GrammaticalGender.FEMININE
+    elif gender is None:
+        raise ValueError(f"The {form} form requires a gender")
+    else:
+        grammatical_gender = GrammaticalGender.from_string(gender)
+    if form != "cardinal":
+        return grammatical_gender, ConstructState.ABSOLUTE
+    construct_state = ConstructState.from_boolean(construct)
+    if construct_state == ConstructState.CONSTRUCT79:
+        raise ValueError("Cannot convert to Arrow with CONSTRUCT79")
+    return grammatical_gender, construct_state
+
+
+def _check(arr: _IntegerArray, form: _Form) -> None:
+    if form == "indefinite":
+        return
+    _check_positive(arr)
+    if form == "count_prefix" and (arr == 1).any():
+        raise InvalidNumberError("The count-form of number '1' is not a prefix")
+
+
+@overload
+def to_arrow(
+    numbers: npt.ArrayLike | pa.Array[pa.Scalar[pa.DataType]],
+    form: _Form = "cardinal",
+    *,
+    gender: GrammaticalGender | str | None = None,
+    construct: ConstructState | bool = False,
+    definite: bool = False,
+    dictionary: Literal[False] = False,
+) -> _StringArray: ...
+@overload
+def to_arrow(
+    numbers: npt.ArrayLike | pa.Array[pa.Scalar[pa.DataType]],
+    form: _Form = "cardinal",
+    *,
+    gender: GrammaticalGender | str | None = None,
+    construct: ConstructState | bool = False,
+    definite: bool = False,
+    dictionary: Literal[True],
+) -> _DictionaryArray: ...
+def to_arrow(  # noqa: PLR0913
+    numbers: npt.ArrayLike | pa.Array[pa.Scalar[pa.DataType]],
+    form: _Form = "cardinal",
+    *,
+    gender: GrammaticalGender | str | None = None,
+    construct: ConstructState | bool = False,
+    definite: bool = False,
+    dictionary: bool = False,
+) -> _StringArray | _DictionaryArray:
+    """Translate an integer array into an Arrow array of strings.
+
+    The offsets and data buffers of the result are built from tables of precomputed
+    UTF-8 fragments, without creating a Python string per number, so a column can be
+    converted and written to Parquet without holding its strings twice in memory.
+
+    Args:
+        numbers: A 1-D integer array, such as a NumPy array or a `pa.Array`.
+            The nulls of a `pa.Array` are kept as nulls.
+        form: One of "cardinal", "indefinite", "ordinal" and "count_prefix",
+            converting like `cardinal_number`, `indefinite_number`, `ordinal_number`
+            and `count_prefix`.
+        gender: Grammatical gender, required by all forms but "indefinite".
+        construct: Construct state of the "cardinal" form.
+        definite: Definiteness of the "count_prefix" form.
+        dictionary: Whether to return a `pa.DictionaryArray`, converting each
+            distinct number once. This is much smaller and faster for columns with
+            few distinct values.
+
+    Returns:
+        A `pa.StringArray`, or a `pa.LargeStringArray` if the strings do not fit
+        in 2 GiB, or a `pa.DictionaryArray` with one of them as its dictionary.
+
+    Raises:
+        InvalidNumberError: If any of the numbers is not supported by the form.
+        TypeError: If `numbers` is not an integer array.
+        ValueError: If `numbers` is not 1-D, if the form is invalid or requires
+            a missing gender, or if construct is `ConstructState.CONSTRUCT79`, which
+            is only used for parts of numbers.
+
+    Examples:
+        >>> to_arrow(np.array([3, 1234]), gender="m").to_pylist()
+        ['שלושה', 'אלף מאתיים שלושים וארבעה']
+        >>> result = to_arrow(
+        ...     pa.array([2, None, 2]), "ordinal", gender="f", dictionary=True
+        ... )
+        >>> result.dictionary.to_pylist(), result.indices.to_pylist()
+        (['שנייה'], [0, None, 0])
+    """
+    grammatical_gender, construct_state = _resolve(form, gender, construct)
+    low_fragments = _low_fragments(form, grammatical_gender, construct_state, definite)
+    if isinstance(numbers, pa.Array):
+        if not pa.types.is_integer(numbers.type):
+            raise TypeError(f"Expected an integer array, got type {numbers.type}")
+        if dictionary:
+            # encode in Arrow, which keeps the nulls as null indices
+            encoded = numbers.dictionary_encode()
+            uniques = _as_integer_array(encoded.dictionary)
+            _check(uniques, form)
+            strings = _convert(uniques, form, low_fragments)
+            encoded = pa.DictionaryArray.from_arrays(encoded.indices, strings)
+            return cast("_DictionaryArray", encoded)
+        validity = None
+        if numbers.null_count:
+            validity = numbers.is_valid().buffers()[1]
+        # any supported number can stand in for the nulls
+        lowest = {"indefinite": 0, "count_prefix": 2}.get(form, 1)
+        arr = _as_integer_array(pc.fill_null(numbers, pa.scalar(lowest, numbers.type)))
+        _check(arr, form)
+        return _convert(arr, form, low_fragments, validity)
+    arr = _as_integer_array(numbers)
+    if arr.ndim != 1:
+        raise ValueError(f"Expected a 1-D array, got {arr.ndim} dimensions")
+    _check(arr, form)
+    if dictionary:
+        codes, uniques = factorize(arr)
+        strings = _convert(uniques, form, low_fragments)
+        encoded = pa.DictionaryArray.from_arrays(pa.array(codes, pa.int32()), strings)
+        return cast("_DictionaryArray", encoded)
+    return _convert(arr, form, low_fragments)
@@ -0,0 +1,257 @@
+"""Bounded memoization of the Hebrew number converters.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import collections
+import operator
+import sys
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+from .hebrew_numbers import (
+    ConstructState,
+    GrammaticalGender,
+    cardinal_number,
+    count_noun,
+    count_prefix,
+    indefinite_number,
+    ordinal_number,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["CacheInfo", "ConversionCache"]
+
+_Key = tuple[object, ...]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `ConversionCache`.
+
+    Attributes:
+        hits: Number of calls answered from the cache.
+        misses: Number of calls that had to convert the number.
+        maxsize: Maximal number of entries, or None if unbounded.
+        currsize: Current number of entries.
+        maxbytes: Maximal total size of the cached strings, or None if unbounded.
+        currbytes: Current total size of the cached strings.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    maxbytes: int | None
+    currbytes: int
+
+
+def _split(limit: int | None, shards: int, i: int) -> int | None:
+    """Return the share of shard `i` in a limit."""
+    if limit is None:
+        return None
+    return limit // shards + (i < limit % shards)
+
+
+class _Shard:
+    """An LRU cache of some of the keys, with its own lock and statistics."""
+
+    __slots__ = (
+        "currbytes",
+        "entries",
+        "hits",
+        "lock",
+        "maxbytes",
+        "maxsize",
+        "misses",
+    )
+
+    def __init__(self, maxsize: int | None, maxbytes: int | None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.entries: collections.OrderedDict[_Key, str] = collections.OrderedDict()
+        self.currbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: _Key) -> str | None:
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+            return None
+
+    def put(self, key: _Key, value: str) -> None:
+        size = sys.getsizeof(value)
+        if self.maxsize == 0 or (self.maxbytes is not None and size > self.maxbytes):
+            return
+        with self.lock:
+            if key in self.entries:
+                return
+            self.entries[key] = value
+            self.currbytes += size
+            while (self.maxsize is not None and len(self.entries) > self.maxsize) or (
+                self.maxbytes is not None and self.currbytes > self.maxbytes
+            ):
+                _, evicted = self.entries.popitem(last=False)
+                self.currbytes -= sys.getsizeof(evicted)
+
+
+class ConversionCache:
+    """An LRU cache in front of the public converters.
+
+    Arguments are normalized before lookup, so every alias of a gender
+    (e.g. "m", "male", "זכר" and `GrammaticalGender.MASCULINE`) shares one entry.
+    Entries are evicted, least recently used first, when either `maxsize` entries
+    or `maxbytes` bytes of cached strings are exceeded.
+    Invalid input is never cached, and raises as the underlying converter does.
+
+    The cache is safe to share between threads. To reduce lock contention between
+    many threads, e.g. in free-threaded builds, split it into several shards.
+    Each shard has its own lock and its own share of the limits, and evicts its own
+    least recently used entries.
+
+    Examples:
+        >>> cache = ConversionCache(maxsize=128)
+        >>> cache.cardinal_number(3, "m", construct=False)
+        'שלושה'
+        >>> cache.cardinal_number(3, "male", construct=ConstructState.ABSOLUTE)
+        'שלושה'
+        >>> info = cache.cache_info()
+        >>> info.hits, info.misses, info.currsize
+        (1, 1, 1)
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 1024,
+        maxbytes: int | None = None,
+        *,
+        shards: int = 1,
+    ):
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximal number of entries, or None for no limit.
+            maxbytes: Maximal total size (as reported by `sys.getsizeof`) of the
+                cached strings, or None for no limit.
+            shards: Number of independently locked parts of the cache.
+
+        Raises:
+            ValueError: If a limit is negative, or shards is not positive.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError("maxbytes must be non-negative")
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._shards = tuple(
+            _Shard(_split(maxsize, shards, i), _split(maxbytes, shards, i))
+            for i in range(shards)
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """Report the cache statistics."""
+        hits = misses = currsize = currbytes = 0
+        for shard in self._shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                currsize += len(shard.entries)
+                currbytes += shard.currbytes
+        return CacheInfo(
+            hits, misses, self._maxsize, currsize, self._maxbytes, currbytes
+        )
+
+    def cache_clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        for shard in self._shards:
+            shard.clear()
+
+    def _get(self, key: _Key, convert: Callable[[], str]) -> str:
+        shard = self._shards[hash(key) % len(self._shards)]
+        value = shard.get(key)
+        if value is None:
+            value = convert()
+            shard.put(key, value)
+        return value
+
+    def cardinal_number(
+        self,
+        n: int,
+        gender: GrammaticalGender | str,
+        construct: ConstructState | bool,  # noqa: FBT001
+    ) -> str:
+        """Convert like `cardinal_number`, through the cache."""
+        n = operator.index(n)
+        grammatical_gender = GrammaticalGender.from_string(gender)
+        construct_state = ConstructState.from_boolean(construct)
+        return self._get(
+            ("cardinal", n, grammatical_gender, construct_state),
+            lambda: cardinal_number(n, grammatical_gender, construct_state),
+        )
+
+    def indefinite_number(self, n: int) -> str:
+        """Convert like `indefinite_number`, through the cache."""
+        n = operator.index(n)
+        return self._get(("indefinite", n), lambda: indefinite_number(n))
+
+    def ordinal_number(self, n: int, gender: GrammaticalGender | str) -> str:
+        """Convert like `ordinal_number`, through the cache."""
+        n = operator.index(n)
+        grammatical_gender = GrammaticalGender.from_string(gender)
+        return self._get(
+            ("ordinal", n, grammatical_gender),
+            lambda: ordinal_number(n, grammatical_gender),
+        )
+
+    def count_prefix(
+        self,
+        n: int,
+        gender: GrammaticalGender | str,
+        *,
+        definite: bool = False,
+    ) -> str:
+        """Convert like `count_prefix`, through the cache."""
+        n = operator.index(n)
+        grammatical_gender = GrammaticalGender.from_string(gender)
+        return self._get(
+            ("count_prefix", n, grammatical_gender, definite),
+            lambda: count_prefix(n, grammatical_gender, definite=definite),
+        )
+
+    def count_noun(
+        self,
+        n: int,
+        singular_form: str,
+        plural_form: str,
+        gender: GrammaticalGender | str,
+        *,
+        definite: bool = False,
+    ) -> str:
+        """Convert like `count_noun`, through the cache."""
+        n = operator.index(n)
+        grammatical_gender = GrammaticalGender.from_string(gender)
+        return self._get(
+            ("count_noun", n, singular_form, plural_form, grammatical_gender, definite),
+            lambda: count_noun(
+                n, singular_form, plural_form, grammatical_gender, definite=definite
+            ),
+        )
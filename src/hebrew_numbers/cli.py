@@ -0,0 +1,238 @@
+"""The command-line interface: convert streams of integers to Hebrew.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import os
+import sys
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from .formatters import NumberFormatter, _compile_form, _Form, compile_count_noun
+from .hebrew_numbers import InvalidNumberError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+__all__ = ["app"]
+
+# the number of lines read, converted and written at a time
+_BATCH_SIZE = 8192
+_FORMS: dict[str, _Form] = {
+    "cardinal": "cardinal",
+    "ordinal": "ordinal",
+    "indefinite": "indefinite",
+    "count": "count_prefix",
+}
+
+
+class _InputError(Exception):
+    """A line of the input that is not a supported integer."""
+
+
+def _parser(prog: str | None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Convert integers, one per line, to Hebrew words.",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        metavar="FILE",
+        help="files to read, or - for the standard input (the default)",
+    )
+    parser.add_argument(
+        "-f",
+        "--form",
+        choices=list(_FORMS),
+        default="cardinal",
+        help="the form to convert to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-g",
+        "--gender",
+        help="grammatical gender, m or f, required by all forms but indefinite",
+    )
+    parser.add_argument(
+        "--construct",
+        action="store_true",
+        help="use the construct state (סמיכות) of the cardinal form",
+    )
+    parser.add_argument(
+        "--definite",
+        action="store_true",
+        help="use the definite count form",
+    )
+    parser.add_argument(
+        "--noun",
+        nargs=2,
+        metavar=("SINGULAR", "PLURAL"),
+        help="count this noun, instead of writing the count prefix",
+    )
+    parser.add_argument(
+        "-c",
+        "--column",
+        help="read a CSV column, by 1-based index or by the name in the header row",
+    )
+    parser.add_argument(
+        "-d",
+        "--delimiter",
+        default=",",
+        help="the CSV delimiter (default: %(default)s)",
+    )
+    return parser
+
+
+def _formatter(args: argparse.Namespace) -> NumberFormatter:
+    if args.noun is not None:
+        if args.form != "count":
+            raise ValueError("--noun requires --form count")
+        if args.gender is None:
+            raise ValueError("The count form requires a gender")
+        singular, plural = args.noun
+        return compile_count_noun(singular, plural, args.gender, definite=args.definite)
+    return _compile_form(_FORMS[args.form], args.gender, args.construct, args.definite)
+
+
+def _csv_column(
+    stream: IO[bytes], column: str, delimiter: str
+) -> tuple[Iterator[str], int]:
+    """Read a column of a CSV file, and return its values and their first line."""
+    rows = csv.reader(
+        io.TextIOWrapper(stream, encoding="utf-8", newline=""), delimiter=delimiter
+    )
+    first = 1
+    if column.isdigit():
+        index = int(column) - 1
+        if index < 0:
+            raise ValueError(f"Invalid column: {column}")
+    else:
+        header = next(rows, [])
+        if column not in header:
+            raise ValueError(f"No column named {column!r}")
+        index = header.index(column)
+        first = 2
+    return (row[index] if index < len(row) else "" for row in rows), first
+
+
+def _convert(
+    formatter: NumberFormatter, values: Sequence[str | bytes], first: int
+) -> bytes:
+    """Convert a batch of lines, numbered from `first`, into UTF-8 output.
+
+    A blank line is converted into an empty line, to keep the output aligned with
+    the input.
+    """
+    try:
+        try:
+            # `int` accepts bytes and ignores the surrounding whitespace
+            results = formatter.many([int(value) for value in values])
+        except ValueError:
+            numbers = [int(value) if value.strip() else None for value in values]
+            converted = iter(formatter.many([n for n in numbers if n is not None]))
+            results = ["" if n is None else next(converted) for n in numbers]
+    except (ValueError, InvalidNumberError):
+        # find the first invalid line, to report it
+        for lineno, value in enumerate(values, first):
+            if not value.strip():
+                continue
+            try:
+                n = int(value)
+            except ValueError:
+                text = (
+                    value.decode(errors="replace")
+                    if isinstance(value, bytes)
+                    else value
+                )
+                raise _InputError(
+                    f"line {lineno}: Not an integer: {text.strip()!r}"
+                ) from None
+            try:
+                formatter(n)
+            except InvalidNumberError as e:
+                raise _InputError(f"line {lineno}: {e}") from None
+        raise
+    results.append("")
+    return "\n".join(results).encode()
+
+
+def _run(
+    formatter: NumberFormatter,
+    sources: Iterable[tuple[str, Iterable[str | bytes], int]],
+    out: IO[bytes],
+) -> None:
+    for name, values, first in sources:
+        lines = iter(values)
+        lineno = first
+        while batch := list(itertools.islice(lines, _BATCH_SIZE)):
+            try:
+                out.write(_convert(formatter, batch, lineno))
+            except _InputError as e:
+                raise _InputError(f"{name}: {e}") from None
+            lineno += len(batch)
+
+
+def _sources(
+    files: Sequence[str],
+    column: str | None,
+    delimiter: str,
+    stack: contextlib.ExitStack,
+) -> Iterator[tuple[str, Iterable[str | bytes], int]]:
+    """Open the files one at a time, and yield their values and first line."""
+    for path in files:
+        if path == "-":
+            name = "<stdin>"
+            stream: IO[bytes] = sys.stdin.buffer
+        else:
+            name = path
+            stream = stack.enter_context(Path(path).open("rb"))  # noqa: SIM115
+        if column is None:
+            yield name, stream, 1
+        else:
+            yield name, *_csv_column(stream, column, delimiter)
+
+
+def app(argv: Sequence[str] | None = None, prog: str | None = None) -> int:
+    """Run the `hebrew-numbers` command.
+
+    Integers are read one per line, or from a CSV column, converted in batches by a
+    precompiled formatter, and written as UTF-8 to the standard output, one result
+    per line. A blank line or CSV cell gives an empty line. Only a single batch is
+    held in memory at a time.
+
+    Args:
+        argv: The command-line arguments. Defaults to `sys.argv[1:]`.
+        prog: The name of the command, shown in the help and in error messages.
+
+    Returns:
+        The exit status.
+    """
+    parser = _parser(prog)
+    args = parser.parse_args(argv)
+    try:
+        formatter = _formatter(args)
+    except ValueError as e:
+        parser.error(str(e))
+    out = sys.stdout.buffer
+    try:
+        with contextlib.ExitStack() as stack:
+            sources = _sources(args.files, args.column, args.delimiter, stack)
+            _run(formatter, sources, out)
+        out.flush()
+    except BrokenPipeError:
+        # the reader has exited, like `head` does. stop quietly, and keep Python
+        # from failing again when it flushes the standard output on exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (_InputError, OSError, ValueError) as e:
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,104 @@
+"""Exporting tables of the forms of many numbers.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
+
+from .formatters import _FORMS, _FormSet
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from _typeshed import SupportsWrite
+
+    from .formatters import NumberFormatter
+
+__all__ = ["FORMS", "write_forms_csv"]
+
+FORMS: tuple[str, ...] = tuple(_FORMS)
+"""The names of the forms that `write_forms_csv` can write."""
+
+# the number of rows converted and written at a time
+_BATCH_SIZE = 1024
+# the line terminator of the default dialect of `csv.writer`
+_LINE_TERMINATOR = "\r\n"
+# the characters that a cell must be quoted for
+_SPECIAL_CHARACTERS = frozenset(',"\r\n')
+
+
+def write_forms_csv(
+    numbers: Iterable[int],
+    file: SupportsWrite[str],
+    forms: Iterable[str | tuple[str, NumberFormatter]] = FORMS,
+    *,
+    header: bool = True,
+    number_column: str = "number",
+) -> None:
+    """Write a CSV table of the forms of many numbers, one row per number.
+
+    Each row holds the number, followed by its forms, in the order of `forms`.
+    A number without some form (e.g. 0 has no cardinal form, and 1 has no count
+    prefix) has an empty cell there. All the forms of a number share a single split
+    of the number into groups of thousands, and the rows are written in batches
+    as they are converted, so the memory used does not depend on the number of rows.
+
+    Args:
+        numbers: Integers to convert. An iterator is consumed lazily.
+        file: Where to write the table, such as a file opened with `newline=""`.
+        forms: Names of the forms to write, from `FORMS`. Defaults to all of them:
+            "indefinite", then "cardinal_{gender}_{state}" for the feminine and
+            masculine genders and the absolute and construct states,
+            "ordinal_{gender}", and "count_prefix_{gender}" and
+            "count_prefix_{gender}_definite".
+            A form can also be a pair of a column name and a formatter, created by
+            one of the `compile_*` functions, such as one counting a noun.
+        header: Whether to start with a row of column names, `number_column` and
+            the names of the forms.
+        number_column: The name of the column of the numbers.
+
+    Raises:
+        ValueError: If a form is invalid, or if a column name or the words of a
+            formatter contain a comma, a quote or a line break.
+            Nothing is written in that case.
+
+    Examples:
+        >>> import io
+        >>> out = io.StringIO()
+        >>> write_forms_csv([1, 3], out, ["ordinal_masculine", "count_prefix_feminine"])
+        >>> out.getvalue().splitlines()
+        ['number,ordinal_masculine,count_prefix_feminine', '1,ראשון,', '3,שלישי,שָלוש']
+    """
+    names = [number_column]
+    specs: list[str | NumberFormatter] = []
+    for form in forms:
+        if isinstance(form, str):
+            names.append(form)
+            specs.append(form)
+            continue
+        name, formatter = form
+        _check_cells([*formatter._small, formatter._suffix])  # noqa: SLF001
+        names.append(name)
+        specs.append(formatter)
+    _check_cells(names)
+    convert = _FormSet(specs).convert
+    # the words never contain a comma, a quote or a line break, so no cell needs
+    # quoting, and joining the cells is much faster than a `csv.writer`
+    if header:
+        file.write(_row(names))
+    numbers = iter(numbers)
+    while batch := list(itertools.islice(numbers, _BATCH_SIZE)):
+        file.write("".join([_row([str(n), *convert(n)]) for n in batch]))
+
+
+def _check_cells(cells: list[str]) -> None:
+    for cell in cells:
+        if not _SPECIAL_CHARACTERS.isdisjoint(cell):
+            raise ValueError(f"Cannot write {cell!r} without quoting it")
+
+
+def _row(cells: list[str]) -> str:
+    return ",".join(cells) + _LINE_TERMINATOR
@@ -0,0 +1,526 @@
+"""Precompiled Hebrew number formatters.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from typing import TYPE_CHECKING, Literal, NamedTuple, overload
+
+if sys.version_info >= (3, 12):
+    import typing
+else:
+    import typing_extensions as typing
+
+from .hebrew_numbers import (
+    _MAX_NUMBER,
+    _MINUS_BYTES,
+    _ORDINALS,
+    _SUPPORTED_RANGES,
+    ConstructState,
+    GrammaticalGender,
+    _above_1000_bytes,
+    _cardinal_above_1000,
+    _cardinal_number,
+    _check_indefinite_range,
+    _check_noun_range,
+    _check_prefix_range,
+    _check_range,
+    _converted_batch,
+    _copy_bytes,
+    _count_prefix,
+    _extended,
+    _fragment_writer,
+    _group_words,
+    _join_words,
+    _joined_triad_table,
+    _table_cache,
+    _trailing_triad_table,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from _typeshed import SupportsWrite
+
+    from .hebrew_numbers import _Errors, _StrErrors
+
+__all__ = [
+    "NumberFormatter",
+    "NumberForms",
+    "all_forms",
+    "compile_cardinal",
+    "compile_count_noun",
+    "compile_count_prefix",
+    "compile_indefinite",
+    "compile_ordinal",
+]
+
+
+class NumberFormatter:
+    """A converter with fixed arguments, created by the `compile_*` functions.
+
+    The arguments are parsed once, when compiling, and every number below 1000 is
+    rendered ahead of time.
+    """
+
+    __slots__ = (
+        "_check",
+        "_description",
+        "_encoded",
+        "_small",
+        "_suffix",
+        "_trailing",
+    )
+
+    def __init__(
+        self,
+        description: str,
+        check: Callable[[int], None],
+        small: tuple[str, ...],
+        trailing: tuple[str, ...],
+        suffix: str = "",
+    ):
+        """Create a formatter. Use the `compile_*` functions instead.
+
+        Args:
+            description: The compiling call, used in the repr.
+            check: Raise `InvalidNumberError` for an unsupported number.
+            small: The result for every number from 0 to 999.
+            trailing: The trailing triads of larger numbers.
+            suffix: Text to append to the results of larger numbers.
+        """
+        self._description = description
+        self._check = check
+        self._small = small
+        self._trailing = trailing
+        self._suffix = suffix
+        # the tables encoded as UTF-8, on the first use of the bytes methods
+        self._encoded: tuple[tuple[bytes, ...], tuple[bytes, ...], bytes] | None = None
+
+    @typing.override
+    def __repr__(self) -> str:
+        return f"<NumberFormatter {self._description}>"
+
+    def __call__(self, n: int) -> str:
+        """Convert a single number."""
+        self._check(n)
+        return self._format(n)
+
+    def _format(self, n: int) -> str:
+        if 0 <= n < 1000:  # noqa: PLR2004
+            return self._small[n]
+        if n < 0:
+            return f"מינוס {self._format(-n)}"
+        return _cardinal_above_1000(n, self._trailing) + self._suffix
+
+    @overload
+    def many(
+        self,
+        numbers: Iterable[int],
+        *,
+        errors: _StrErrors = "raise",
+        dedup: bool = False,
+        out: list[str] | None = None,
+    ) -> list[str]: ...
+    @overload
+    def many(
+        self,
+        numbers: Iterable[int],
+        *,
+        errors: Literal["none"],
+        dedup: bool = False,
+        out: list[str | None] | None = None,
+    ) -> list[str | None]: ...
+    def many(
+        self,
+        numbers: Iterable[int],
+        *,
+        errors: _Errors = "raise",
+        dedup: bool = False,
+        out: list[str] | list[str | None] | None = None,
+    ) -> list[str] | list[str | None]:
+        """Convert many numbers, validating all of them before converting any.
+
+        Args:
+            numbers: Integers to convert.
+            errors: How to handle unsupported numbers, like in `cardinal_numbers`.
+            dedup: Whether to convert each distinct number once, like in
+                `cardinal_numbers`.
+            out: List to append the results to. A new list is used by default.
+
+        Returns:
+            The list of results.
+        """
+        return _extended(
+            out,
+            _converted_batch(numbers, self._check, self._format, errors, dedup=dedup),
+        )
+
+    def write(self, n: int, out: SupportsWrite[str] | list[str]) -> None:
+        """Convert a number, and write the result to `out`, like `write_cardinal`."""
+        _fragment_writer(out)(self(n))
+
+    def _encoded_tables(self) -> tuple[tuple[bytes, ...], tuple[bytes, ...], bytes]:
+        encoded = self._encoded
+        if encoded is None:
+            # threads racing here each encode the same tables, so either one will do
+            encoded = (
+                tuple(s.encode() for s in self._small),
+                tuple(s.encode() for s in self._trailing),
+                self._suffix.encode(),
+            )
+            self._encoded = encoded
+        return encoded
+
+    def _format_bytes(self, n: int) -> bytes:
+        small, trailing, suffix = self._encoded_tables()
+        if 0 <= n < 1000:  # noqa: PLR2004
+            return small[n]
+        if n < 0:
+            return _MINUS_BYTES + self._format_bytes(-n)
+        fragments = _above_1000_bytes(n, trailing)
+        fragments.append(suffix)
+        return b"".join(fragments)
+
+    def format_bytes(self, n: int) -> bytes:
+        """Convert a single number, encoded as UTF-8, like `cardinal_number_bytes`.
+
+        The tables of the formatter are encoded on the first call.
+
+        Examples:
+            >>> compile_ordinal("f").format_bytes(2) == "שנייה".encode()
+            True
+        """
+        self._check(n)
+        return self._format_bytes(n)
+
+    def write_bytes(
+        self, n: int, buf: bytearray | memoryview, offset: int | None = None
+    ) -> int:
+        """Convert a number into a buffer, like `write_cardinal_bytes`.
+
+        Returns:
+            The number of bytes written.
+        """
+        self._check(n)
+        return _copy_bytes(self._format_bytes(n), buf, offset)
+
+
+def compile_cardinal(
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+) -> NumberFormatter:
+    """Compile a formatter of cardinal numbers, like `cardinal_number`.
+
+    Raises:
+        ValueError: If construct is `ConstructState.CONSTRUCT79`, which is only used
+            for parts of numbers.
+
+    Examples:
+        >>> fmt = compile_cardinal("f", construct=False)
+        >>> fmt(3), fmt(1003)
+        ('שָלוש', 'אלף ושָלוש')
+        >>> fmt.many([1, 2])
+        ['אחת', 'שתיים']
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    if construct_state == ConstructState.CONSTRUCT79:
+        raise ValueError("Cannot compile a formatter for CONSTRUCT79")
+    return NumberFormatter(
+        f"compile_cardinal({grammatical_gender}, {construct_state})",
+        _check_range,
+        _joined_triad_table(grammatical_gender, construct_state),
+        _trailing_triad_table(grammatical_gender),
+    )
+
+
+def compile_indefinite() -> NumberFormatter:
+    """Compile a formatter of indefinite numbers, like `indefinite_number`.
+
+    Examples:
+        >>> fmt = compile_indefinite()
+        >>> fmt(0), fmt(-1)
+        ('אפס', 'מינוס אחת')
+    """
+    small = _joined_triad_table(GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)
+    return NumberFormatter(
+        "compile_indefinite()",
+        _check_indefinite_range,
+        ("אפס", *small[1:]),
+        _trailing_triad_table(GrammaticalGender.FEMININE),
+    )
+
+
+def compile_ordinal(gender: GrammaticalGender | str) -> NumberFormatter:
+    """Compile a formatter of ordinal numbers, like `ordinal_number`.
+
+    Examples:
+        >>> fmt = compile_ordinal("m")
+        >>> fmt(1), fmt(12)
+        ('ראשון', 'שנים־עשר')
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    small = _joined_triad_table(grammatical_gender, ConstructState.ABSOLUTE)
+    return NumberFormatter(
+        f"compile_ordinal({grammatical_gender})",
+        _check_range,
+        ("", *_ORDINALS[grammatical_gender], *small[11:]),
+        _trailing_triad_table(grammatical_gender),
+    )
+
+
+@_table_cache
+def _count_prefix_table(
+    grammatical_gender: GrammaticalGender, *, definite: bool
+) -> tuple[str, ...]:
+    """Render the count prefix of every number from 2 to 999."""
+    return (
+        "",
+        "",
+        *(
+            _count_prefix(n, grammatical_gender, definite=definite)
+            for n in range(2, 1000)
+        ),
+    )
+
+
+def compile_count_prefix(
+    gender: GrammaticalGender | str, *, definite: bool = False
+) -> NumberFormatter:
+    """Compile a formatter of count prefixes, like `count_prefix`.
+
+    Examples:
+        >>> fmt = compile_count_prefix("m", definite=True)
+        >>> fmt(3), fmt(3000)
+        ('שלושת', 'שלושת אלפים')
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    return NumberFormatter(
+        f"compile_count_prefix({grammatical_gender}, definite={definite})",
+        _check_prefix_range,
+        _count_prefix_table(grammatical_gender, definite=definite),
+        _trailing_triad_table(grammatical_gender),
+    )
+
+
+def compile_count_noun(
+    singular_form: str,
+    plural_form: str,
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+) -> NumberFormatter:
+    """Compile a formatter counting a noun, like `count_noun`.
+
+    Examples:
+        >>> fmt = compile_count_noun("ספר", "ספרים", "m")
+        >>> fmt(1), fmt(5), fmt(1005)
+        ('ספר אֶחָד', 'חמישה ספרים', 'אלף וחמישה ספרים')
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    one = _cardinal_number(1, grammatical_gender, ConstructState.ABSOLUTE)
+    prefixes = _count_prefix_table(grammatical_gender, definite=definite)
+    return NumberFormatter(
+        f"compile_count_noun({singular_form!r}, {plural_form!r}, "
+        f"{grammatical_gender}, definite={definite})",
+        _check_noun_range,
+        (
+            "",
+            f"{singular_form} {'ה' if definite else ''}{one}",
+            *(f"{prefix} {plural_form}" for prefix in prefixes[2:]),
+        ),
+        _trailing_triad_table(grammatical_gender),
+        f" {plural_form}",
+    )
+
+
+# the forms of a single formatter, as named by `convert_parallel` and the CLI
+_Form = Literal["cardinal", "indefinite", "ordinal", "count_prefix"]
+
+
+def _compile_form(
+    form: _Form,
+    gender: GrammaticalGender | str | None,
+    construct: ConstructState | bool,  # noqa: FBT001
+    definite: bool,  # noqa: FBT001
+) -> NumberFormatter:
+    if form == "indefinite":
+        return compile_indefinite()
+    if form not in {"cardinal", "ordinal", "count_prefix"}:
+        raise ValueError(f"Invalid form: {form}")
+    if gender is None:
+        raise ValueError(f"The {form} form requires a gender")
+    if form == "cardinal":
+        return compile_cardinal(gender, construct)
+    if form == "ordinal":
+        return compile_ordinal(gender)
+    return compile_count_prefix(gender, definite=definite)
+
+
+_F = GrammaticalGender.FEMININE
+_M = GrammaticalGender.MASCULINE
+_ABSOLUTE = ConstructState.ABSOLUTE
+_CONSTRUCT = ConstructState.CONSTRUCT
+# the forms of `_FormSet`: how to compile each one, and its smallest number
+_FORMS: dict[str, tuple[Callable[[], NumberFormatter], int]] = {
+    "indefinite": (compile_indefinite, 1 - _MAX_NUMBER),
+    "cardinal_feminine_absolute": (
+        functools.partial(compile_cardinal, _F, _ABSOLUTE),
+        1,
+    ),
+    "cardinal_feminine_construct": (
+        functools.partial(compile_cardinal, _F, _CONSTRUCT),
+        1,
+    ),
+    "cardinal_masculine_absolute": (
+        functools.partial(compile_cardinal, _M, _ABSOLUTE),
+        1,
+    ),
+    "cardinal_masculine_construct": (
+        functools.partial(compile_cardinal, _M, _CONSTRUCT),
+        1,
+    ),
+    "ordinal_feminine": (functools.partial(compile_ordinal, _F), 1),
+    "ordinal_masculine": (functools.partial(compile_ordinal, _M), 1),
+    "count_prefix_feminine": (functools.partial(compile_count_prefix, _F), 2),
+    "count_prefix_feminine_definite": (
+        functools.partial(compile_count_prefix, _F, definite=True),
+        2,
+    ),
+    "count_prefix_masculine": (functools.partial(compile_count_prefix, _M), 2),
+    "count_prefix_masculine_definite": (
+        functools.partial(compile_count_prefix, _M, definite=True),
+        2,
+    ),
+}
+
+
+class _FormSet:
+    """Convert numbers into several forms at once, splitting each number once.
+
+    Every form of a number of at least 1000 is the same groups of thousands and
+    above, followed by a trailing triad of its gender, so the groups are rendered
+    once and shared by all the forms.
+    """
+
+    __slots__ = ("_formatters", "_lowest", "_small", "_suffixes", "_trailing")
+
+    def __init__(self, forms: Iterable[str | NumberFormatter]):
+        """Compile the formatters of the forms, named as the keys of `_FORMS`.
+
+        A form can also be given as a formatter, created by a `compile_*` function.
+
+        Raises:
+            ValueError: If a form is invalid.
+        """
+        formatters = []
+        lowest = []
+        for form in forms:
+            if isinstance(form, NumberFormatter):
+                formatters.append(form)
+                lowest.append(_SUPPORTED_RANGES[form._check][0])  # noqa: SLF001
+                continue
+            if form not in _FORMS:
+                raise ValueError(f"Invalid form: {form}")
+            compile_form, lowest_number = _FORMS[form]
+            formatters.append(compile_form())
+            lowest.append(lowest_number)
+        self._formatters = tuple(formatters)
+        self._lowest = tuple(lowest)
+        self._small = tuple(fmt._small for fmt in formatters)  # noqa: SLF001
+        self._trailing = tuple(fmt._trailing for fmt in formatters)  # noqa: SLF001
+        self._suffixes = tuple(fmt._suffix for fmt in formatters)  # noqa: SLF001
+
+    def convert(self, n: int) -> list[str]:
+        """Convert a number into every form, or into '' where it has no such form."""
+        if 0 <= n < 1000:  # noqa: PLR2004
+            return [
+                small[n] if n >= lowest else ""
+                for small, lowest in zip(self._small, self._lowest, strict=True)
+            ]
+        if n < 0 or n >= _MAX_NUMBER:
+            formats = (fmt._format for fmt in self._formatters)  # noqa: SLF001
+            return [
+                format_(n) if lowest <= n < _MAX_NUMBER else ""
+                for format_, lowest in zip(formats, self._lowest, strict=True)
+            ]
+        rest, last_digits = divmod(n, 1000)
+        words = _group_words(rest)
+        if last_digits:
+            groups = " ".join(words)
+            return [
+                f"{groups}{trailing[last_digits]}{suffix}"
+                for trailing, suffix in zip(self._trailing, self._suffixes, strict=True)
+            ]
+        groups = _join_words(words)
+        return [groups + suffix for suffix in self._suffixes]
+
+
+class NumberForms(NamedTuple):
+    """All the forms of a number, returned by `all_forms`.
+
+    A form that the number does not have (e.g. 0 has no cardinal form, and 1 has no
+    count prefix) is None.
+
+    Attributes:
+        indefinite: Like `indefinite_number`.
+        cardinal_feminine_absolute: Like `cardinal_number` in the feminine gender and
+            the absolute state.
+        cardinal_feminine_construct: Feminine, construct state.
+        cardinal_masculine_absolute: Masculine, absolute state.
+        cardinal_masculine_construct: Masculine, construct state.
+        ordinal_feminine: Like `ordinal_number` in the feminine gender.
+        ordinal_masculine: Masculine.
+        count_prefix_feminine: Like `count_prefix` in the feminine gender.
+        count_prefix_feminine_definite: Feminine, definite.
+        count_prefix_masculine: Masculine.
+        count_prefix_masculine_definite: Masculine, definite.
+    """
+
+    indefinite: str
+    cardinal_feminine_absolute: str | None
+    cardinal_feminine_construct: str | None
+    cardinal_masculine_absolute: str | None
+    cardinal_masculine_construct: str | None
+    ordinal_feminine: str | None
+    ordinal_masculine: str | None
+    count_prefix_feminine: str | None
+    count_prefix_feminine_definite: str | None
+    count_prefix_masculine: str | None
+    count_prefix_masculine_definite: str | None
+
+
+@_table_cache
+def _all_forms_set() -> _FormSet:
+    return _FormSet(NumberForms._fields)
+
+
+def all_forms(n: int) -> NumberForms:
+    """Convert a number into all of its forms at once.
+
+    The number is split into groups of thousands once, and the groups are shared by
+    all the forms, so this is much faster than calling every converter.
+    Supports integers up to 10^66, like `indefinite_number`.
+
+    Raises:
+        InvalidNumberError: If the number has no indefinite form, which is the widest.
+
+    Examples:
+        >>> forms = all_forms(3)
+        >>> forms.cardinal_masculine_absolute, forms.count_prefix_masculine_definite
+        ('שלושה', 'שלושת')
+        >>> all_forms(2000).ordinal_feminine
+        'אלפיים'
+        >>> all_forms(0)
+        NumberForms(indefinite='אפס', cardinal_feminine_absolute=None, \
+cardinal_feminine_construct=None, cardinal_masculine_absolute=None, \
+cardinal_masculine_construct=None, ordinal_feminine=None, ordinal_masculine=None, \
+count_prefix_feminine=None, count_prefix_feminine_definite=None, \
+count_prefix_masculine=None, count_prefix_masculine_definite=None)
+    """
+    _check_indefinite_range(n)
+    return NumberForms._make([form or None for form in _all_forms_set().convert(n)])
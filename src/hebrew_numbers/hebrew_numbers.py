@@ -6,13 +6,26 @@
 from __future__ import annotations
 
 import enum
+import functools
+import itertools
 import sys
+from typing import TYPE_CHECKING, Literal, overload
 
 if sys.version_info >= (3, 12):
     import typing
 else:
     import typing_extensions as typing
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from _typeshed import SupportsWrite
+
+    # how a batch converter handles unsupported numbers: raise, replace them with
+    # None or with '', or replace each of them with the result of a callable
+    _Errors = Literal["raise", "none", "empty"] | Callable[[int], str]
+    _StrErrors = Literal["raise", "empty"] | Callable[[int], str]
+
 
 class InvalidNumberError(Exception):
     """Exception raised when a number cannot be represented."""
@@ -35,18 +48,34 @@ class GrammaticalGender(enum.Enum):
         """Convert from string to enum."""
         if isinstance(s, GrammaticalGender):
             return s
+        try:
+            return _GENDER_ALIASES[s]
+        except KeyError:
+            pass
         s = s.lower()
-        if "masculine".startswith(s) or "male".startswith(s) or "זכר".startswith(s):
-            return cls.MASCULINE
-        if "feminine".startswith(s) or "female".startswith(s) or "נקבה".startswith(s):
-            return cls.FEMININE
-        raise ValueError(f"Invalid gender: {s}")
+        try:
+            return _GENDER_ALIASES[s]
+        except KeyError:
+            raise ValueError(f"Invalid gender: {s}") from None
 
     @typing.override
     def __str__(self) -> str:
         return self.value
 
 
+# every prefix of these words is accepted, in any case.
+# masculine is added last, as the empty string is accepted as masculine.
+_GENDER_ALIASES = {
+    word[:i]: gender
+    for gender, words in [
+        (GrammaticalGender.FEMININE, ["feminine", "female", "נקבה"]),
+        (GrammaticalGender.MASCULINE, ["masculine", "male", "זכר"]),
+    ]
+    for word in words
+    for i in range(len(word) + 1)
+}
+
+
 class ConstructState(enum.Enum):
     """Represents the construct state (צורת נסמך) in grammar.
 
@@ -73,8 +102,33 @@ class ConstructState(enum.Enum):
         return self.value
 
 
+_P = typing.ParamSpec("_P")
+_T = typing.TypeVar("_T")
+
+
+def _table_cache(build: Callable[_P, _T]) -> Callable[_P, _T]:
+    """Cache the immutable tables returned by `build`, by its arguments.
+
+    Unlike `functools.cache`, which serializes its callers in free-threaded builds,
+    a table is read from a plain dict, without locking. Each table is published
+    only when it is complete. Threads racing to build the same table may each
+    build it, but all of them get the first one published.
+    """
+    tables: dict[object, _T] = {}
+
+    @functools.wraps(build)
+    def cached(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        key = (args, tuple(kwargs.items())) if kwargs else args
+        try:
+            return tables[key]
+        except KeyError:
+            return tables.setdefault(key, build(*args, **kwargs))
+
+    return cached
+
+
 def _join_words(
-    words: list[str], sep: str = " ", last_sep: str = " ו"  # noqa: RUF001
+    words: Sequence[str], sep: str = " ", last_sep: str = " ו"  # noqa: RUF001
 ) -> str:
     """Combine all words in the list into a single string.
 
@@ -96,6 +150,110 @@ def _join_words(
     return f"{sep.join(words[:-1])}{last_sep}{words[-1]}"
 
 
+_DIGITS: dict[tuple[GrammaticalGender, ConstructState], tuple[str, ...]] = {
+    (GrammaticalGender.FEMININE, ConstructState.ABSOLUTE): (
+        "אחת",
+        "שתיים",
+        "שָלוש",
+        "ארבע",
+        "חמש",
+        "שש",
+        "שבע",
+        "שמונֶה",
+        "תשע",
+    ),
+    (GrammaticalGender.FEMININE, ConstructState.CONSTRUCT): (
+        "אחת",
+        "שתי",
+        "שְלוש",
+        "ארבע",
+        "חמש",
+        "שש",
+        "שבע",
+        "שמונֶה",
+        "תשע",
+    ),
+    (GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE): (
+        "אֶחָד",
+        "שניים",
+        "שלושה",
+        "ארבעה",
+        "חמישה",
+        "שישה",
+        "שבעה",
+        "שמונָה",
+        "תשעה",
+    ),
+    (GrammaticalGender.MASCULINE, ConstructState.CONSTRUCT): (
+        "אַחַד",
+        "שני",
+        "שלושת",
+        "ארבעת",
+        "חמשת",
+        "ששת",
+        "שבעת",
+        "שמונת",
+        "תשעת",
+    ),
+}
+_DIGITS_CONSTRUCT79 = {7: "שְבע", 9: "תְשע"}
+_TEN = {
+    (GrammaticalGender.FEMININE, ConstructState.ABSOLUTE): "עשר",
+    (GrammaticalGender.FEMININE, ConstructState.CONSTRUCT): "עשר",
+    (GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE): "עשרה",
+    (GrammaticalGender.MASCULINE, ConstructState.CONSTRUCT): "עשרת",
+}
+_TWELVE = {
+    GrammaticalGender.FEMININE: "שתים",
+    GrammaticalGender.MASCULINE: "שנים",
+}
+_TEENS_UNITS_STATE = {
+    GrammaticalGender.FEMININE: ConstructState.CONSTRUCT79,
+    GrammaticalGender.MASCULINE: ConstructState.ABSOLUTE,
+}
+_TEENS_SUFFIX = {
+    GrammaticalGender.FEMININE: "־עשרה",
+    GrammaticalGender.MASCULINE: "־עשר",
+}
+_TENS = (
+    "",
+    "",
+    "עשרים",
+    "שלושים",
+    "ארבעים",
+    "חמישים",
+    "שישים",
+    "שבעים",
+    "שמונים",
+    "תשעים",
+)
+# the word for 1000**k is _SCALE_WORDS[k]
+_SCALE_WORDS = (
+    "",
+    "אלף",
+    "מיליון",
+    "מיליארד",
+    "טריליון",
+    "קוודריליון",
+    "קווינטיליון",
+    "סקסטיליון",
+    "ספטיליון",
+    "אוקטיליון",
+    "נוניליון",
+    "דציליון",
+    "אונדציליון",
+    "דואודציליון",
+    "טרדציליון",
+    "קווטואורדציליון",
+    "קווינדציליון",
+    "סקסדציליון",
+    "ספטנדציליון",
+    "אוקטודציליון",
+    "נובמדציליון",
+    "ויגינטיליון",
+)
+
+
 def _translate_one_digit(
     n: int, grammatical_gender: GrammaticalGender, construct_state: ConstructState
 ) -> str:
@@ -120,57 +278,10 @@ def _translate_one_digit(
         and grammatical_gender == GrammaticalGender.FEMININE
     ):
         try:
-            return {7: "שְבע", 9: "תְשע"}[n]
+            return _DIGITS_CONSTRUCT79[n]
         except KeyError:
             construct_state = ConstructState.CONSTRUCT
-
-    numbers = {
-        (GrammaticalGender.FEMININE, ConstructState.ABSOLUTE): {
-            1: "אחת",
-            2: "שתיים",
-            3: "שָלוש",
-            4: "ארבע",
-            5: "חמש",
-            6: "שש",
-            7: "שבע",
-            8: "שמונֶה",
-            9: "תשע",
-        },
-        (GrammaticalGender.FEMININE, ConstructState.CONSTRUCT): {
-            1: "אחת",
-            2: "שתי",
-            3: "שְלוש",
-            4: "ארבע",
-            5: "חמש",
-            6: "שש",
-            7: "שבע",
-            8: "שמונֶה",
-            9: "תשע",
-        },
-        (GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE): {
-            1: "אֶחָד",
-            2: "שניים",
-            3: "שלושה",
-            4: "ארבעה",
-            5: "חמישה",
-            6: "שישה",
-            7: "שבעה",
-            8: "שמונָה",
-            9: "תשעה",
-        },
-        (GrammaticalGender.MASCULINE, ConstructState.CONSTRUCT): {
-            1: "אַחַד",
-            2: "שני",
-            3: "שלושת",
-            4: "ארבעת",
-            5: "חמשת",
-            6: "ששת",
-            7: "שבעת",
-            8: "שמונת",
-            9: "תשעת",
-        },
-    }
-    return numbers[(grammatical_gender, construct_state)][n]
+    return _DIGITS[grammatical_gender, construct_state][n - 1]
 
 
 def _translate_to_20(
@@ -194,12 +305,7 @@ def _translate_to_20(
     if n < 10:  # noqa: PLR2004
         return _translate_one_digit(n, grammatical_gender, construct_state)
     if n == 10:  # noqa: PLR2004
-        return {
-            (GrammaticalGender.FEMININE, ConstructState.ABSOLUTE): "עשר",
-            (GrammaticalGender.FEMININE, ConstructState.CONSTRUCT): "עשר",
-            (GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE): "עשרה",
-            (GrammaticalGender.MASCULINE, ConstructState.CONSTRUCT): "עשרת",
-        }[grammatical_gender, construct_state]
+        return _TEN[grammatical_gender, construct_state]
     if n == 11:  # noqa: PLR2004
         # GRAMMAR RULE: 11 uses the construct form in feminine and masculine
         n_str = _translate_one_digit(
@@ -207,25 +313,14 @@ def _translate_to_20(
         )
     elif n == 12:  # noqa: PLR2004
         # GRAMMAR RULE: 12 uses a unique form
-        n_str = {
-            GrammaticalGender.FEMININE: "שתים",
-            GrammaticalGender.MASCULINE: "שנים",
-        }[grammatical_gender]
+        n_str = _TWELVE[grammatical_gender]
     else:
         # GRAMMAR RULE: other than that, use construct form for feminine and
         # absolute form for masculine
         n_str = _translate_one_digit(
-            n % 10,
-            grammatical_gender,
-            {
-                GrammaticalGender.FEMININE: ConstructState.CONSTRUCT79,
-                GrammaticalGender.MASCULINE: ConstructState.ABSOLUTE,
-            }[grammatical_gender],
+            n % 10, grammatical_gender, _TEENS_UNITS_STATE[grammatical_gender]
         )
-    suffix = {GrammaticalGender.FEMININE: "־עשרה", GrammaticalGender.MASCULINE: "־עשר"}[
-        grammatical_gender
-    ]
-    return f"{n_str}{suffix}"
+    return f"{n_str}{_TEENS_SUFFIX[grammatical_gender]}"
 
 
 def _decompose_hundreds(
@@ -266,16 +361,7 @@ def _decompose_hundreds(
 
     tenth_digit = n % 100 // 10
     if tenth_digit > 1:
-        tenth_word = {
-            2: "עשרים",
-            3: "שלושים",
-            4: "ארבעים",
-            5: "חמישים",
-            6: "שישים",
-            7: "שבעים",
-            8: "שמונים",
-            9: "תשעים",
-        }[tenth_digit]
+        tenth_word = _TENS[tenth_digit]
         last_digits = n % 100 - tenth_digit * 10
     else:
         tenth_word = ""
@@ -295,7 +381,228 @@ def _decompose_hundreds(
     return [hundreds_word, tenth_word, last_digits_word]
 
 
-def cardinal_number(  # noqa: C901
+@_table_cache
+def _triad_table(
+    grammatical_gender: GrammaticalGender, construct_state: ConstructState
+) -> tuple[tuple[str, ...], ...]:
+    """Render the words of every number from 0 to 999, for a gender and state.
+
+    The table is built once, on first use, and is indexed by the number itself.
+    Entry 0 is empty, and empty words are dropped from every entry.
+
+    Examples:
+        >>> table = _triad_table(GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE)
+        >>> table[234]
+        ('מאתיים', 'שלושים', 'ארבעה')
+        >>> table[0]
+        ()
+    """
+    table: list[tuple[str, ...]] = [()]
+    for n in range(1, 1000):
+        words = [
+            w for w in _decompose_hundreds(n, grammatical_gender, construct_state) if w
+        ]
+        table.append(tuple(words))
+    return tuple(table)
+
+
+@_table_cache
+def _joined_triad_table(
+    grammatical_gender: GrammaticalGender, construct_state: ConstructState
+) -> tuple[str, ...]:
+    """Render every number from 0 to 999 as a single string, for a gender and state.
+
+    Examples:
+        >>> table = _joined_triad_table(
+        ...     GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE
+        ... )
+        >>> table[234]
+        'מאתיים שלושים וארבעה'
+    """
+    triads = _triad_table(grammatical_gender, construct_state)
+    return ("", *(_join_words(words) for words in triads[1:]))
+
+
+@_table_cache
+def _group_table(scale: int) -> tuple[str, ...]:
+    """Render every group `t * 1000**scale` (t from 0 to 999) as a single string.
+
+    Groups of thousands and above are always masculine, so they do not depend on
+    the gender or construct state of the number they are part of.
+
+    Examples:
+        >>> _group_table(1)[5]
+        'חמשת אלפים'
+        >>> _group_table(2)[2]
+        'שני מיליון'
+        >>> _group_table(2)[0]
+        ''
+    """
+    table = ["", _SCALE_WORDS[scale]]
+    for t in range(2, 1000):
+        if scale == 1 and t == 2:  # noqa: PLR2004
+            table.append("אלפיים")
+            continue
+        if scale == 1:
+            # GRAMMAR RULE: construct_state is used for 1000 only up to 10
+            is_construct = t <= 10  # noqa: PLR2004
+            suffix = "אלפים" if is_construct else "אלף"
+        else:
+            # GRAMMAR RULE: construct_state is not used for 10^6 and above, except for 2
+            is_construct = t == 2  # noqa: PLR2004
+            suffix = _SCALE_WORDS[scale]
+        t_str = _join_words(
+            _decompose_hundreds(
+                t,
+                GrammaticalGender.MASCULINE,
+                ConstructState.from_boolean(is_construct),
+            )
+        )
+        table.append(f"{t_str} {suffix}")
+    return tuple(table)
+
+
+@_table_cache
+def _trailing_triad_table(grammatical_gender: GrammaticalGender) -> tuple[str, ...]:
+    """Render every last triad (0 to 999) that follows a group of thousands or above.
+
+    Each entry includes its leading separator, so that appending it to the joined
+    groups completes the number.
+
+    Examples:
+        >>> table = _trailing_triad_table(GrammaticalGender.FEMININE)
+        >>> _group_table(1)[1] + table[234]
+        'אלף מאתיים שלושים וארבע'
+        >>> _group_table(1)[1] + table[200]
+        'אלף ומאתיים'
+    """
+    table = [""]
+    # GRAMMAR RULE: construct_state is applied only up to 20
+    for words in _triad_table(grammatical_gender, ConstructState.ABSOLUTE)[1:]:
+        if len(words) == 1:
+            table.append(f" ו{words[0]}")  # noqa: RUF001
+        else:
+            table.append(f" {_join_words(words)}")
+    return tuple(table)
+
+
+# below this, a plain chain of divisions is faster than splitting recursively
+_SPLIT_THRESHOLD = 1000**16
+
+
+@_table_cache
+def _triad_power(k: int) -> int:
+    """Return 1000**(2**k), the divisor of the k-th level of `_split_triads`."""
+    power: int = 1000 ** (2**k)
+    return power
+
+
+def _split_triads(n: int) -> list[int]:
+    """Split a non-negative integer into triads (base-1000 digits), lowest first.
+
+    Large integers are split recursively around 1000**(2**k), so each division
+    works on numbers of similar size, instead of repeatedly dividing the whole
+    number by 1000.
+
+    Examples:
+        >>> _split_triads(1_002_003)
+        [3, 2, 1]
+        >>> _split_triads(0)
+        []
+    """
+    if n < _SPLIT_THRESHOLD:
+        triads = []
+        while n:
+            n, t = divmod(n, 1000)
+            triads.append(t)
+        return triads
+    k = 0
+    while _triad_power(k + 1) <= n:
+        k += 1
+    high, low = divmod(n, _triad_power(k))
+    triads = _split_triads(low)
+    triads.extend([0] * (2**k - len(triads)))
+    triads.extend(_split_triads(high))
+    return triads
+
+
+def split_triads(n: int) -> list[int]:
+    """Split a non-negative integer into triads (base-1000 digits), lowest first.
+
+    These are the groups that `cardinal_number` and `indefinite_number` render.
+    Integers of any size are accepted, and an integer with thousands of digits is
+    split in near-linear time, by dividing recursively around 1000**(2**k).
+
+    Raises:
+        InvalidNumberError: If `n` is negative.
+
+    Examples:
+        >>> split_triads(12_345_678)
+        [678, 345, 12]
+        >>> split_triads(10**9)
+        [0, 0, 0, 1]
+    """
+    if n < 0:
+        raise InvalidNumberError("Number must not be negative")
+    return _split_triads(n)
+
+
+def _group_words(n: int) -> list[str]:
+    """Render the groups of `n * 1000`, from the highest to the lowest.
+
+    Examples:
+        >>> _group_words(2_000_005)
+        ['שני מיליארד', 'חמשת אלפים']
+    """
+    words = [
+        _group_table(scale)[t] for scale, t in enumerate(_split_triads(n), start=1) if t
+    ]
+    words.reverse()
+    return words
+
+
+_MAX_EXPONENT = 3 * len(_SCALE_WORDS)
+_MAX_NUMBER = 10**_MAX_EXPONENT
+
+
+def _check_range(n: int) -> None:
+    """Raise `InvalidNumberError` if `n` is not a supported positive integer."""
+    if n >= _MAX_NUMBER:
+        raise InvalidNumberError(f"Number must be below 10^{_MAX_EXPONENT}")
+    if n <= 0:
+        raise InvalidNumberError("Number must be positive")
+
+
+def _check_prefix_range(n: int) -> None:
+    """Raise `InvalidNumberError` if `n` has no count-prefix form."""
+    if n == 1:
+        raise InvalidNumberError("The count-form of number '1' is not a prefix")
+    _check_range(n)
+
+
+def _check_noun_range(n: int) -> None:
+    """Raise `InvalidNumberError` if a noun cannot be counted `n` times."""
+    if n != 1:
+        _check_prefix_range(n)
+
+
+def _check_indefinite_range(n: int) -> None:
+    """Raise `InvalidNumberError` if `n` has no indefinite form."""
+    if n != 0:
+        _check_range(abs(n))
+
+
+# the lowest and highest numbers that pass each check, to test many numbers
+# without raising an exception for each unsupported one
+_SUPPORTED_RANGES: dict[Callable[[int], None], tuple[int, int]] = {
+    _check_range: (1, _MAX_NUMBER - 1),
+    _check_prefix_range: (2, _MAX_NUMBER - 1),
+    _check_noun_range: (1, _MAX_NUMBER - 1),
+    _check_indefinite_range: (1 - _MAX_NUMBER, _MAX_NUMBER - 1),
+}
+
+
+def cardinal_number(
     n: int,
     gender: GrammaticalGender | str,
     construct: ConstructState | bool,  # noqa: FBT001
@@ -305,7 +612,7 @@ def cardinal_number(  # noqa: C901
     This function respects grammatical gender (masculine, feminine) and construct state
     (absolute, construct).
 
-    Supports positive integers up to 10^21.
+    Supports positive integers up to 10^66.
 
     Examples:
         >>> cardinal_number(1234, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)
@@ -324,87 +631,38 @@ def cardinal_number(  # noqa: C901
         ...     ConstructState.ABSOLUTE,
         ... )
         'קווינטיליון קוודריליון טריליון מיליארד ומיליון'
+        >>> cardinal_number(2 * 10**63 + 10**21, "m", construct=False)
+        'שני ויגינטיליון וסקסטיליון'
     """
     grammatical_gender = GrammaticalGender.from_string(gender)
     construct_state = ConstructState.from_boolean(construct)
-    if n >= 1_000_000_000_000_000_000 * 1000:
-        raise InvalidNumberError("Number must be below 10^21")
-    if n <= 0:
-        raise InvalidNumberError("Number must be positive")
+    _check_range(n)
+    return _cardinal_number(n, grammatical_gender, construct_state)
 
-    def add_suffix(n: int, suffix: str, grammatical_gender: GrammaticalGender) -> str:
-        if n == 0:
-            return ""
-        if n == 1:
-            return suffix
-        # GRAMMAR RULE: construct_state is not used for 10^6 and above, except for 2
-        if n == 2:  # noqa: PLR2004
-            n_str = _join_words(
-                _decompose_hundreds(n, grammatical_gender, ConstructState.CONSTRUCT)
-            )
-        else:
-            n_str = _join_words(
-                _decompose_hundreds(n, grammatical_gender, ConstructState.ABSOLUTE)
-            )
-        return f"{n_str} {suffix}"
-
-    words = []
-
-    quintillions = n // 1_000_000_000_000_000_000 % 1000
-    words.append(add_suffix(quintillions, "קווינטיליון", GrammaticalGender.MASCULINE))
-
-    quadrillions = n // 1_000_000_000_000_000 % 1000
-    words.append(add_suffix(quadrillions, "קוודריליון", GrammaticalGender.MASCULINE))
-
-    trillions = n // 1_000_000_000_000 % 1000
-    words.append(add_suffix(trillions, "טריליון", GrammaticalGender.MASCULINE))
-
-    billions = n // 1_000_000_000 % 1000
-    words.append(add_suffix(billions, "מיליארד", GrammaticalGender.MASCULINE))
-
-    millions = n // 1_000_000 % 1000
-    words.append(add_suffix(millions, "מיליון", GrammaticalGender.MASCULINE))
-
-    thousands = n // 1_000 % 1000
-    if thousands == 0:
-        thousands_word = ""
-    elif thousands == 1:
-        thousands_word = "אלף"
-    elif thousands == 2:  # noqa: PLR2004
-        thousands_word = "אלפיים"
-    # GRAMMAR RULE: construct_state is used for 1000 only up to 10
-    elif thousands <= 10:  # noqa: PLR2004
-        thousands_word = (
-            _join_words(
-                _decompose_hundreds(
-                    thousands, GrammaticalGender.MASCULINE, ConstructState.CONSTRUCT
-                )
-            )
-            + " אלפים"
-        )
-    else:
-        thousands_word = (
-            _join_words(
-                _decompose_hundreds(
-                    thousands, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE
-                )
+
+def _cardinal_number(
+    n: int, grammatical_gender: GrammaticalGender, construct_state: ConstructState
+) -> str:
+    """Translate an integer into a cardinal number, without validating the input.
+
+    This is the core of `cardinal_number`, for callers that already parsed the
+    arguments and checked that `n` is in the supported range.
+    """
+    if n < 1000:  # noqa: PLR2004
+        if construct_state == ConstructState.CONSTRUCT79:
+            return _join_words(
+                _decompose_hundreds(n, grammatical_gender, construct_state)
             )
-            + " אלף"
-        )
-    words.append(thousands_word)
+        return _joined_triad_table(grammatical_gender, construct_state)[n]
+    return _cardinal_above_1000(n, _trailing_triad_table(grammatical_gender))
 
-    last_digits = n % 1_000
-    if last_digits == 0:
-        last_digits_words = []
-    else:
-        # GRAMMAR RULE: construct_state is applied only up to 20
-        last_digits_words = _decompose_hundreds(
-            last_digits,
-            grammatical_gender,
-            construct_state if n < 1000 else ConstructState.ABSOLUTE,  # noqa: PLR2004
-        )
-    words.extend(last_digits_words)
 
+def _cardinal_above_1000(n: int, trailing_triads: tuple[str, ...]) -> str:
+    """Translate an integer of at least 1000, using the given trailing triads."""
+    rest, last_digits = divmod(n, 1000)
+    words = _group_words(rest)
+    if last_digits:
+        return " ".join(words) + trailing_triads[last_digits]
     return _join_words(words)
 
 
@@ -412,7 +670,7 @@ def indefinite_number(n: int) -> str:
     """Create a string representing an indefinite number (מספר סתמי).
 
     For negative numbers, the string will include a "minus" prefix (מינוס).
-    Supports integers up to 10^21.
+    Supports integers up to 10^66.
 
     Examples:
         >>> indefinite_number(0)
@@ -428,18 +686,54 @@ def indefinite_number(n: int) -> str:
         >>> indefinite_number(1_001_001_001_001_000_000)
         'קווינטיליון קוודריליון טריליון מיליארד ומיליון'
     """
+    _check_indefinite_range(n)
+    return _indefinite_number(n)
+
+
+def _indefinite_number(n: int) -> str:
+    """Create an indefinite number, without validating the input."""
     if n == 0:
         return "אפס"
     if n < 0:
-        n_str = cardinal_number(-n, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)
+        n_str = _cardinal_number(
+            -n, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE
+        )
         return f"מינוס {n_str}"
-    return cardinal_number(n, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)
+    return _cardinal_number(n, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)
+
+
+_ORDINALS = {
+    GrammaticalGender.FEMININE: (
+        "ראשונה",
+        "שנייה",
+        "שלישית",
+        "רביעית",
+        "חמישית",
+        "שישית",
+        "שביעית",
+        "שמינית",
+        "תשיעית",
+        "עשירית",
+    ),
+    GrammaticalGender.MASCULINE: (
+        "ראשון",
+        "שני",
+        "שלישי",
+        "רביעי",
+        "חמישי",
+        "שישי",
+        "שביעי",
+        "שמיני",
+        "תשיעי",
+        "עשירי",
+    ),
+}
 
 
 def ordinal_number(n: int, gender: GrammaticalGender | str) -> str:
     """Create a string representing an ordinal number (מספר סודר).
 
-    Supports positive integers up to 10^21.
+    Supports positive integers up to 10^66.
 
     Examples:
         >>> ordinal_number(1, GrammaticalGender.FEMININE)
@@ -454,37 +748,15 @@ def ordinal_number(n: int, gender: GrammaticalGender | str) -> str:
         'ארבעים ושניים'
     """
     grammatical_gender = GrammaticalGender.from_string(gender)
-    if n <= 0:
-        raise InvalidNumberError("Number must be positive")
+    _check_range(n)
+    return _ordinal_number(n, grammatical_gender)
+
+
+def _ordinal_number(n: int, grammatical_gender: GrammaticalGender) -> str:
+    """Create an ordinal number, without validating the input."""
     if n > 10:  # noqa: PLR2004
-        return cardinal_number(n, grammatical_gender, ConstructState.ABSOLUTE)
-    if grammatical_gender == GrammaticalGender.FEMININE:
-        return {
-            1: "ראשונה",
-            2: "שנייה",
-            3: "שלישית",
-            4: "רביעית",
-            5: "חמישית",
-            6: "שישית",
-            7: "שביעית",
-            8: "שמינית",
-            9: "תשיעית",
-            10: "עשירית",
-        }[n]
-    if grammatical_gender == GrammaticalGender.MASCULINE:
-        return {
-            1: "ראשון",
-            2: "שני",
-            3: "שלישי",
-            4: "רביעי",
-            5: "חמישי",
-            6: "שישי",
-            7: "שביעי",
-            8: "שמיני",
-            9: "תשיעי",
-            10: "עשירי",
-        }[n]
-    raise ValueError("Invalid grammatical_gender provided")
+        return _cardinal_number(n, grammatical_gender, ConstructState.ABSOLUTE)
+    return _ORDINALS[grammatical_gender][n - 1]
 
 
 def count_prefix(
@@ -497,7 +769,7 @@ def count_prefix(
 
     Chooses the correct construct state based on whether the noun is definite or
     indefinite (שם עצם מיודע/לא מיודע).
-    Supports positive integers up to 10^21.
+    Supports positive integers up to 10^66.
     Does not support `n = 1`, as a singular item is not using a prefix.
 
     Examples:
@@ -515,10 +787,14 @@ def count_prefix(
         'שְלוש'
     """
     grammatical_gender = GrammaticalGender.from_string(gender)
-    if n <= 0:
-        raise InvalidNumberError("Number must be positive")
-    if n == 1:
-        raise InvalidNumberError("The count-form of number '1' is not a prefix")
+    _check_prefix_range(n)
+    return _count_prefix(n, grammatical_gender, definite=definite)
+
+
+def _count_prefix(
+    n: int, grammatical_gender: GrammaticalGender, *, definite: bool
+) -> str:
+    """Create a count prefix, without validating the input."""
     # GRAMMAR RULE: always using construct form for 2
     if n == 2:  # noqa: PLR2004
         construct_state = ConstructState.CONSTRUCT
@@ -530,7 +806,7 @@ def count_prefix(
         construct_state = (
             ConstructState.CONSTRUCT if definite else ConstructState.ABSOLUTE
         )
-    return cardinal_number(n, grammatical_gender, construct_state)
+    return _cardinal_number(n, grammatical_gender, construct_state)
 
 
 def count_noun(
@@ -545,7 +821,7 @@ def count_noun(
 
     Chooses the appropriate form based on `n` and adjusts for grammatical gender
     and definiteness.
-    Supports positive integers up to 10^21.
+    Supports positive integers up to 10^66.
 
     Examples:
         >>> count_noun(1, "ילד", "ילדים", GrammaticalGender.MASCULINE, definite=False)
@@ -562,10 +838,836 @@ def count_noun(
         'שְלוש הילדות'
     """
     grammatical_gender = GrammaticalGender.from_string(gender)
+    _check_noun_range(n)
+    return _count_noun(
+        n, singular_form, plural_form, grammatical_gender, definite=definite
+    )
+
+
+def _count_noun(
+    n: int,
+    singular_form: str,
+    plural_form: str,
+    grammatical_gender: GrammaticalGender,
+    *,
+    definite: bool,
+) -> str:
+    """Count a noun, without validating the input."""
     if n == 1:
-        n_str = ("ה" if definite else "") + cardinal_number(
+        n_str = ("ה" if definite else "") + _cardinal_number(
             n, grammatical_gender, ConstructState.ABSOLUTE
         )
         return f"{singular_form} {n_str}"
-    n_str = count_prefix(n, grammatical_gender, definite=definite)
+    n_str = _count_prefix(n, grammatical_gender, definite=definite)
     return f"{n_str} {plural_form}"
+
+
+def _checked_batch(
+    numbers: Iterable[int], check_range: Callable[[int], None]
+) -> Sequence[int]:
+    """Materialize a batch of numbers, and validate all of them at once.
+
+    Every supported range is contiguous, so checking the extremes is enough.
+    """
+    batch = numbers if isinstance(numbers, (list, tuple, range)) else list(numbers)
+    if batch:
+        check_range(min(batch))
+        check_range(max(batch))
+    return batch
+
+
+def _converted_batch(
+    numbers: Iterable[int],
+    check_range: Callable[[int], None],
+    convert: Callable[[int], str],
+    errors: _Errors,
+    *,
+    dedup: bool = False,
+) -> list[str] | list[str | None]:
+    """Convert a batch of numbers, handling the unsupported ones as `errors` says.
+
+    Unless raising, each number is compared with the supported range, and no
+    exception is created for an unsupported number.
+    With `dedup`, only the distinct numbers are converted, and their results are
+    shared by all their occurrences.
+    """
+    if dedup:
+        batch = numbers if isinstance(numbers, (list, tuple, range)) else list(numbers)
+        uniques = list(dict.fromkeys(batch))
+        results = dict(
+            zip(
+                uniques,
+                _converted_batch(uniques, check_range, convert, errors),
+                strict=True,
+            )
+        )
+        return [results[n] for n in batch]
+    if errors == "raise":
+        return [convert(n) for n in _checked_batch(numbers, check_range)]
+    lowest, highest = _SUPPORTED_RANGES[check_range]
+    if errors == "none":
+        return [convert(n) if lowest <= n <= highest else None for n in numbers]
+    if errors == "empty":
+        return [convert(n) if lowest <= n <= highest else "" for n in numbers]
+    if callable(errors):
+        return [convert(n) if lowest <= n <= highest else errors(n) for n in numbers]
+    raise ValueError(f"Invalid errors: {errors}")
+
+
+def _extended(
+    out: list[str] | list[str | None] | None, results: list[str] | list[str | None]
+) -> list[str] | list[str | None]:
+    """Append the results of a batch to `out`, or return them if it is None."""
+    if out is None:
+        return results
+    typing.cast("list[str | None]", out).extend(results)
+    return out
+
+
+@overload
+def cardinal_numbers(
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+    *,
+    errors: _StrErrors = "raise",
+    dedup: bool = False,
+    out: list[str] | None = None,
+) -> list[str]: ...
+@overload
+def cardinal_numbers(
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+    *,
+    errors: Literal["none"],
+    dedup: bool = False,
+    out: list[str | None] | None = None,
+) -> list[str | None]: ...
+def cardinal_numbers(  # noqa: PLR0913
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+    *,
+    errors: _Errors = "raise",
+    dedup: bool = False,
+    out: list[str] | list[str | None] | None = None,
+) -> list[str] | list[str | None]:
+    """Translate many positive integers into cardinal numbers (מספר מונה).
+
+    Same as calling `cardinal_number` for every number, but the arguments are parsed,
+    and the numbers are validated, once for the whole batch.
+
+    Args:
+        numbers: Integers to translate.
+        gender: Grammatical gender of all the numbers.
+        construct: Construct state of all the numbers.
+        errors: How to handle unsupported numbers. "raise" raises
+            `InvalidNumberError`, "none" and "empty" replace each of them with None
+            or with '', and a callable replaces each of them with its result.
+            Unless raising, the numbers are compared with the supported range
+            without raising and catching an exception for each unsupported number.
+        dedup: Whether to convert each distinct number once, and share its result
+            between its occurrences. This is faster when the numbers repeat, as in
+            most columns of real data, but slower when they are mostly distinct.
+        out: List to append the results to. A new list is used by default.
+
+    Returns:
+        The list of results.
+
+    Raises:
+        InvalidNumberError: If any of the numbers is not supported, and errors is
+            "raise". Nothing is appended to `out` in that case.
+        ValueError: If errors is invalid.
+
+    Examples:
+        >>> cardinal_numbers([1, 2, 3], GrammaticalGender.FEMININE, construct=False)
+        ['אחת', 'שתיים', 'שָלוש']
+        >>> results = ["ללא"]
+        >>> cardinal_numbers(range(1, 3), "m", construct=True, out=results)
+        ['ללא', 'אַחַד', 'שני']
+        >>> cardinal_numbers([0, 1], "f", construct=False, errors="none")
+        [None, 'אחת']
+        >>> cardinal_numbers([-2, 2], "f", construct=False, errors=str)
+        ['-2', 'שתיים']
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    results = _converted_batch(
+        numbers,
+        _check_range,
+        lambda n: _cardinal_number(n, grammatical_gender, construct_state),
+        errors,
+        dedup=dedup,
+    )
+    return _extended(out, results)
+
+
+def try_cardinal_number(
+    n: int,
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+) -> str | None:
+    """Translate an integer into a cardinal number, or return None if unsupported.
+
+    Same as `cardinal_number`, but returns None instead of raising
+    `InvalidNumberError`, without creating an exception.
+
+    Examples:
+        >>> try_cardinal_number(3, "f", construct=False)
+        'שָלוש'
+        >>> try_cardinal_number(0, "f", construct=False) is None
+        True
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    if not 0 < n < _MAX_NUMBER:
+        return None
+    return _cardinal_number(n, grammatical_gender, construct_state)
+
+
+@overload
+def indefinite_numbers(
+    numbers: Iterable[int],
+    *,
+    errors: _StrErrors = "raise",
+    dedup: bool = False,
+    out: list[str] | None = None,
+) -> list[str]: ...
+@overload
+def indefinite_numbers(
+    numbers: Iterable[int],
+    *,
+    errors: Literal["none"],
+    dedup: bool = False,
+    out: list[str | None] | None = None,
+) -> list[str | None]: ...
+def indefinite_numbers(
+    numbers: Iterable[int],
+    *,
+    errors: _Errors = "raise",
+    dedup: bool = False,
+    out: list[str] | list[str | None] | None = None,
+) -> list[str] | list[str | None]:
+    """Create indefinite numbers (מספר סתמי) for many integers.
+
+    Same as calling `indefinite_number` for every number, but the numbers are
+    validated once for the whole batch. See `cardinal_numbers` for the arguments.
+
+    Examples:
+        >>> indefinite_numbers([-1, 0, 1])
+        ['מינוס אחת', 'אפס', 'אחת']
+    """
+    results = _converted_batch(
+        numbers, _check_indefinite_range, _indefinite_number, errors, dedup=dedup
+    )
+    return _extended(out, results)
+
+
+@overload
+def ordinal_numbers(
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    errors: _StrErrors = "raise",
+    dedup: bool = False,
+    out: list[str] | None = None,
+) -> list[str]: ...
+@overload
+def ordinal_numbers(
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    errors: Literal["none"],
+    dedup: bool = False,
+    out: list[str | None] | None = None,
+) -> list[str | None]: ...
+def ordinal_numbers(
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    errors: _Errors = "raise",
+    dedup: bool = False,
+    out: list[str] | list[str | None] | None = None,
+) -> list[str] | list[str | None]:
+    """Create ordinal numbers (מספר סודר) for many positive integers.
+
+    Same as calling `ordinal_number` for every number, but the arguments are parsed,
+    and the numbers are validated, once for the whole batch.
+    See `cardinal_numbers` for the arguments.
+
+    Examples:
+        >>> ordinal_numbers([1, 2, 11], "f")
+        ['ראשונה', 'שנייה', 'אחת־עשרה']
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    results = _converted_batch(
+        numbers,
+        _check_range,
+        lambda n: _ordinal_number(n, grammatical_gender),
+        errors,
+        dedup=dedup,
+    )
+    return _extended(out, results)
+
+
+@overload
+def count_prefixes(
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    errors: _StrErrors = "raise",
+    dedup: bool = False,
+    out: list[str] | None = None,
+) -> list[str]: ...
+@overload
+def count_prefixes(
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    errors: Literal["none"],
+    dedup: bool = False,
+    out: list[str | None] | None = None,
+) -> list[str | None]: ...
+def count_prefixes(  # noqa: PLR0913
+    numbers: Iterable[int],
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    errors: _Errors = "raise",
+    dedup: bool = False,
+    out: list[str] | list[str | None] | None = None,
+) -> list[str] | list[str | None]:
+    """Generate count prefixes for many integers larger than 1.
+
+    Same as calling `count_prefix` for every number, but the arguments are parsed,
+    and the numbers are validated, once for the whole batch.
+    See `cardinal_numbers` for the arguments.
+
+    Examples:
+        >>> count_prefixes([2, 3], "m", definite=True)
+        ['שני', 'שלושת']
+        >>> count_prefixes([1, 2], "m", errors="empty")
+        ['', 'שני']
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    results = _converted_batch(
+        numbers,
+        _check_prefix_range,
+        lambda n: _count_prefix(n, grammatical_gender, definite=definite),
+        errors,
+        dedup=dedup,
+    )
+    return _extended(out, results)
+
+
+@overload
+def count_nouns(
+    numbers: Iterable[int],
+    singular_form: str,
+    plural_form: str,
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    errors: _StrErrors = "raise",
+    dedup: bool = False,
+    out: list[str] | None = None,
+) -> list[str]: ...
+@overload
+def count_nouns(
+    numbers: Iterable[int],
+    singular_form: str,
+    plural_form: str,
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    errors: Literal["none"],
+    dedup: bool = False,
+    out: list[str | None] | None = None,
+) -> list[str | None]: ...
+def count_nouns(  # noqa: PLR0913
+    numbers: Iterable[int],
+    singular_form: str,
+    plural_form: str,
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    errors: _Errors = "raise",
+    dedup: bool = False,
+    out: list[str] | list[str | None] | None = None,
+) -> list[str] | list[str | None]:
+    """Generate phrases counting a noun, for many positive integers.
+
+    Same as calling `count_noun` for every number, but the arguments are parsed,
+    and the numbers are validated, once for the whole batch.
+    See `cardinal_numbers` for the arguments.
+
+    Examples:
+        >>> count_nouns([1, 2], "ילדה", "ילדות", "f")
+        ['ילדה אחת', 'שתי ילדות']
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    results = _converted_batch(
+        numbers,
+        _check_noun_range,
+        lambda n: _count_noun(
+            n, singular_form, plural_form, grammatical_gender, definite=definite
+        ),
+        errors,
+        dedup=dedup,
+    )
+    return _extended(out, results)
+
+
+def factorize(numbers: Iterable[int]) -> tuple[list[int], list[int]]:
+    """Encode numbers as indices into the list of their distinct values.
+
+    Like `pandas.factorize`, the distinct values are listed in the order of their
+    first occurrence. Converting them with a batch converter gives a
+    dictionary-encoded result: each string is created once, and the codes map the
+    numbers to their strings.
+
+    Returns:
+        The codes, the index of each number in the distinct values, and the
+        distinct values.
+
+    Examples:
+        >>> codes, uniques = factorize([5, 3, 5, 5])
+        >>> codes, uniques
+        ([0, 1, 0, 0], [5, 3])
+        >>> strings = cardinal_numbers(uniques, "m", construct=False)
+        >>> strings, [strings[code] for code in codes]
+        (['חמישה', 'שלושה'], ['חמישה', 'שלושה', 'חמישה', 'חמישה'])
+    """
+    index: dict[int, int] = {}
+    codes = [index.setdefault(n, len(index)) for n in numbers]
+    return codes, list(index)
+
+
+def iter_cardinal(
+    start: int,
+    stop: int,
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+) -> Iterator[str]:
+    """Lazily translate every integer in `range(start, stop)` into a cardinal number.
+
+    Consecutive numbers share their groups of thousands and above, so those are
+    joined once per thousand numbers, and only the last triad is looked up per number.
+
+    Raises:
+        InvalidNumberError: If the range contains an unsupported number. This is
+            raised immediately, not when iterating.
+
+    Examples:
+        >>> list(iter_cardinal(999, 1002, "m", construct=False))
+        ['תְשע מאות תשעים ותשעה', 'אלף', 'אלף ואֶחָד']
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    if start >= stop:
+        return iter(())
+    _check_range(start)
+    _check_range(stop - 1)
+    return _iter_cardinal(start, stop, grammatical_gender, construct_state)
+
+
+def _iter_cardinal(
+    start: int,
+    stop: int,
+    grammatical_gender: GrammaticalGender,
+    construct_state: ConstructState,
+) -> Iterator[str]:
+    """Translate a range of supported integers, reusing the shared groups."""
+    high, low = divmod(start, 1000)
+    if high == 0:
+        for n in range(low, min(stop, 1000)):
+            yield _cardinal_number(n, grammatical_gender, construct_state)
+        high, low = 1, 0
+    trailing = _trailing_triad_table(grammatical_gender)
+    while high * 1000 < stop:
+        words = _group_words(high)
+        if low == 0:
+            yield _join_words(words)
+            low = 1
+        head = " ".join(words)
+        for t in range(low, min(stop - high * 1000, 1000)):
+            yield head + trailing[t]
+        high, low = high + 1, 0
+
+
+def iter_ordinal(
+    start: int, stop: int, gender: GrammaticalGender | str
+) -> Iterator[str]:
+    """Lazily create the ordinal number of every integer in `range(start, stop)`.
+
+    See `iter_cardinal`.
+
+    Examples:
+        >>> list(iter_ordinal(9, 12, "f"))
+        ['תשיעית', 'עשירית', 'אחת־עשרה']
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    if start >= stop:
+        return iter(())
+    _check_range(start)
+    _check_range(stop - 1)
+    return itertools.chain(
+        (_ordinal_number(n, grammatical_gender) for n in range(start, min(stop, 11))),
+        _iter_cardinal(
+            max(start, 11), stop, grammatical_gender, ConstructState.ABSOLUTE
+        ),
+    )
+
+
+def iter_indefinite(start: int, stop: int) -> Iterator[str]:
+    """Lazily create the indefinite number of every integer in `range(start, stop)`.
+
+    See `iter_cardinal`. Negative numbers are converted one by one.
+
+    Examples:
+        >>> list(iter_indefinite(-1, 2))
+        ['מינוס אחת', 'אפס', 'אחת']
+    """
+    if start >= stop:
+        return iter(())
+    _check_indefinite_range(start)
+    _check_indefinite_range(stop - 1)
+    return itertools.chain(
+        (_indefinite_number(n) for n in range(start, min(stop, 1))),
+        _iter_cardinal(
+            max(start, 1), stop, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE
+        ),
+    )
+
+
+def _fragment_writer(out: SupportsWrite[str] | list[str]) -> Callable[[str], object]:
+    """Return a function that appends a fragment to `out`."""
+    return out.append if isinstance(out, list) else out.write
+
+
+def _write_cardinal(
+    n: int,
+    grammatical_gender: GrammaticalGender,
+    construct_state: ConstructState,
+    write: Callable[[str], object],
+) -> None:
+    """Write a cardinal number as fragments, without validating the input."""
+    if n < 1000 or construct_state == ConstructState.CONSTRUCT79:  # noqa: PLR2004
+        write(_cardinal_number(n, grammatical_gender, construct_state))
+        return
+    rest, last_digits = divmod(n, 1000)
+    triads = _split_triads(rest)
+    lowest_scale = 1
+    while not triads[lowest_scale - 1]:
+        lowest_scale += 1
+    first = True
+    for scale in range(len(triads), lowest_scale - 1, -1):
+        t = triads[scale - 1]
+        if not t:
+            continue
+        if not first:
+            if scale == lowest_scale and not last_digits:
+                write(" ו")  # noqa: RUF001
+            else:
+                write(" ")
+        write(_group_table(scale)[t])
+        first = False
+    if last_digits:
+        write(_trailing_triad_table(grammatical_gender)[last_digits])
+
+
+def write_cardinal(
+    n: int,
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+    out: SupportsWrite[str] | list[str],
+) -> None:
+    """Write a cardinal number (מספר מונה) into `out`, like `cardinal_number`.
+
+    The number is written as precomputed fragments, without joining them into
+    a new string first.
+
+    Args:
+        n: Positive integer to translate.
+        gender: Grammatical gender of the number.
+        construct: Construct state of the number.
+        out: A list to append the fragments to, or an object with a `write` method,
+            such as `io.StringIO` or a text file.
+
+    Raises:
+        InvalidNumberError: If the number is not supported. Nothing is written in
+            that case.
+
+    Examples:
+        >>> import io
+        >>> out = io.StringIO()
+        >>> write_cardinal(2_001_000, "f", construct=False, out=out)
+        >>> out.getvalue()
+        'שני מיליון ואלף'
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    _check_range(n)
+    _write_cardinal(n, grammatical_gender, construct_state, _fragment_writer(out))
+
+
+def write_indefinite(n: int, out: SupportsWrite[str] | list[str]) -> None:
+    """Write an indefinite number (מספר סתמי) into `out`, like `indefinite_number`.
+
+    See `write_cardinal`.
+
+    Examples:
+        >>> out = []
+        >>> write_indefinite(-1, out)
+        >>> out
+        ['מינוס ', 'אחת']
+    """
+    _check_indefinite_range(n)
+    write = _fragment_writer(out)
+    if n == 0:
+        write("אפס")
+        return
+    if n < 0:
+        write("מינוס ")
+        n = -n
+    _write_cardinal(n, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE, write)
+
+
+def write_ordinal(
+    n: int, gender: GrammaticalGender | str, out: SupportsWrite[str] | list[str]
+) -> None:
+    """Write an ordinal number (מספר סודר) into `out`, like `ordinal_number`.
+
+    See `write_cardinal`.
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    _check_range(n)
+    write = _fragment_writer(out)
+    if n > 10:  # noqa: PLR2004
+        _write_cardinal(n, grammatical_gender, ConstructState.ABSOLUTE, write)
+    else:
+        write(_ORDINALS[grammatical_gender][n - 1])
+
+
+def _write_count_prefix(
+    n: int,
+    grammatical_gender: GrammaticalGender,
+    write: Callable[[str], object],
+    *,
+    definite: bool,
+) -> None:
+    """Write a count prefix as fragments, without validating the input."""
+    if n < 1000:  # noqa: PLR2004
+        write(_count_prefix(n, grammatical_gender, definite=definite))
+    else:
+        _write_cardinal(n, grammatical_gender, ConstructState.ABSOLUTE, write)
+
+
+def write_count_prefix(
+    n: int,
+    gender: GrammaticalGender | str,
+    out: SupportsWrite[str] | list[str],
+    *,
+    definite: bool = False,
+) -> None:
+    """Write a count prefix into `out`, like `count_prefix`.
+
+    See `write_cardinal`.
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    _check_prefix_range(n)
+    _write_count_prefix(n, grammatical_gender, _fragment_writer(out), definite=definite)
+
+
+def write_count_noun(  # noqa: PLR0913
+    n: int,
+    singular_form: str,
+    plural_form: str,
+    gender: GrammaticalGender | str,
+    out: SupportsWrite[str] | list[str],
+    *,
+    definite: bool = False,
+) -> None:
+    """Write a phrase counting a noun into `out`, like `count_noun`.
+
+    See `write_cardinal`.
+
+    Examples:
+        >>> import io
+        >>> out = io.StringIO()
+        >>> write_count_noun(3, "הילד", "הילדים", "m", out, definite=True)
+        >>> out.getvalue()
+        'שלושת הילדים'
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    _check_noun_range(n)
+    write = _fragment_writer(out)
+    if n == 1:
+        write(singular_form)
+        write(" ה" if definite else " ")
+        write(_joined_triad_table(grammatical_gender, ConstructState.ABSOLUTE)[1])
+        return
+    _write_count_prefix(n, grammatical_gender, write, definite=definite)
+    write(" ")
+    write(plural_form)
+
+
+# the fragments that separate the groups of a number, and the sign of an indefinite
+# number, encoded as UTF-8
+_SPACE_BYTES = b" "
+_AND_BYTES = " ו".encode()  # noqa: RUF001
+_MINUS_BYTES = "מינוס ".encode()
+
+
+@_table_cache
+def _joined_triad_bytes(
+    grammatical_gender: GrammaticalGender, construct_state: ConstructState
+) -> tuple[bytes, ...]:
+    """Encode `_joined_triad_table` as UTF-8."""
+    return tuple(
+        s.encode() for s in _joined_triad_table(grammatical_gender, construct_state)
+    )
+
+
+@_table_cache
+def _trailing_triad_bytes(grammatical_gender: GrammaticalGender) -> tuple[bytes, ...]:
+    """Encode `_trailing_triad_table` as UTF-8."""
+    return tuple(s.encode() for s in _trailing_triad_table(grammatical_gender))
+
+
+@_table_cache
+def _group_bytes(scale: int) -> tuple[bytes, ...]:
+    """Encode `_group_table` as UTF-8."""
+    return tuple(s.encode() for s in _group_table(scale))
+
+
+def _above_1000_bytes(n: int, trailing_triads: tuple[bytes, ...]) -> list[bytes]:
+    """Render an integer of at least 1000 as UTF-8 fragments, with the given triads.
+
+    Joining the fragments gives the encoding of `_cardinal_above_1000`.
+
+    Examples:
+        >>> fragments = _above_1000_bytes(
+        ...     2_001_000, _trailing_triad_bytes(GrammaticalGender.FEMININE)
+        ... )
+        >>> b"".join(fragments).decode()
+        'שני מיליון ואלף'
+    """
+    rest, last_digits = divmod(n, 1000)
+    # the groups, from the lowest to the highest
+    groups = [
+        _group_bytes(scale)[t]
+        for scale, t in enumerate(_split_triads(rest), start=1)
+        if t
+    ]
+    fragments = [groups.pop()]
+    while groups:
+        group = groups.pop()
+        fragments.append(_SPACE_BYTES if groups or last_digits else _AND_BYTES)
+        fragments.append(group)
+    if last_digits:
+        fragments.append(trailing_triads[last_digits])
+    return fragments
+
+
+def _copy_bytes(data: bytes, buf: bytearray | memoryview, offset: int | None) -> int:
+    """Write bytes into a buffer, and return the number of bytes written.
+
+    With no offset, the bytes are appended to a bytearray. Otherwise, they are
+    copied into the buffer at the offset, and must fit in it.
+    """
+    if offset is None:
+        if not isinstance(buf, bytearray):
+            raise TypeError("An offset is required to write into a memoryview")
+        buf += data
+        return len(data)
+    end = offset + len(data)
+    if offset < 0 or end > len(buf):
+        raise ValueError(
+            f"Cannot write {len(data)} bytes at offset {offset} "
+            f"of a {len(buf)}-byte buffer"
+        )
+    buf[offset:end] = data
+    return len(data)
+
+
+def _cardinal_number_bytes(
+    n: int, grammatical_gender: GrammaticalGender, construct_state: ConstructState
+) -> bytes:
+    """Encode a cardinal number as UTF-8, without validating the input."""
+    if n < 1000:  # noqa: PLR2004
+        if construct_state == ConstructState.CONSTRUCT79:
+            # not tabulated, like in `_cardinal_number`
+            return _cardinal_number(n, grammatical_gender, construct_state).encode()
+        return _joined_triad_bytes(grammatical_gender, construct_state)[n]
+    # joining the fragments and copying them at once is faster than copying each
+    return b"".join(_above_1000_bytes(n, _trailing_triad_bytes(grammatical_gender)))
+
+
+def cardinal_number_bytes(
+    n: int,
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+) -> bytes:
+    """Translate a positive integer into a cardinal number, encoded as UTF-8.
+
+    Like `cardinal_number(n, gender, construct).encode()`, but the result is joined
+    from fragments that were encoded ahead of time, without creating a string.
+
+    Examples:
+        >>> cardinal_number_bytes(1234, "m", construct=False).decode()
+        'אלף מאתיים שלושים וארבעה'
+        >>> cardinal_number_bytes(3, "f", construct=True) == "שְלוש".encode()
+        True
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    _check_range(n)
+    return _cardinal_number_bytes(n, grammatical_gender, construct_state)
+
+
+def write_cardinal_bytes(
+    n: int,
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+    buf: bytearray | memoryview,
+    offset: int | None = None,
+) -> int:
+    """Write a cardinal number into a buffer, encoded as UTF-8.
+
+    Like `cardinal_number_bytes`, the number is assembled from fragments that were
+    encoded ahead of time, without creating a string. Nothing is written if an
+    exception is raised.
+
+    Args:
+        n: Positive integer to translate.
+        gender: Grammatical gender of the number.
+        construct: Construct state of the number.
+        buf: A bytearray to append to, or a writable buffer to write into at
+            `offset`, such as a `memoryview` of a preallocated bytearray.
+        offset: Position in `buf` to write at. By default, the number is appended to
+            the bytearray.
+
+    Returns:
+        The number of bytes written.
+
+    Raises:
+        InvalidNumberError: If the number is not supported.
+        ValueError: If the number does not fit in `buf` at `offset`.
+        TypeError: If `buf` is not a bytearray and no offset is given.
+
+    Examples:
+        >>> buf = bytearray(b"<")
+        >>> write_cardinal_bytes(2_001_000, "f", construct=False, buf=buf)
+        28
+        >>> buf.decode()
+        '<שני מיליון ואלף'
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    _check_range(n)
+    data = _cardinal_number_bytes(n, grammatical_gender, construct_state)
+    return _copy_bytes(data, buf, offset)
@@ -45,6 +45,24 @@ __all__ = [
 ]
 
 
+_HEBREW_GENDERS = {
+    "ז": GrammaticalGender.MASCULINE,
+    "זכר": GrammaticalGender.MASCULINE,
+    "זכרי": GrammaticalGender.MASCULINE,
+    "נ": GrammaticalGender.FEMININE,
+    "נקבה": GrammaticalGender.FEMININE,
+    "נקבי": GrammaticalGender.FEMININE,
+}
+_HEBREW_CONSTRUCT_STATES = {
+    "נפרד": ConstructState.ABSOLUTE,
+    "נסמך": ConstructState.CONSTRUCT,
+}
+_HEBREW_BOOLEANS = {
+    "כן": True,
+    "לא": False,
+}
+
+
 def _map_hebrew_gender(מין: str) -> GrammaticalGender:
     """Map Hebrew gender terms to English enum.
 
@@ -54,17 +72,10 @@ def _map_hebrew_gender(מין: str) -> GrammaticalGender:
     Returns:
         GrammaticalGender enum
     """
-    gender_map = {
-        "ז": "masculine",
-        "זכר": "masculine",
-        "זכרי": "masculine",
-        "נ": "feminine",
-        "נקבה": "feminine",
-        "נקבי": "feminine",
-    }
-
-    english_gender = gender_map.get(מין, מין)
-    return GrammaticalGender.from_string(english_gender)
+    try:
+        return _HEBREW_GENDERS[מין]
+    except KeyError:
+        return GrammaticalGender.from_string(מין)
 
 
 def _map_hebrew_construct(מצב: str) -> ConstructState:
@@ -76,13 +87,10 @@ def _map_hebrew_construct(מצב: str) -> ConstructState:
     Returns:
         ConstructState enum
     """
-    construct_map = {
-        "נפרד": "absolute",
-        "נסמך": "construct",
-    }
-
-    english_construct = construct_map.get(מצב, מצב)
-    return ConstructState(english_construct)
+    try:
+        return _HEBREW_CONSTRUCT_STATES[מצב]
+    except KeyError:
+        return ConstructState(מצב)
 
 
 def _map_hebrew_boolean(value: bool | str) -> bool:  # noqa: FBT001
@@ -100,13 +108,8 @@ def _map_hebrew_boolean(value: bool | str) -> bool:  # noqa: FBT001
     if isinstance(value, bool):
         return value
 
-    boolean_map = {
-        "כן": True,
-        "לא": False,
-    }
-
-    if value in boolean_map:
-        return boolean_map[value]
+    if value in _HEBREW_BOOLEANS:
+        return _HEBREW_BOOLEANS[value]
 
     msg = (
         f"Invalid Hebrew boolean value: {value!r}. Expected 'כן', 'לא', True, or False"
@@ -0,0 +1,192 @@
+"""Replacing numerals in Hebrew text with words.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Literal, overload
+
+from .formatters import NumberFormatter, compile_count_prefix, compile_indefinite
+from .hebrew_numbers import _MAX_EXPONENT, GrammaticalGender, count_noun
+from .parsing import _WORD_PATTERN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+__all__ = ["normalize_digits"]
+
+# a numeral, with an optional minus sign and thousands separators,
+# optionally followed by a word that may be the counted noun
+_NUMERAL_PATTERN = re.compile(
+    r"(?:(?<![\w.,])(?P<minus>-))?(?<![\w.,])"
+    r"(?P<digits>\d{1,3}(?:,\d{3})+|\d+)(?!\w|[.,]\d)"
+    rf"(?:(?P<space>\s+)(?P<noun>{_WORD_PATTERN.pattern}))?"
+)
+# text that may still be followed by the noun of a numeral
+_OPEN_PATTERN = re.compile(r"\s*")
+# the last word of a chunk, which may continue in the next one
+_TAIL_PATTERN = re.compile(r"\S*\Z")
+
+
+class _Normalizer:
+    """The state of a `normalize_digits` call: the lexicon and the formatters."""
+
+    __slots__ = ("_default", "_indefinite", "_nouns", "_prefixes")
+
+    def __init__(
+        self,
+        nouns: Mapping[str, GrammaticalGender | str],
+        default: Literal["indefinite", "keep"],
+    ):
+        if default not in {"indefinite", "keep"}:
+            raise ValueError(f"Invalid default: {default}")
+        self._default = default
+        self._nouns = {
+            noun: GrammaticalGender.from_string(gender)
+            for noun, gender in nouns.items()
+        }
+        self._indefinite = compile_indefinite()
+        self._prefixes: dict[tuple[GrammaticalGender, bool], NumberFormatter] = {}
+
+    def _noun(self, word: str) -> tuple[GrammaticalGender, bool] | None:
+        """Return the gender and definiteness of a known noun, or None."""
+        gender = self._nouns.get(word)
+        if gender is not None:
+            return gender, False
+        if word.startswith("ה"):
+            gender = self._nouns.get(word[1:])
+            if gender is not None:
+                return gender, True
+        return None
+
+    def _count(self, n: int, word: str) -> str | None:
+        """Count a known noun, or return None."""
+        noun = self._noun(word)
+        if noun is None or n <= 0:
+            return None
+        gender, definite = noun
+        if n == 1:
+            return count_noun(n, word, word, gender, definite=definite)
+        prefix = self._prefixes.get(noun)
+        if prefix is None:
+            prefix = self._prefixes[noun] = compile_count_prefix(
+                gender, definite=definite
+            )
+        return f"{prefix(n)} {word}"
+
+    def replace(self, match: re.Match[str]) -> str:
+        """Return the replacement of a numeral, and of its noun if it is known."""
+        digits = match["digits"].replace(",", "")
+        if len(digits) > _MAX_EXPONENT:
+            return match[0]
+        n = int(digits)
+        if match["minus"]:
+            n = -n
+        noun = match["noun"]
+        if noun is not None:
+            counted = self._count(n, noun)
+            if counted is not None:
+                return counted
+        if self._default == "keep":
+            return match[0]
+        number = self._indefinite(n)
+        if noun is None:
+            return number
+        return f"{number}{match['space']}{noun}"
+
+    def feed(self, text: str, *, final: bool) -> tuple[str, str]:
+        """Normalize a chunk, and return it with the text that must wait for more."""
+        end = len(text)
+        if not final:
+            # hold back the trailing word, which the next chunk may continue;
+            # the pattern matches the end of any text
+            tail = _TAIL_PATTERN.search(text)
+            assert tail is not None  # noqa: S101
+            end = tail.start()
+        parts = []
+        pos = 0
+        for match in _NUMERAL_PATTERN.finditer(text, 0, end):
+            if not final and (
+                match.end() == end
+                or (
+                    match["noun"] is None
+                    and _OPEN_PATTERN.fullmatch(text, match.end(), end)
+                )
+            ):
+                end = match.start()
+                break
+            parts.append(text[pos : match.start()])
+            parts.append(self.replace(match))
+            pos = match.end()
+        parts.append(text[pos:end])
+        return "".join(parts), text[end:]
+
+
+@overload
+def normalize_digits(  # type: ignore[overload-overlap]
+    text: str,
+    default: Literal["indefinite", "keep"] = "indefinite",
+    *,
+    nouns: Mapping[str, GrammaticalGender | str] | None = None,
+) -> str: ...
+@overload
+def normalize_digits(
+    text: Iterable[str],
+    default: Literal["indefinite", "keep"] = "indefinite",
+    *,
+    nouns: Mapping[str, GrammaticalGender | str] | None = None,
+) -> Iterator[str]: ...
+def normalize_digits(
+    text: str | Iterable[str],
+    default: Literal["indefinite", "keep"] = "indefinite",
+    *,
+    nouns: Mapping[str, GrammaticalGender | str] | None = None,
+) -> str | Iterator[str]:
+    """Replace the numerals in a Hebrew text with words.
+
+    A numeral followed by a known noun is replaced, together with the noun, by
+    `count_noun`, in the gender of the noun. A noun with the definite article
+    (e.g. 'הילדים' when 'ילדים' is known) is counted as a definite noun.
+    Other numerals are replaced by `indefinite_number`, or kept as they are.
+
+    Args:
+        text: The text, or an iterable of its chunks, such as the lines of a file.
+        default: How to replace a numeral that is not followed by a known noun,
+            "indefinite" for `indefinite_number` or "keep" to leave it as is.
+        nouns: Maps each known noun, in singular or plural form and without the
+            definite article, to its gender.
+
+    Returns:
+        The normalized text, or, if given chunks, an iterator of normalized chunks.
+        A chunk ending in a numeral is held until the next chunk, so the chunks
+        are not aligned with the input, but only a few words are held at a time.
+
+    Raises:
+        ValueError: If default is not "indefinite" or "keep".
+
+    Examples:
+        >>> normalize_digits("ירדו 3 מ״מ גשם, הטמפרטורה ירדה ל -4 מעלות")
+        'ירדו שָלוש מ״מ גשם, הטמפרטורה ירדה ל מינוס ארבע מעלות'
+        >>> nouns = {"ילד": "m", "ילדים": "m", "ילדות": "f"}
+        >>> normalize_digits("הגיעו 3 ילדים, 5 הילדות ועוד 1 ילד", nouns=nouns)
+        'הגיעו שלושה ילדים, חמש הילדות ועוד ילד אֶחָד'
+        >>> list(normalize_digits(["מחיר: 1,0", "00 ש״ח"]))
+        ['מחיר: ', 'אלף ש״ח']
+    """
+    normalizer = _Normalizer(nouns or {}, default)
+    if isinstance(text, str):
+        return normalizer.feed(text, final=True)[0]
+    return _normalize_chunks(normalizer, text)
+
+
+def _normalize_chunks(normalizer: _Normalizer, chunks: Iterable[str]) -> Iterator[str]:
+    held = ""
+    for chunk in chunks:
+        normalized, held = normalizer.feed(held + chunk, final=False)
+        if normalized:
+            yield normalized
+    normalized, _ = normalizer.feed(held, final=True)
+    if normalized:
+        yield normalized
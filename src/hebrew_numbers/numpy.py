@@ -0,0 +1,354 @@
+"""Vectorized Hebrew number conversion for NumPy integer arrays.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError as exc:
+    msg = (
+        "numpy is required for vectorized Hebrew numbers. "
+        "Install with: pip install hebrew-numbers[numpy]"
+    )
+    raise ImportError(msg) from exc
+
+import functools
+from typing import TYPE_CHECKING, cast
+
+from .hebrew_numbers import (
+    _ORDINALS,
+    ConstructState,
+    GrammaticalGender,
+    InvalidNumberError,
+    _group_table,
+    _join_words,
+    _joined_triad_table,
+    _table_cache,
+    _trailing_triad_table,
+    _triad_table,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+
+    _IntegerArray = npt.NDArray[np.int64] | npt.NDArray[np.uint64]
+
+__all__ = [
+    "cardinal_numbers",
+    "count_nouns",
+    "count_prefixes",
+    "factorize",
+    "indefinite_numbers",
+    "ordinal_numbers",
+]
+
+
+@_table_cache
+def _low_fragments(
+    grammatical_gender: GrammaticalGender, construct_state: ConstructState
+) -> npt.NDArray[np.object_]:
+    """Fragments of the last triad, as a (2, 1000) array.
+
+    Row 0 holds the triad when it is the whole number.
+    Row 1 holds the triad when it follows a higher group, with its separator.
+    """
+    table = np.empty((2, 1000), dtype=object)
+    table[0] = _joined_triad_table(grammatical_gender, construct_state)
+    table[1] = _trailing_triad_table(grammatical_gender)
+    table.flags.writeable = False
+    return table
+
+
+@_table_cache
+def _group_fragments(scale: int) -> npt.NDArray[np.object_]:
+    """Fragments of a group of thousands or above, as a (3, 1000) array.
+
+    Row 0 holds the group when it is the first part of the number.
+    Row 1 holds the group when it follows another group, with its separator.
+    Row 2 holds the group when it also ends the number, with the "and" separator.
+    """
+    groups = _group_table(scale)
+    table = np.empty((3, 1000), dtype=object)
+    table[:, 0] = ""
+    for t in range(1, 1000):
+        table[0, t] = groups[t]
+        table[1, t] = f" {groups[t]}"
+        table[2, t] = f" ו{groups[t]}"  # noqa: RUF001
+    table.flags.writeable = False
+    return table
+
+
+def _as_integer_array(numbers: object) -> _IntegerArray:
+    """Convert to an int64 or uint64 array, rejecting non-integer input.
+
+    Anything `np.asarray` accepts is accepted, such as a `pa.Array`.
+    """
+    arr = np.asarray(numbers)
+    if np.issubdtype(arr.dtype, np.unsignedinteger):
+        return arr.astype(np.uint64, copy=False)
+    if np.issubdtype(arr.dtype, np.signedinteger):
+        return arr.astype(np.int64, copy=False)
+    raise TypeError(f"Expected an integer array, got dtype {arr.dtype}")
+
+
+def factorize(
+    numbers: npt.ArrayLike,
+) -> tuple[npt.NDArray[np.intp], _IntegerArray]:
+    """Encode an integer array as indices into the array of its distinct values.
+
+    Like `hebrew_numbers.factorize` and `pandas.factorize`, the distinct values are
+    listed in the order of their first occurrence, in C order.
+    Converting the distinct values gives a dictionary-encoded result: each string is
+    created once, and the codes map the numbers to their strings.
+
+    Returns:
+        The codes, an index array in the shape of `numbers`, and the distinct values.
+
+    Raises:
+        TypeError: If `numbers` is not an integer array.
+
+    Examples:
+        >>> codes, uniques = factorize(np.array([5, 3, 5, 5]))
+        >>> codes, uniques
+        (array([0, 1, 0, 0]), array([5, 3]))
+        >>> ordinal_numbers(uniques, "f")[codes]
+        array(['חמישית', 'שלישית', 'חמישית', 'חמישית'], dtype=object)
+    """
+    arr = _as_integer_array(numbers)
+    sorted_uniques, first, codes = np.unique(
+        arr.ravel(), return_index=True, return_inverse=True
+    )
+    # reorder the sorted distinct values by their first occurrence
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[codes].reshape(arr.shape), cast("_IntegerArray", sorted_uniques[order])
+
+
+def _deduplicated(
+    arr: _IntegerArray,
+    convert: Callable[[_IntegerArray], npt.NDArray[np.object_]],
+) -> npt.NDArray[np.object_]:
+    """Convert the distinct numbers once, and scatter their strings back."""
+    codes, uniques = factorize(arr)
+    return convert(uniques)[codes]
+
+
+def _cardinal(
+    magnitudes: npt.NDArray[np.uint64],
+    grammatical_gender: GrammaticalGender,
+    construct_state: ConstructState,
+) -> npt.NDArray[np.object_]:
+    """Translate an array of positive integers, without validating the input."""
+    rest, low = np.divmod(magnitudes, np.uint64(1000))
+    has_groups = rest > 0
+    result = _low_fragments(grammatical_gender, construct_state)[
+        has_groups.astype(np.intp), low
+    ]
+    # walk the groups from low to high, prepending each one
+    ends_number = low == 0
+    scale = 1
+    while has_groups.any():
+        rest, t = np.divmod(rest, np.uint64(1000))
+        has_higher = rest > 0
+        variant = has_higher * (1 + ends_number).astype(np.intp)
+        result = _group_fragments(scale)[variant, t] + result
+        ends_number &= t == 0
+        has_groups = has_higher
+        scale += 1
+    return result
+
+
+def _magnitudes(
+    arr: _IntegerArray,
+) -> npt.NDArray[np.uint64]:
+    """Convert a non-negative integer array to uint64."""
+    return arr.astype(np.uint64, copy=False)
+
+
+def _check_positive(arr: _IntegerArray) -> None:
+    if arr.size and np.min(arr) <= 0:
+        raise InvalidNumberError("Number must be positive")
+
+
+def cardinal_numbers(
+    numbers: npt.ArrayLike,
+    gender: GrammaticalGender | str,
+    construct: ConstructState | bool,  # noqa: FBT001
+    *,
+    dedup: bool = False,
+) -> npt.NDArray[np.object_]:
+    """Translate an integer array into cardinal numbers (מספר מונה).
+
+    The numbers are split into triads with vectorized integer division, and the
+    words are gathered from precomputed tables, without a Python loop per item.
+
+    Args:
+        numbers: Array of positive integers.
+        gender: Grammatical gender of all the numbers.
+        construct: Construct state of all the numbers.
+        dedup: Whether to convert each distinct number once, and share its string
+            between its occurrences. This is much faster for columns with few
+            distinct values, at the cost of sorting the numbers.
+
+    Returns:
+        An object array of strings, in the shape of `numbers`.
+        Use `.astype(np.dtypes.StringDType())` for a NumPy string array.
+
+    Raises:
+        InvalidNumberError: If any of the numbers is not positive.
+        TypeError: If `numbers` is not an integer array.
+        ValueError: If construct is `ConstructState.CONSTRUCT79`, which is only used
+            for parts of numbers.
+
+    Examples:
+        >>> cardinal_numbers(np.array([3, 1234, 2_000_005]), "m", construct=False)
+        array(['שלושה', 'אלף מאתיים שלושים וארבעה', 'שני מיליון וחמישה'],
+              dtype=object)
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    construct_state = ConstructState.from_boolean(construct)
+    if construct_state == ConstructState.CONSTRUCT79:
+        raise ValueError("Cannot vectorize CONSTRUCT79")
+    arr = _as_integer_array(numbers)
+    if dedup:
+        return _deduplicated(
+            arr,
+            functools.partial(
+                cardinal_numbers, gender=grammatical_gender, construct=construct_state
+            ),
+        )
+    _check_positive(arr)
+    return _cardinal(_magnitudes(arr), grammatical_gender, construct_state)
+
+
+def indefinite_numbers(
+    numbers: npt.ArrayLike, *, dedup: bool = False
+) -> npt.NDArray[np.object_]:
+    """Create indefinite numbers (מספר סתמי) for an integer array.
+
+    See `cardinal_numbers` for `dedup`.
+
+    Examples:
+        >>> indefinite_numbers(np.array([-3, 0, 12]))
+        array(['מינוס שָלוש', 'אפס', 'שתים־עשרה'], dtype=object)
+    """
+    arr = _as_integer_array(numbers)
+    if dedup:
+        return _deduplicated(arr, indefinite_numbers)
+    negative = arr < 0
+    # negate through uint64, as the minimal int64 has no positive counterpart
+    magnitudes = _magnitudes(arr).copy()
+    np.negative(magnitudes, out=magnitudes, where=negative)
+    zero = magnitudes == 0
+    magnitudes[zero] = 1
+    result = _cardinal(magnitudes, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)
+    result[negative] = "מינוס " + result[negative]
+    result[zero] = "אפס"
+    return result
+
+
+def ordinal_numbers(
+    numbers: npt.ArrayLike, gender: GrammaticalGender | str, *, dedup: bool = False
+) -> npt.NDArray[np.object_]:
+    """Create ordinal numbers (מספר סודר) for an array of positive integers.
+
+    See `cardinal_numbers` for `dedup`.
+
+    Examples:
+        >>> ordinal_numbers(np.array([1, 2, 11]), "m")
+        array(['ראשון', 'שני', 'אַחַד־עשר'], dtype=object)
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    arr = _as_integer_array(numbers)
+    if dedup:
+        return _deduplicated(
+            arr, functools.partial(ordinal_numbers, gender=grammatical_gender)
+        )
+    _check_positive(arr)
+    result = _cardinal(_magnitudes(arr), grammatical_gender, ConstructState.ABSOLUTE)
+    small = arr <= 10  # noqa: PLR2004
+    ordinals = np.array(["", *_ORDINALS[grammatical_gender]], dtype=object)
+    result[small] = ordinals[arr[small]]
+    return result
+
+
+def count_prefixes(
+    numbers: npt.ArrayLike,
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    dedup: bool = False,
+) -> npt.NDArray[np.object_]:
+    """Generate count prefixes for an array of integers larger than 1.
+
+    See `cardinal_numbers` for `dedup`.
+
+    Examples:
+        >>> count_prefixes(np.array([2, 3, 11]), "f", definite=True)
+        array(['שתי', 'שְלוש', 'אחת־עשרה'], dtype=object)
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    arr = _as_integer_array(numbers)
+    if dedup:
+        return _deduplicated(
+            arr,
+            functools.partial(
+                count_prefixes, gender=grammatical_gender, definite=definite
+            ),
+        )
+    _check_positive(arr)
+    if (arr == 1).any():
+        raise InvalidNumberError("The count-form of number '1' is not a prefix")
+    result = _cardinal(_magnitudes(arr), grammatical_gender, ConstructState.ABSOLUTE)
+    # GRAMMAR RULE: always using construct form for 2, and for definite nouns up to 10
+    construct = (arr <= 10) if definite else (arr == 2)  # noqa: PLR2004
+    result[construct] = _low_fragments(grammatical_gender, ConstructState.CONSTRUCT)[
+        0, arr[construct]
+    ]
+    return result
+
+
+def count_nouns(  # noqa: PLR0913
+    numbers: npt.ArrayLike,
+    singular_form: str,
+    plural_form: str,
+    gender: GrammaticalGender | str,
+    *,
+    definite: bool = False,
+    dedup: bool = False,
+) -> npt.NDArray[np.object_]:
+    """Generate phrases counting a noun, for an array of positive integers.
+
+    See `cardinal_numbers` for `dedup`.
+
+    Examples:
+        >>> count_nouns(np.array([1, 3]), "הילד", "הילדים", "m", definite=True)
+        array(['הילד האֶחָד', 'שלושת הילדים'], dtype=object)
+    """
+    grammatical_gender = GrammaticalGender.from_string(gender)
+    arr = _as_integer_array(numbers)
+    if dedup:
+        return _deduplicated(
+            arr,
+            functools.partial(
+                count_nouns,
+                singular_form=singular_form,
+                plural_form=plural_form,
+                gender=grammatical_gender,
+                definite=definite,
+            ),
+        )
+    _check_positive(arr)
+    one = arr == 1
+    arr = np.where(one, 2, arr)
+    result: npt.NDArray[np.object_] = count_prefixes(
+        arr, grammatical_gender, definite=definite
+    ) + (" " + plural_form)
+    one_str = _join_words(_triad_table(grammatical_gender, ConstructState.ABSOLUTE)[1])
+    result[one] = f"{singular_form} {'ה' if definite else ''}{one_str}"
+    return result
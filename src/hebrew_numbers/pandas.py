@@ -0,0 +1,175 @@
+"""A pandas `.hebrew` accessor for Series of integers.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+try:
+    import pandas as pd
+except ImportError as exc:
+    msg = (
+        "pandas is required for the Hebrew numbers pandas accessor. "
+        "Install with: pip install hebrew-numbers[pandas]"
+    )
+    raise ImportError(msg) from exc
+
+import functools
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from . import hebrew_numbers as _scalar
+from . import numpy as _vectorized
+from .hebrew_numbers import ConstructState, InvalidNumberError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+
+    from .hebrew_numbers import GrammaticalGender
+
+__all__ = ["HebrewAccessor"]
+
+_Dtype = Literal["category", "string"]
+
+
+# above this, a float64 may be a rounded integer
+_MAX_EXACT_FLOAT = 2.0**53
+
+
+def _integral_values(values: npt.NDArray[np.float64]) -> npt.NDArray[np.int64]:
+    """Convert floats without a fractional part to int64.
+
+    Raises:
+        InvalidNumberError: If a value is not an integer, or is not exact as a float.
+    """
+    if not np.all(np.isfinite(values) & (values == np.trunc(values))):
+        raise InvalidNumberError("Number must be an integer")
+    if np.any(np.abs(values) >= _MAX_EXACT_FLOAT):
+        raise InvalidNumberError("Number stored as a float must be below 2^53")
+    return values.astype(np.int64)
+
+
+@pd.api.extensions.register_series_accessor("hebrew")
+class HebrewAccessor:
+    """Convert a Series of integers to Hebrew, as `series.hebrew`.
+
+    Importing this module registers the accessor. Each method converts every
+    distinct value of the Series once, with the vectorized converters of
+    `hebrew_numbers.numpy` (or, for a Series of Python integers, the batch
+    converters), and returns a Series with the same index and name.
+    Missing values stay missing, including in a Series of integers and NaN, which
+    pandas stores as floats.
+
+    The result is categorical by default, holding each distinct string once.
+    With `dtype="string"` it is a `string[pyarrow]` Series, which requires pyarrow.
+
+    Examples:
+        >>> s = pd.Series([3, 1, 3], name="n")
+        >>> s.hebrew.cardinal(gender="f").tolist()
+        ['שָלוש', 'אחת', 'שָלוש']
+        >>> s.hebrew.count("ילד", "ילדים", "m", dtype="string").tolist()
+        ['שלושה ילדים', 'ילד אֶחָד', 'שלושה ילדים']
+    """
+
+    __slots__ = ("_series",)
+
+    def __init__(self, series: pd.Series[int]):
+        """Wrap a Series. Use `series.hebrew` instead."""
+        self._series = series
+
+    def _convert(
+        self,
+        vectorized: Callable[[npt.NDArray[np.int64]], npt.NDArray[np.object_]] | None,
+        batch: Callable[[list[int]], list[str]],
+        dtype: _Dtype,
+    ) -> pd.Series[str]:
+        """Convert the distinct values, and encode the Series with their strings."""
+        if dtype not in {"category", "string"}:
+            raise ValueError(f"Invalid dtype: {dtype}")
+        codes, uniques = pd.factorize(self._series, use_na_sentinel=True)
+        values = np.asarray(uniques)
+        if np.issubdtype(values.dtype, np.floating):
+            # integers with missing values, which pandas stores as floats
+            values = _integral_values(values)
+        if values.dtype == object or vectorized is None:
+            # Python integers, which may not fit in 64 bits, or arguments that
+            # only the batch converters support
+            strings = np.array(batch(values.tolist()), dtype=object)
+        else:
+            strings = vectorized(values)
+        # the converters never give the same string to two distinct numbers
+        categorical = pd.Categorical.from_codes(codes, categories=pd.Index(strings))
+        result: pd.Series[str] = pd.Series(
+            categorical, index=self._series.index, name=self._series.name
+        )
+        if dtype == "string":
+            result = result.astype("string[pyarrow]")
+        return result
+
+    def cardinal(
+        self,
+        gender: GrammaticalGender | str = "f",
+        construct: ConstructState | bool = False,  # noqa: FBT001, FBT002
+        *,
+        dtype: _Dtype = "category",
+    ) -> pd.Series[str]:
+        """Convert to cardinal numbers, like `cardinal_number`."""
+        construct_state = ConstructState.from_boolean(construct)
+        return self._convert(
+            None
+            if construct_state == ConstructState.CONSTRUCT79
+            else functools.partial(
+                _vectorized.cardinal_numbers, gender=gender, construct=construct_state
+            ),
+            functools.partial(
+                _scalar.cardinal_numbers, gender=gender, construct=construct
+            ),
+            dtype,
+        )
+
+    def ordinal(
+        self, gender: GrammaticalGender | str = "f", *, dtype: _Dtype = "category"
+    ) -> pd.Series[str]:
+        """Convert to ordinal numbers, like `ordinal_number`."""
+        return self._convert(
+            functools.partial(_vectorized.ordinal_numbers, gender=gender),
+            functools.partial(_scalar.ordinal_numbers, gender=gender),
+            dtype,
+        )
+
+    def indefinite(self, *, dtype: _Dtype = "category") -> pd.Series[str]:
+        """Convert to indefinite numbers, like `indefinite_number`."""
+        return self._convert(
+            _vectorized.indefinite_numbers, _scalar.indefinite_numbers, dtype
+        )
+
+    def count(
+        self,
+        noun_singular: str,
+        noun_plural: str,
+        gender: GrammaticalGender | str,
+        *,
+        definite: bool = False,
+        dtype: _Dtype = "category",
+    ) -> pd.Series[str]:
+        """Convert to phrases counting a noun, like `count_noun`."""
+        return self._convert(
+            functools.partial(
+                _vectorized.count_nouns,
+                singular_form=noun_singular,
+                plural_form=noun_plural,
+                gender=gender,
+                definite=definite,
+            ),
+            functools.partial(
+                _scalar.count_nouns,
+                singular_form=noun_singular,
+                plural_form=noun_plural,
+                gender=gender,
+                definite=definite,
+            ),
+            dtype,
+        )
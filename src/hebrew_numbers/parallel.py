@@ -0,0 +1,143 @@
+"""Converting many numbers on several cores.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import sys
+from typing import TYPE_CHECKING, Literal
+
+from .formatters import NumberFormatter, _compile_form, _Form
+from .hebrew_numbers import ConstructState, GrammaticalGender, _checked_batch
+
+if TYPE_CHECKING:
+    import multiprocessing.context
+    from collections.abc import Iterable, Sequence
+
+__all__ = ["convert_parallel"]
+
+_Backend = Literal["processes", "interpreters"]
+# the results of a chunk are sent back as a single string, separated by this
+_SEPARATOR = "\n"
+
+
+# the formatter of a worker, compiled once by `_init_worker`.
+# each worker process or interpreter has its own copy of this module.
+_worker_formatter: NumberFormatter | None = None
+
+
+def _init_worker(
+    form: _Form,
+    gender: GrammaticalGender | str | None,
+    construct: ConstructState | bool,  # noqa: FBT001
+    definite: bool,  # noqa: FBT001
+) -> None:
+    global _worker_formatter  # noqa: PLW0603
+    _worker_formatter = _compile_form(form, gender, construct, definite)
+
+
+def _convert_chunk(numbers: Sequence[int]) -> str:
+    """Convert a validated chunk in a worker, into a single string."""
+    assert _worker_formatter is not None  # noqa: S101
+    return _SEPARATOR.join(map(_worker_formatter._format, numbers))  # noqa: SLF001
+
+
+def _chunks(numbers: Sequence[int], chunksize: int) -> Iterable[Sequence[int]]:
+    # slicing a range gives a range, which is sent to the workers in O(1) space
+    return (numbers[i : i + chunksize] for i in range(0, len(numbers), chunksize))
+
+
+_WorkerArgs = tuple[_Form, GrammaticalGender | str | None, ConstructState | bool, bool]
+
+
+def _executor(
+    backend: _Backend,
+    workers: int | None,
+    mp_context: multiprocessing.context.BaseContext | None,
+    initargs: _WorkerArgs,
+) -> concurrent.futures.Executor:
+    """Create the pool of workers of a validated backend."""
+    if backend == "interpreters":  # noqa: SIM102
+        if sys.version_info >= (3, 14):
+            return concurrent.futures.InterpreterPoolExecutor(
+                workers, initializer=_init_worker, initargs=initargs
+            )
+    return concurrent.futures.ProcessPoolExecutor(
+        workers, mp_context, initializer=_init_worker, initargs=initargs
+    )
+
+
+def convert_parallel(  # noqa: PLR0913
+    numbers: Iterable[int],
+    form: _Form = "cardinal",
+    *,
+    gender: GrammaticalGender | str | None = None,
+    construct: ConstructState | bool = False,
+    definite: bool = False,
+    workers: int | None = None,
+    chunksize: int = 50_000,
+    backend: _Backend = "processes",
+    mp_context: multiprocessing.context.BaseContext | None = None,
+    out: list[str] | None = None,
+) -> list[str]:
+    """Convert many numbers in a pool of worker processes or interpreters.
+
+    Each worker compiles the formatter of the form once, when it starts.
+    The module keeps no other state, so a worker interpreter only has to import
+    the package and build the tables of one form, which takes a few milliseconds.
+    The numbers are sent in chunks (a `range` is sent as sub-ranges), and the
+    results of each chunk come back as a single string, in the order of `numbers`.
+    A batch that fits in a single chunk is converted in the calling process.
+
+    Args:
+        numbers: Integers to convert.
+        form: One of "cardinal", "indefinite", "ordinal" and "count_prefix",
+            converting like `cardinal_number`, `indefinite_number`, `ordinal_number`
+            and `count_prefix`.
+        gender: Grammatical gender, required by all forms but "indefinite".
+        construct: Construct state of the "cardinal" form.
+        definite: Definiteness of the "count_prefix" form.
+        workers: Number of workers. Defaults to the number of processors.
+        chunksize: Number of numbers sent to a worker at a time.
+        backend: "processes" for a `ProcessPoolExecutor`, or "interpreters" for an
+            `InterpreterPoolExecutor` (Python 3.14 and later), which runs each
+            worker in a subinterpreter of the calling process.
+        mp_context: Multiprocessing context used to start the worker processes.
+        out: List to append the results to. A new list is used by default.
+
+    Returns:
+        The list of results.
+
+    Raises:
+        InvalidNumberError: If any of the numbers is not supported by the form.
+            Nothing is converted in that case.
+        ValueError: If the form is invalid or requires a missing gender, or if the
+            backend is invalid or not supported by this version of Python.
+
+    Examples:
+        >>> convert_parallel(range(1, 4), "ordinal", gender="f")
+        ['ראשונה', 'שנייה', 'שלישית']
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    if backend == "interpreters":
+        if mp_context is not None:
+            raise ValueError("mp_context is only used by the processes backend")
+        if sys.version_info < (3, 14):
+            raise ValueError("The interpreters backend requires Python 3.14 or later")
+    elif backend != "processes":
+        raise ValueError(f"Invalid backend: {backend}")
+    formatter = _compile_form(form, gender, construct, definite)
+    batch = _checked_batch(numbers, formatter._check)  # noqa: SLF001
+    if out is None:
+        out = []
+    if len(batch) <= chunksize or workers == 1:
+        out.extend(map(formatter._format, batch))  # noqa: SLF001
+        return out
+    initargs: _WorkerArgs = (form, gender, construct, definite)
+    with _executor(backend, workers, mp_context, initargs) as executor:
+        for text in executor.map(_convert_chunk, _chunks(batch, chunksize)):
+            out.extend(text.split(_SEPARATOR))
+    return out
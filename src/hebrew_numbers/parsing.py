@@ -0,0 +1,452 @@
+"""Parsing Hebrew number words back into integers.
+
+© 2025 Tsvika Shapira. Some rights reserved.
+"""
+
+from __future__ import annotations
+
+import enum
+import itertools
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+from .hebrew_numbers import (
+    _DIGITS,
+    _DIGITS_CONSTRUCT79,
+    _ORDINALS,
+    _SCALE_WORDS,
+    _TEENS_SUFFIX,
+    _TEN,
+    _TENS,
+    _TWELVE,
+    ConstructState,
+    GrammaticalGender,
+    _table_cache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__ = ["NumberMatch", "ParsedNumber", "extract_numbers", "parse_number"]
+
+_GENDERS = frozenset(GrammaticalGender)
+_STATES = frozenset({ConstructState.ABSOLUTE, ConstructState.CONSTRUCT})
+
+# niqqud and cantillation marks, without the maqaf and the punctuation marks
+_NIQQUD = dict.fromkeys(set(range(0x0591, 0x05C8)) - {0x05BE, 0x05C0, 0x05C3, 0x05C6})
+
+
+class ParsedNumber(NamedTuple):
+    """The result of `parse_number`.
+
+    Attributes:
+        value: The number.
+        gender: Grammatical gender of the number, or None if the words are the same
+            in both genders.
+        construct: Construct state of the number. It is `ConstructState.ABSOLUTE`
+            unless the words are only used in the construct state.
+    """
+
+    value: int
+    gender: GrammaticalGender | None
+    construct: ConstructState
+
+
+class _Kind(enum.Enum):
+    ZERO = enum.auto()
+    MINUS = enum.auto()
+    ORDINAL = enum.auto()
+    UNIT = enum.auto()
+    TWELVE_UNIT = enum.auto()
+    TEN = enum.auto()
+    TENS = enum.auto()
+    HUNDRED = enum.auto()
+    HUNDREDS = enum.auto()
+    THOUSANDS = enum.auto()
+    SCALE = enum.auto()
+
+
+class _Word(NamedTuple):
+    kind: _Kind
+    value: int
+    genders: frozenset[GrammaticalGender] = _GENDERS
+    states: frozenset[ConstructState] = _STATES
+    # the gender of 11-19 when this word is their suffix, e.g. 'עשרה'
+    teen_gender: GrammaticalGender | None = None
+
+
+def _strip_niqqud(word: str) -> str:
+    return word.translate(_NIQQUD)
+
+
+@_table_cache
+def _vocabulary() -> tuple[dict[str, _Word], dict[str, _Word]]:
+    """Index every number word, as written and without niqqud.
+
+    The index is built once, on first use, from the tables used for conversion.
+    A word that has several readings of the same value (e.g. 'שמונה' in both
+    genders) gets a single entry that allows all of them. Otherwise the cardinal
+    reading is kept, so that 'שני' is read as a cardinal in construct state.
+    """
+    words: list[tuple[str, _Word]] = [("אפס", _Word(_Kind.ZERO, 0))]
+    words.append(("מינוס", _Word(_Kind.MINUS, 0)))
+    for (gender, state), digits in _DIGITS.items():
+        words.extend(
+            (digit, _Word(_Kind.UNIT, i, frozenset({gender}), frozenset({state})))
+            for i, digit in enumerate(digits, 1)
+        )
+    words.extend(
+        (digit, _Word(_Kind.UNIT, i, frozenset({GrammaticalGender.FEMININE})))
+        for i, digit in _DIGITS_CONSTRUCT79.items()
+    )
+    words.extend(
+        (word, _Word(_Kind.TWELVE_UNIT, 2, frozenset({gender})))
+        for gender, word in _TWELVE.items()
+    )
+    teen_genders = {
+        suffix.removeprefix("־"): gender for gender, suffix in _TEENS_SUFFIX.items()
+    }
+    words.extend(
+        (
+            word,
+            _Word(
+                _Kind.TEN,
+                10,
+                frozenset({gender}),
+                frozenset({state}),
+                teen_genders.get(word),
+            ),
+        )
+        for (gender, state), word in _TEN.items()
+    )
+    words.extend(
+        (word, _Word(_Kind.TENS, 10 * i)) for i, word in enumerate(_TENS) if word
+    )
+    words.append(("מאה", _Word(_Kind.HUNDRED, 100)))
+    words.append(("מאתיים", _Word(_Kind.HUNDRED, 200)))
+    words.append(("מאות", _Word(_Kind.HUNDREDS, 100)))
+    words.append(("אלפיים", _Word(_Kind.THOUSANDS, 2)))
+    words.append(("אלפים", _Word(_Kind.THOUSANDS, 0)))
+    words.extend(
+        (word, _Word(_Kind.SCALE, k)) for k, word in enumerate(_SCALE_WORDS) if word
+    )
+    words.extend(
+        (word, _Word(_Kind.ORDINAL, i, frozenset({gender}), frozenset()))
+        for gender, ordinals in _ORDINALS.items()
+        for i, word in enumerate(ordinals, 1)
+    )
+
+    exact: dict[str, _Word] = {}
+    stripped: dict[str, _Word] = {}
+    for word, entry in words:
+        for index, key in [(exact, word), (stripped, _strip_niqqud(word))]:
+            old = index.setdefault(key, entry)
+            if old is not entry and (old.kind, old.value) == (entry.kind, entry.value):
+                index[key] = old._replace(
+                    genders=old.genders | entry.genders,
+                    states=old.states | entry.states,
+                )
+    return exact, stripped
+
+
+def _find(
+    word: str, exact: dict[str, _Word], stripped: dict[str, _Word]
+) -> _Word | None:
+    # niqqud marks are not letters, so a word of letters only is already stripped
+    if word.isalpha():
+        return stripped.get(word)
+    return exact.get(word) or stripped.get(_strip_niqqud(word))
+
+
+def _lookup(word: str) -> tuple[_Word, int] | None:
+    """Find a word, with or without niqqud and the "and" prefix (ו).
+
+    Returns:
+        The entry of the word and the length of its prefix, or None.
+    """  # noqa: RUF002
+    exact, stripped = _vocabulary()
+    entry = _find(word, exact, stripped)
+    if entry is not None:
+        return entry, 0
+    if word.startswith("ו"):  # noqa: RUF001
+        entry = _find(word[1:], exact, stripped)
+        if entry is not None:
+            return entry, 1
+    return None
+
+
+def _single_gender(genders: frozenset[GrammaticalGender]) -> GrammaticalGender | None:
+    return next(iter(genders)) if len(genders) == 1 else None
+
+
+class _NumberReader:
+    """Reads the words of a number one at a time, from left to right."""
+
+    __slots__ = (
+        "_fixed",
+        "_genders",
+        "_group",
+        "_last_scale",
+        "_negative",
+        "_previous",
+        "_states",
+        "_total",
+    )
+
+    def __init__(self) -> None:
+        self._fixed: ParsedNumber | None = None
+        self._negative = False
+        self._total = 0
+        self._group = 0
+        self._last_scale = len(_SCALE_WORDS)
+        self._genders = _GENDERS
+        self._states = _STATES
+        self._previous: _Kind | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether any word was read."""
+        return self._previous is not None
+
+    def feed(self, entry: _Word) -> bool:  # noqa: C901, PLR0911, PLR0912, PLR0915
+        """Read the next word, unless it cannot continue the number.
+
+        Returns:
+            Whether the word was read. If not, the reader is unchanged.
+        """
+        kind = entry.kind
+        previous = self._previous
+        group = self._group
+        total = self._total
+        last_scale = self._last_scale
+        genders = self._genders
+        states = self._states
+        if self._fixed is not None:
+            return False
+        if previous == _Kind.TWELVE_UNIT and entry.teen_gender is None:
+            return False
+        if kind in {_Kind.ZERO, _Kind.ORDINAL}:
+            if previous is not None:
+                return False
+            gender = _single_gender(entry.genders)
+            self._fixed = ParsedNumber(entry.value, gender, ConstructState.ABSOLUTE)
+        elif kind == _Kind.MINUS:
+            if previous is not None:
+                return False
+            self._negative = True
+        elif kind == _Kind.TEN and previous in {_Kind.UNIT, _Kind.TWELVE_UNIT}:
+            if entry.teen_gender is None or group % 100 >= 10:  # noqa: PLR2004
+                return False
+            # GRAMMAR RULE: the suffix of 11-19 decides the gender of the number
+            group += 10
+            genders = frozenset({entry.teen_gender})
+            states = _STATES
+        elif kind in {_Kind.UNIT, _Kind.TWELVE_UNIT}:
+            if group % 10 or group % 100 == 10:  # noqa: PLR2004
+                return False
+            group += entry.value
+            genders &= entry.genders
+            states &= entry.states
+        elif kind in {_Kind.TEN, _Kind.TENS}:
+            if group % 100:
+                return False
+            group += entry.value
+            genders &= entry.genders
+            states &= entry.states
+        elif kind == _Kind.HUNDRED:
+            if group:
+                return False
+            group = entry.value
+        elif kind == _Kind.HUNDREDS:
+            if previous != _Kind.UNIT or not 3 <= group <= 9:  # noqa: PLR2004
+                return False
+            group *= 100
+            genders = _GENDERS
+            states = _STATES
+        else:
+            if kind == _Kind.SCALE:
+                scale, multiplier = entry.value, group or 1
+            elif entry.value:  # 'אלפיים' has its own multiplier
+                scale, multiplier = 1, 0 if group else entry.value
+            else:
+                # GRAMMAR RULE: 'אלפים' follows the construct form of 3 to 10
+                scale, multiplier = 1, group if 3 <= group <= 10 else 0  # noqa: PLR2004
+            if not multiplier or scale >= last_scale:
+                return False
+            total += multiplier * 1000**scale
+            group = 0
+            last_scale = scale
+            genders = _GENDERS
+            states = _STATES
+        self._previous = kind
+        self._group = group
+        self._total = total
+        self._last_scale = last_scale
+        self._genders = genders
+        self._states = states
+        return True
+
+    def result(self) -> ParsedNumber | None:
+        """Return the number read so far, or None if it is incomplete."""
+        if self._fixed is not None:
+            return self._fixed
+        if self._previous in {None, _Kind.MINUS, _Kind.TWELVE_UNIT}:
+            return None
+        value = self._total + self._group
+        construct = (
+            ConstructState.CONSTRUCT
+            if ConstructState.ABSOLUTE not in self._states
+            else ConstructState.ABSOLUTE
+        )
+        return ParsedNumber(
+            -value if self._negative else value,
+            _single_gender(self._genders),
+            construct,
+        )
+
+
+def parse_number(text: str) -> ParsedNumber:
+    """Parse the Hebrew words of a number.
+
+    Reverses `cardinal_number`, `indefinite_number`, `ordinal_number` and
+    `count_prefix`. The words are looked up in an index of the vocabulary used
+    for conversion, and are read in a single pass, from left to right.
+    Niqqud is optional, the "and" prefix (vav) is accepted on any word,
+    and a maqaf, a hyphen or a space can separate the parts of 11-19.
+
+    Args:
+        text: The words of the number.
+
+    Returns:
+        The number, with the gender and construct state of its words.
+
+    Raises:
+        ValueError: If the text is not a number.
+
+    Examples:
+        >>> parse_number("שלושת אלפים מאתיים וחמש")
+        ParsedNumber(value=3205, gender=<GrammaticalGender.FEMININE: 'f'>, \
+construct=<ConstructState.ABSOLUTE: 'absolute'>)
+        >>> parse_number("מינוס שבעה עשר").value
+        -17
+        >>> parse_number("שלושת").construct
+        <ConstructState.CONSTRUCT: 'construct'>
+        >>> parse_number("מאה").gender is None
+        True
+    """
+    reader = _NumberReader()
+    for word in text.replace("־", " ").replace("-", " ").split():
+        found = _lookup(word)
+        if found is None:
+            raise ValueError(f"Not a number word: {word!r}")
+        if not reader.feed(found[0]):
+            raise ValueError(f"Unexpected {word!r}")
+    result = reader.result()
+    if result is None:
+        raise ValueError(f"Not a number: {text!r}")
+    return result
+
+
+class NumberMatch(NamedTuple):
+    """A number found by `extract_numbers`.
+
+    Attributes:
+        span: The start and end offsets of the number in the text.
+        value: The number.
+        gender: Grammatical gender of the number, or None if the words are the same
+            in both genders.
+    """
+
+    span: tuple[int, int]
+    value: int
+    gender: GrammaticalGender | None
+
+
+# a word is a run of Hebrew letters and niqqud
+_WORD_PATTERN = re.compile(r"[\u05d0-\u05ea\u0591-\u05bd\u05bf-\u05c7]+")
+# the words of a number are separated by spaces, a maqaf or a hyphen
+_SEPARATOR_PATTERN = re.compile(r"[\s\-\u05be]*")
+
+
+def _match(reader: _NumberReader, start: int, end: int) -> NumberMatch | None:
+    result = reader.result()
+    if result is None:
+        return None
+    return NumberMatch((start, end), result.value, result.gender)
+
+
+def extract_numbers(  # noqa: C901, PLR0912
+    stream: str | Iterable[str],
+) -> Iterator[NumberMatch]:
+    """Find the numbers written in words in a text.
+
+    The text is read in chunks, such as the lines of a file, and only the last
+    word of a chunk is kept until the next one arrives, so a number may cross
+    chunk boundaries. Each word is looked up once, in the index used by
+    `parse_number`, and the words of a number are read as they arrive, with no
+    backtracking. Consecutive number words that cannot form a single number,
+    e.g. 'שלושה ארבעה', are reported as separate numbers.
+
+    Args:
+        stream: The text, or an iterable of its chunks.
+
+    Yields:
+        The numbers, in the order of the text. Spans are offsets in the whole
+        text, and exclude the "and" prefix of the first word.
+
+    Examples:
+        >>> for match in extract_numbers(["נולדו לה שלו", "שה ילדים ואלף נכדים"]):
+        ...     print(match.span, match.value, match.gender)
+        (9, 14) 3 m
+        (22, 25) 1000 None
+    """
+    chunks = [stream] if isinstance(stream, str) else stream
+    reader = _NumberReader()
+    start = end = 0
+    carry = ""
+    offset = 0
+    for chunk, final in itertools.chain(
+        ((chunk, False) for chunk in chunks), [("", True)]
+    ):
+        buf = carry + chunk
+        stop = len(buf)
+        consumed = 0
+        for word in _WORD_PATTERN.finditer(buf):
+            if word.end() == len(buf) and not final:
+                # the word may continue in the next chunk
+                stop = word.start()
+                break
+            if reader.started and not _SEPARATOR_PATTERN.fullmatch(
+                buf, consumed, word.start()
+            ):
+                if match := _match(reader, start, end):
+                    yield match
+                reader = _NumberReader()
+            consumed = word.end()
+            found = _lookup(word.group())
+            if found is None:
+                if reader.started:
+                    if match := _match(reader, start, end):
+                        yield match
+                    reader = _NumberReader()
+                continue
+            entry, prefix = found
+            first = not reader.started
+            if not reader.feed(entry):
+                if match := _match(reader, start, end):
+                    yield match
+                reader = _NumberReader()
+                if not reader.feed(entry):
+                    continue
+                first = True
+            if first:
+                start = offset + word.start() + prefix
+            end = offset + word.end()
+        if reader.started and not _SEPARATOR_PATTERN.fullmatch(buf, consumed, stop):
+            if match := _match(reader, start, end):
+                yield match
+            reader = _NumberReader()
+        offset += stop
+        carry = buf[stop:]
+    if match := _match(reader, start, end):
+        yield match
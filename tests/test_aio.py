@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from hebrew_numbers import (
+    InvalidNumberError,
+    cardinal_numbers,
+    compile_cardinal,
+    count_nouns,
+    count_prefixes,
+    indefinite_numbers,
+    ordinal_numbers,
+)
+from hebrew_numbers.aio import (
+    acardinal_numbers,
+    acount_nouns,
+    acount_prefixes,
+    aformat_many,
+    aindefinite_numbers,
+    aiter_format,
+    aordinal_numbers,
+)
+
+NUMBERS = [*range(1, 3000), *(7 * 10**k + 13 for k in range(3, 66))]
+
+
+def test_async_matches_batch() -> None:
+    async def convert() -> list[list[str]]:
+        return [
+            await acardinal_numbers(NUMBERS, "f", construct=True, yield_every=7),
+            await aindefinite_numbers(NUMBERS, yield_interval=1e-6),
+            await aordinal_numbers(NUMBERS, "m"),
+            await acount_prefixes(NUMBERS[1:], "m", definite=True),
+            await acount_nouns(NUMBERS, "ילדה", "ילדות", "f"),
+        ]
+
+    assert asyncio.run(convert()) == [
+        cardinal_numbers(NUMBERS, "f", construct=True),
+        indefinite_numbers(NUMBERS),
+        ordinal_numbers(NUMBERS, "m"),
+        count_prefixes(NUMBERS[1:], "m", definite=True),
+        count_nouns(NUMBERS, "ילדה", "ילדות", "f"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("yield_every", "yield_interval", "min_yields"),
+    [(100, None, 30), (10**6, 1e-9, 40), (10**6, None, 0)],
+)
+def test_async_yields_to_loop(
+    yield_every: int, yield_interval: float | None, min_yields: int
+) -> None:
+    async def convert() -> tuple[list[str], int]:
+        ticks = 0
+        done = False
+
+        async def tick() -> None:
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        start = ticks
+        results = await aformat_many(
+            compile_cardinal("m", construct=False),
+            NUMBERS,
+            yield_every=yield_every,
+            yield_interval=yield_interval,
+        )
+        done = True
+        await ticker
+        return results, ticks - start
+
+    results, ticks = asyncio.run(convert())
+    assert results == cardinal_numbers(NUMBERS, "m", construct=False)
+    assert ticks >= min_yields
+    if min_yields == 0:
+        assert ticks <= 1
+
+
+@pytest.mark.parametrize("offload_above", [0, 10**6])
+def test_async_offload(offload_above: int) -> None:
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        results = asyncio.run(
+            acardinal_numbers(
+                NUMBERS,
+                "f",
+                construct=False,
+                executor=executor,
+                offload_above=offload_above,
+                out=["x"],
+            )
+        )
+    assert results == ["x", *cardinal_numbers(NUMBERS, "f", construct=False)]
+
+
+def test_aiter_format() -> None:
+    async def collect() -> list[str]:
+        formatter = compile_cardinal("f", construct=False)
+        return [text async for text in aiter_format(formatter, NUMBERS, yield_every=5)]
+
+    assert asyncio.run(collect()) == cardinal_numbers(NUMBERS, "f", construct=False)
+
+
+def test_async_invalid() -> None:
+    formatter = compile_cardinal("f", construct=False)
+    with pytest.raises(InvalidNumberError):
+        asyncio.run(aformat_many(formatter, [1, 0]))
+    out = ["x"]
+    with pytest.raises(InvalidNumberError):
+        asyncio.run(aformat_many(formatter, iter([1, 0]), offload_above=0, out=out))
+    assert out == ["x"]
+    with pytest.raises(ValueError, match="yield_every"):
+        asyncio.run(aformat_many(formatter, [1], yield_every=0))
+    with pytest.raises(ValueError, match="yield_interval"):
+        asyncio.run(aformat_many(formatter, [1], yield_interval=0))
+
+    async def collect() -> list[str]:
+        return [text async for text in aiter_format(formatter, [1, 0])]
+
+    with pytest.raises(InvalidNumberError):
+        asyncio.run(collect())
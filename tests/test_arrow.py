@@ -0,0 +1,126 @@
+"""Tests for the Arrow output."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import numpy as np
+import pyarrow as pa
+
+from hebrew_numbers import ConstructState, InvalidNumberError
+from hebrew_numbers import arrow as hn_pa
+from hebrew_numbers import numpy as hn_np
+
+rng = np.random.default_rng(0)
+INT64 = np.iinfo(np.int64)
+NUMBERS = np.concatenate(
+    [
+        np.arange(-2100, 2100),
+        rng.integers(INT64.min, INT64.max, size=3000),
+        10 ** np.arange(19),
+        [INT64.min, INT64.max],
+    ]
+)
+POSITIVE = np.concatenate(
+    [np.abs(NUMBERS[NUMBERS > 1]).astype(np.uint64), [np.iinfo(np.uint64).max]]
+)
+
+
+def test_to_arrow_indefinite() -> None:
+    result = hn_pa.to_arrow(NUMBERS, "indefinite")
+    result.validate(full=True)
+    assert result.type == pa.string()
+    assert result.to_pylist() == hn_np.indefinite_numbers(NUMBERS).tolist()
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+def test_to_arrow_forms(gender: str) -> None:
+    for construct in [False, True]:
+        assert (
+            hn_pa.to_arrow(POSITIVE, gender=gender, construct=construct).to_pylist()
+            == hn_np.cardinal_numbers(POSITIVE, gender, construct).tolist()
+        )
+    assert (
+        hn_pa.to_arrow(POSITIVE, "ordinal", gender=gender).to_pylist()
+        == hn_np.ordinal_numbers(POSITIVE, gender).tolist()
+    )
+    for definite in [False, True]:
+        assert (
+            hn_pa.to_arrow(
+                POSITIVE, "count_prefix", gender=gender, definite=definite
+            ).to_pylist()
+            == hn_np.count_prefixes(POSITIVE, gender, definite=definite).tolist()
+        )
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize(
+    "construct", [ConstructState.ABSOLUTE, ConstructState.CONSTRUCT]
+)
+def test_to_arrow_construct_state(gender: str, construct: ConstructState) -> None:
+    numbers = np.array([3, 5, 17, 1234])
+    assert (
+        hn_pa.to_arrow(numbers, gender=gender, construct=construct).to_pylist()
+        == hn_np.cardinal_numbers(numbers, gender, construct).tolist()
+    )
+
+
+def test_to_arrow_chunks_and_large(monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = hn_np.indefinite_numbers(NUMBERS).tolist()
+    monkeypatch.setattr(hn_pa, "_CHUNK_SIZE", 7)
+    assert hn_pa.to_arrow(NUMBERS, "indefinite").to_pylist() == expected
+    monkeypatch.setattr(hn_pa, "_MAX_STRING_BYTES", 100)
+    result = hn_pa.to_arrow(NUMBERS, "indefinite")
+    result.validate(full=True)
+    assert result.type == pa.large_string()
+    assert result.to_pylist() == expected
+
+
+def test_to_arrow_dictionary() -> None:
+    numbers = np.array([5, 3, 5, 5, 1000])
+    result = hn_pa.to_arrow(numbers, gender="m", dictionary=True)
+    assert isinstance(result, pa.DictionaryArray)
+    assert len(result.dictionary) == 3
+    assert result.dictionary_decode().to_pylist() == (
+        hn_np.cardinal_numbers(numbers, "m", construct=False).tolist()
+    )
+
+
+def test_to_arrow_nulls() -> None:
+    numbers = pa.array([3, None, -3, None], pa.int8())
+    expected = ["שָלוש", None, "מינוס שָלוש", None]
+    result = hn_pa.to_arrow(numbers, "indefinite")
+    result.validate(full=True)
+    assert result.to_pylist() == expected
+    encoded = hn_pa.to_arrow(numbers, "indefinite", dictionary=True)
+    assert encoded.dictionary_decode().to_pylist() == expected
+    assert len(encoded.dictionary) == 2
+    # the nulls do not have to be supported numbers
+    assert hn_pa.to_arrow(
+        pa.array([None, 2]), "count_prefix", gender="f"
+    ).to_pylist() == [None, "שתי"]
+
+
+def test_to_arrow_empty() -> None:
+    assert hn_pa.to_arrow(np.array([], dtype=np.int64), gender="f").to_pylist() == []
+
+
+def test_to_arrow_invalid() -> None:
+    with pytest.raises(InvalidNumberError, match="positive"):
+        hn_pa.to_arrow(np.array([1, 0]), gender="f")
+    with pytest.raises(InvalidNumberError, match="'1'"):
+        hn_pa.to_arrow(pa.array([1, 2]), "count_prefix", gender="f")
+    with pytest.raises(TypeError, match="integer array"):
+        hn_pa.to_arrow(np.array([1.5]), gender="f")
+    with pytest.raises(TypeError, match="integer array"):
+        hn_pa.to_arrow(pa.array(["1"]), gender="f")
+    with pytest.raises(ValueError, match="1-D"):
+        hn_pa.to_arrow(np.ones((2, 2), dtype=int), gender="f")
+    with pytest.raises(ValueError, match="requires a gender"):
+        hn_pa.to_arrow(np.array([1]), "ordinal")
+    with pytest.raises(ValueError, match="CONSTRUCT79"):
+        hn_pa.to_arrow(np.array([1]), gender="f", construct=ConstructState.CONSTRUCT79)
+    with pytest.raises(ValueError, match="Invalid form"):
+        hn_pa.to_arrow(np.array([1]), "roman", gender="f")  # type: ignore[call-overload]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from hebrew_numbers import (
+    ConstructState,
+    ConversionCache,
+    GrammaticalGender,
+    InvalidNumberError,
+    cardinal_number,
+    count_noun,
+    count_prefix,
+    indefinite_number,
+    ordinal_number,
+)
+
+
+def test_results_match_uncached() -> None:
+    cache = ConversionCache()
+    for n in [1, 2, 3, 11, 22, 1000, 123456]:
+        for _ in range(2):
+            assert cache.cardinal_number(n, "f", construct=True) == cardinal_number(
+                n, "f", construct=True
+            )
+            assert cache.indefinite_number(n) == indefinite_number(n)
+            assert cache.ordinal_number(n, "m") == ordinal_number(n, "m")
+            assert cache.count_noun(n, "ילד", "ילדים", "m") == count_noun(
+                n, "ילד", "ילדים", "m"
+            )
+            if n != 1:
+                assert cache.count_prefix(n, "f", definite=True) == count_prefix(
+                    n, "f", definite=True
+                )
+    info = cache.cache_info()
+    assert info.misses == info.currsize
+    assert info.hits == info.misses
+
+
+@pytest.mark.parametrize("gender", ["m", "male", "MASCULINE", "זכר", "ז", "Masc"])
+def test_gender_aliases_share_entry(gender: str) -> None:
+    cache = ConversionCache()
+    cache.cardinal_number(5, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE)
+    cache.cardinal_number(5, gender, construct=False)
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().currsize == 1
+
+
+def test_maxsize_evicts_least_recently_used() -> None:
+    cache = ConversionCache(maxsize=2)
+    cache.indefinite_number(1)
+    cache.indefinite_number(2)
+    cache.indefinite_number(1)
+    cache.indefinite_number(3)
+    assert cache.cache_info().currsize == 2
+    cache.indefinite_number(1)
+    assert cache.cache_info().hits == 2
+    cache.indefinite_number(2)
+    assert cache.cache_info().hits == 2
+
+
+def test_maxbytes() -> None:
+    size = sys.getsizeof(indefinite_number(3))
+    cache = ConversionCache(maxsize=None, maxbytes=size * 2)
+    for n in [3, 4, 5, 6]:
+        cache.indefinite_number(n)
+    info = cache.cache_info()
+    assert info.currbytes <= size * 2
+    assert info.currsize < 4
+    cache = ConversionCache(maxbytes=1)
+    cache.indefinite_number(3)
+    assert cache.cache_info().currsize == 0
+
+
+def test_maxsize_zero() -> None:
+    cache = ConversionCache(maxsize=0)
+    assert cache.indefinite_number(3) == indefinite_number(3)
+    assert cache.cache_info().currsize == 0
+
+
+def test_errors_are_not_cached() -> None:
+    cache = ConversionCache()
+    for _ in range(2):
+        with pytest.raises(InvalidNumberError):
+            cache.cardinal_number(0, "f", construct=False)
+    assert cache.cache_info().currsize == 0
+    assert cache.cache_info().misses == 2
+
+
+def test_non_integers_are_not_cached_as_integers() -> None:
+    cache = ConversionCache()
+    cache.cardinal_number(1, "m", construct=False)
+    with pytest.raises(TypeError):
+        cache.cardinal_number(1.0, "m", construct=False)  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        cache.indefinite_number(1.0)  # type: ignore[arg-type]
+    # a bool is an int, and shares the entry of its value
+    one = True
+    assert cache.cardinal_number(one, "m", construct=False) == cardinal_number(
+        1, "m", construct=False
+    )
+    assert cache.cache_info().currsize == 1
+
+
+def test_cache_clear() -> None:
+    cache = ConversionCache()
+    cache.indefinite_number(3)
+    cache.indefinite_number(3)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 1024, 0, None, 0)
+
+
+@pytest.mark.parametrize(("maxsize", "maxbytes"), [(-1, None), (None, -1)])
+def test_negative_limits(maxsize: int | None, maxbytes: int | None) -> None:
+    with pytest.raises(ValueError, match="must be non-negative"):
+        ConversionCache(maxsize=maxsize, maxbytes=maxbytes)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import io
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hebrew_numbers import cardinal_numbers, count_nouns, ordinal_numbers
+from hebrew_numbers.cli import app
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NUMBERS = [*range(1, 100), *(7 * 10**k + 13 for k in range(3, 66))]
+
+
+def _lines(results: list[str]) -> bytes:
+    return "".join(f"{text}\n" for text in results).encode()
+
+
+def _stdin(monkeypatch: pytest.MonkeyPatch, data: bytes) -> None:
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+
+def test_cli_stdin(
+    monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes]
+) -> None:
+    _stdin(monkeypatch, b"".join(b"%d\n" % n for n in NUMBERS))
+    assert app(["-g", "f", "--construct"]) == 0
+    assert capsysbinary.readouterr().out == _lines(
+        cardinal_numbers(NUMBERS, "f", construct=True)
+    )
+
+
+def test_cli_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsysbinary: pytest.CaptureFixture[bytes],
+) -> None:
+    monkeypatch.setattr("hebrew_numbers.cli._BATCH_SIZE", 7)
+    path = tmp_path / "numbers.txt"
+    path.write_text("".join(f" {n}\r\n" for n in NUMBERS))
+    _stdin(monkeypatch, b"3\n")
+    assert app(["-f", "ordinal", "-g", "m", str(path), "-", str(path)]) == 0
+    assert capsysbinary.readouterr().out == _lines(
+        ordinal_numbers([*NUMBERS, 3, *NUMBERS], "m")
+    )
+
+
+@pytest.mark.parametrize(
+    ("args", "csv", "numbers"),
+    [
+        (["-c", "2"], "x,1\ny,22\n", [1, 22]),
+        (["-c", "n"], 'name,n\nx,1\n"y,z",22\n', [1, 22]),
+        (["-c", "n", "-d", ";"], "n;name\n1;x\n22;y\n", [1, 22]),
+    ],
+)
+def test_cli_csv_column(
+    args: list[str],
+    csv: str,
+    numbers: list[int],
+    monkeypatch: pytest.MonkeyPatch,
+    capsysbinary: pytest.CaptureFixture[bytes],
+) -> None:
+    _stdin(monkeypatch, csv.encode())
+    assert app(["-f", "count", "-g", "f", "--noun", "ילדה", "ילדות", *args]) == 0
+    assert capsysbinary.readouterr().out == _lines(
+        count_nouns(numbers, "ילדה", "ילדות", "f")
+    )
+
+
+@pytest.mark.parametrize(
+    ("args", "data"),
+    [
+        ([], b"1\n2\n\n 3\r\n \n"),
+        (["-c", "2"], b"a,1\nb,2\nc,\nd, 3\ne\n"),
+    ],
+)
+def test_cli_blank_lines(
+    args: list[str],
+    data: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+    capsysbinary: pytest.CaptureFixture[bytes],
+) -> None:
+    monkeypatch.setattr("hebrew_numbers.cli._BATCH_SIZE", 3)
+    _stdin(monkeypatch, data)
+    assert app(["-g", "f", *args]) == 0
+    assert capsysbinary.readouterr().out == _lines(
+        [*cardinal_numbers([1, 2], "f", construct=False), "", "שָלוש", ""]
+    )
+
+
+@pytest.mark.parametrize(
+    ("args", "data", "error"),
+    [
+        ([], b"1\n2\nx\n", "<stdin>: line 3: Not an integer: 'x'"),
+        (
+            ["-f", "cardinal", "-g", "f"],
+            b"1\n0\n",
+            "<stdin>: line 2: Number must be positive",
+        ),
+        (["-c", "n"], b"n\n1\n\nx\n", "<stdin>: line 4: Not an integer: 'x'"),
+        (["-c", "m"], b"n\n1\n", "No column named 'm'"),
+        (["-c", "0"], b"1\n", "Invalid column: 0"),
+    ],
+)
+def test_cli_invalid_input(
+    args: list[str],
+    data: bytes,
+    error: str,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    _stdin(monkeypatch, data)
+    assert app(["-f", "indefinite", *args], prog="hebrew-numbers") == 1
+    assert capsys.readouterr().err == f"hebrew-numbers: error: {error}\n"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["-f", "ordinal"], ["-f", "cardinal", "--noun", "a", "b"], ["-f", "words"]],
+)
+def test_cli_invalid_arguments(args: list[str]) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        app(args)
+    assert exc_info.value.code == 2
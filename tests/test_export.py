@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import csv
+import functools
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hebrew_numbers import (
+    InvalidNumberError,
+    cardinal_number,
+    compile_count_noun,
+    count_noun,
+    count_prefix,
+    indefinite_number,
+    ordinal_number,
+)
+from hebrew_numbers.export import FORMS, write_forms_csv
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from hebrew_numbers import NumberFormatter
+
+NUMBERS = [
+    -(10**66) + 1,
+    -(10**66),
+    -1000,
+    -3,
+    0,
+    1,
+    2,
+    *range(10, 1000, 7),
+    *(7 * 10**k + 13 for k in range(3, 66)),
+    *(3 * 10**k for k in range(3, 66)),
+    10**66 - 1,
+    10**66,
+]
+CONVERTERS: dict[str, Callable[[int], str]] = {
+    "indefinite": indefinite_number,
+    "cardinal_feminine_absolute": functools.partial(
+        cardinal_number, gender="f", construct=False
+    ),
+    "cardinal_feminine_construct": functools.partial(
+        cardinal_number, gender="f", construct=True
+    ),
+    "cardinal_masculine_absolute": functools.partial(
+        cardinal_number, gender="m", construct=False
+    ),
+    "cardinal_masculine_construct": functools.partial(
+        cardinal_number, gender="m", construct=True
+    ),
+    "ordinal_feminine": functools.partial(ordinal_number, gender="f"),
+    "ordinal_masculine": functools.partial(ordinal_number, gender="m"),
+    "count_prefix_feminine": functools.partial(count_prefix, gender="f"),
+    "count_prefix_feminine_definite": functools.partial(
+        count_prefix, gender="f", definite=True
+    ),
+    "count_prefix_masculine": functools.partial(count_prefix, gender="m"),
+    "count_prefix_masculine_definite": functools.partial(
+        count_prefix, gender="m", definite=True
+    ),
+}
+
+
+def _convert(converter: Callable[[int], str], n: int) -> str:
+    try:
+        return converter(n)
+    except InvalidNumberError:
+        return ""
+
+
+def test_write_forms_csv() -> None:
+    assert list(CONVERTERS) == list(FORMS)
+    out = io.StringIO(newline="")
+    write_forms_csv(NUMBERS, out)
+    rows = list(csv.reader(io.StringIO(out.getvalue(), newline="")))
+    assert rows == [
+        ["number", *FORMS],
+        *(
+            [str(n), *(_convert(converter, n) for converter in CONVERTERS.values())]
+            for n in NUMBERS
+        ),
+    ]
+
+
+def test_write_forms_csv_streams(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("hebrew_numbers.export._BATCH_SIZE", 1)
+    out = io.StringIO()
+
+    def numbers() -> Iterator[int]:
+        for n in range(1, 5):
+            yield n
+            # the header and the row of n are already written
+            assert out.getvalue().count("\n") == n + 1
+
+    write_forms_csv(numbers(), out, ["ordinal_feminine"])
+    assert out.getvalue().splitlines() == [
+        "number,ordinal_feminine",
+        *(f"{n},{ordinal_number(n, 'f')}" for n in range(1, 5)),
+    ]
+
+
+def test_write_forms_csv_no_header() -> None:
+    out = io.StringIO()
+    write_forms_csv(range(3), out, ["indefinite", "indefinite"], header=False)
+    assert out.getvalue().splitlines() == ["0,אפס,אפס", "1,אחת,אחת", "2,שתיים,שתיים"]
+
+
+def test_write_forms_csv_formatters() -> None:
+    out = io.StringIO()
+    numbers = [-1, 0, 1, 2, 1000, 1001, 2_000_003]
+    forms: list[str | tuple[str, NumberFormatter]] = [
+        ("children", compile_count_noun("ילד", "ילדים", "m")),
+        "ordinal_feminine",
+        ("the_girls", compile_count_noun("הילדה", "הילדות", "f", definite=True)),
+    ]
+    converters: list[Callable[[int], str]] = [
+        lambda n: count_noun(n, "ילד", "ילדים", "m"),
+        CONVERTERS["ordinal_feminine"],
+        lambda n: count_noun(n, "הילדה", "הילדות", "f", definite=True),
+    ]
+    write_forms_csv(numbers, out, forms, number_column="")
+    assert out.getvalue().splitlines() == [
+        ",children,ordinal_feminine,the_girls",
+        *(
+            ",".join([str(n), *(_convert(converter, n) for converter in converters)])
+            for n in numbers
+        ),
+    ]
+
+
+def test_write_forms_csv_invalid() -> None:
+    out = io.StringIO()
+    with pytest.raises(ValueError, match="Invalid form: cardinal"):
+        write_forms_csv([1], out, ["indefinite", "cardinal"])
+    with pytest.raises(ValueError, match="without quoting"):
+        write_forms_csv([1], out, [("a,b", compile_count_noun("ילד", "ילדים", "m"))])
+    with pytest.raises(ValueError, match="without quoting"):
+        write_forms_csv([1], out, [("a", compile_count_noun('דו"ח', 'דו"חות', "m"))])
+    assert not out.getvalue()
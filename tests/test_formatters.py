@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import hebrew_numbers
+import hebrew_numbers.export
+from hebrew_numbers import (
+    ConstructState,
+    InvalidNumberError,
+    NumberForms,
+    all_forms,
+    compile_cardinal,
+    compile_count_noun,
+    compile_count_prefix,
+    compile_indefinite,
+    compile_ordinal,
+)
+
+NUMBERS = [
+    *range(1, 1100),
+    *range(999_990, 1_000_020),
+    *[10**k for k in range(66)],
+    *[3 * 10**k + 7 for k in range(66)],
+    10**66 - 1,
+]
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("definite", [False, True])
+def test_formatters_match_functions(
+    gender: str,
+    definite: bool,  # noqa: FBT001
+) -> None:
+    cardinal = compile_cardinal(gender, construct=definite)
+    ordinal = compile_ordinal(gender)
+    prefix = compile_count_prefix(gender, definite=definite)
+    noun = compile_count_noun("ילד", "ילדים", gender, definite=definite)
+    for n in NUMBERS:
+        assert cardinal(n) == hebrew_numbers.cardinal_number(n, gender, definite)
+        assert ordinal(n) == hebrew_numbers.ordinal_number(n, gender)
+        assert noun(n) == hebrew_numbers.count_noun(
+            n, "ילד", "ילדים", gender, definite=definite
+        )
+        if n != 1:
+            assert prefix(n) == hebrew_numbers.count_prefix(
+                n, gender, definite=definite
+            )
+
+
+def test_indefinite() -> None:
+    indefinite = compile_indefinite()
+    for n in [*NUMBERS, 0, *(-n for n in NUMBERS)]:
+        assert indefinite(n) == hebrew_numbers.indefinite_number(n)
+
+
+def test_all_forms() -> None:
+    for n in [*NUMBERS, 0, -1, -(10**66) + 1]:
+        forms = all_forms(n)
+        assert forms.indefinite == hebrew_numbers.indefinite_number(n)
+        for gender, name in [("f", "feminine"), ("m", "masculine")]:
+            expected = {
+                f"cardinal_{name}_absolute": (
+                    hebrew_numbers.cardinal_number,
+                    (gender, False),
+                    {},
+                ),
+                f"cardinal_{name}_construct": (
+                    hebrew_numbers.cardinal_number,
+                    (gender, True),
+                    {},
+                ),
+                f"ordinal_{name}": (hebrew_numbers.ordinal_number, (gender,), {}),
+                f"count_prefix_{name}": (hebrew_numbers.count_prefix, (gender,), {}),
+                f"count_prefix_{name}_definite": (
+                    hebrew_numbers.count_prefix,
+                    (gender,),
+                    {"definite": True},
+                ),
+            }
+            for field, (function, args, kwargs) in expected.items():
+                try:
+                    form: str | None = function(n, *args, **kwargs)  # type: ignore[operator]
+                except InvalidNumberError:
+                    form = None
+                assert getattr(forms, field) == form, (n, field)
+
+
+def test_all_forms_record() -> None:
+    forms = all_forms(2)
+    assert isinstance(forms, NumberForms)
+    assert not hasattr(forms, "__dict__")
+    assert forms._fields == hebrew_numbers.export.FORMS
+    assert forms.count_prefix_feminine == "שתי"
+    with pytest.raises(InvalidNumberError, match="below"):
+        all_forms(10**66)
+
+
+def test_many_and_write() -> None:
+    cardinal = compile_cardinal("m", construct=False)
+    out = ["x"]
+    assert cardinal.many(iter([1, 2000]), out=out) is out
+    assert out == ["x", "אֶחָד", "אלפיים"]
+    buffer = io.StringIO()
+    cardinal.write(3, buffer)
+    cardinal.write(4, buffer)
+    assert buffer.getvalue() == "שלושהארבעה"
+
+
+def test_bytes() -> None:
+    formatters = [
+        compile_cardinal("f", construct=True),
+        compile_indefinite(),
+        compile_ordinal("m"),
+        compile_count_prefix("f", definite=True),
+        compile_count_noun("ילד", "ילדים", "m", definite=True),
+    ]
+    for fmt in formatters:
+        buf = bytearray()
+        numbers = [n for n in [*NUMBERS, -1, -1234, 0] if n > 1 or fmt is formatters[1]]
+        for n in numbers:
+            assert fmt.format_bytes(n) == fmt(n).encode()
+            assert fmt.write_bytes(n, buf) == len(fmt(n).encode())
+        assert buf.decode() == "".join(fmt.many(numbers))
+    view = memoryview(bytearray(20))
+    assert formatters[2].write_bytes(3, view, 4) == len("שלישי".encode())
+    assert bytes(view[4:14]).decode() == "שלישי"
+    with pytest.raises(InvalidNumberError, match="positive"):
+        formatters[0].format_bytes(0)
+
+
+def test_invalid() -> None:
+    with pytest.raises(InvalidNumberError, match="positive"):
+        compile_cardinal("f", construct=False)(0)
+    with pytest.raises(InvalidNumberError, match="below"):
+        compile_indefinite()(-(10**66))
+    with pytest.raises(InvalidNumberError, match="'1' is not a prefix"):
+        compile_count_prefix("f").many([2, 1])
+    with pytest.raises(InvalidNumberError, match="positive"):
+        compile_count_noun("a", "b", "f")(0)
+    with pytest.raises(ValueError, match="CONSTRUCT79"):
+        compile_cardinal("f", ConstructState.CONSTRUCT79)
+
+
+def test_repr() -> None:
+    assert repr(compile_count_prefix("f", definite=True)) == (
+        "<NumberFormatter compile_count_prefix(f, definite=True)>"
+    )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from hebrew_numbers import normalize_digits
+
+NOUNS = {"ילד": "m", "ילדים": "m", "ילדה": "f", "ילדות": "f", "ספרים": "זכר"}
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", ""),
+        ("אין כאן מספרים", "אין כאן מספרים"),
+        ("3", "שָלוש"),
+        ("יש 3 ילדים", "יש שלושה ילדים"),
+        ("יש 3 ילדות", "יש שָלוש ילדות"),
+        ("3 הילדים", "שלושת הילדים"),
+        ("2 ילדות", "שתי ילדות"),
+        ("1 ילדה", "ילדה אחת"),
+        ("1 הילד", "הילד האֶחָד"),
+        ("1,000 ספרים", "אלף ספרים"),
+        ("0 ילדים", "אפס ילדים"),
+        ("-3 ילדים", "מינוס שָלוש ילדים"),
+        ("3 כלבים", "שָלוש כלבים"),
+        ("יוני 10-20", "יוני עשר-עשרים"),
+        ("1.5 או 2,50 או x3 או 3x", "1.5 או 2,50 או x3 או 3x"),
+        ("1" + "0" * 66, "1" + "0" * 66),
+        ("1" + "0" * 65, "מאה ויגינטיליון"),
+    ],
+)
+def test_normalize_digits(text: str, expected: str) -> None:
+    assert normalize_digits(text, nouns=NOUNS) == expected
+
+
+def test_normalize_digits_keep() -> None:
+    assert normalize_digits("3 ילדים, 4 כלבים", "keep", nouns=NOUNS) == (
+        "שלושה ילדים, 4 כלבים"
+    )
+
+
+TEXT = (
+    "בכיתה היו 12 ילדים, 13 ילדות, עם 2 הילדים החדשים הביאו 1,024 ספרים.\n"
+    "הטמפרטורה ירדה ל -4 מעלות, אך-1 ילדה קראה 1.5 ספרים ב 3 שעות.\n"
+)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 1000])
+def test_normalize_digits_chunks(size: int) -> None:
+    chunks = [TEXT[i : i + size] for i in range(0, len(TEXT), size)]
+    normalized = list(normalize_digits(chunks, nouns=NOUNS))
+    assert "".join(normalized) == normalize_digits(TEXT, nouns=NOUNS)
+    assert all(normalized)
+
+
+def test_normalize_digits_invalid_default() -> None:
+    with pytest.raises(ValueError, match="Invalid default"):
+        normalize_digits("3", "cardinal")  # type: ignore[call-overload]
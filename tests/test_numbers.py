@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import functools
+import io
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -14,9 +16,12 @@ from hebrew_numbers import (
 )
 from hebrew_numbers.hebrew_numbers import (
     _decompose_hundreds,
+    _group_table,
     _join_words,
+    _split_triads,
     _translate_one_digit,
     _translate_to_20,
+    _triad_table,
 )
 
 if TYPE_CHECKING:
@@ -45,7 +50,8 @@ NUMBERS_TO_TEST = sorted(
         *range(0, 100000000, 11111111),
         *range(0, 1000000000, 111111111),
         *range(0, 10000000000, 1111111111),
-        *[10**n for n in range(30)],
+        *[10**n for n in range(70)],
+        *[2 * 10**n + 10**n // 1000 for n in range(3, 66, 3)],
     }
 )
 
@@ -262,11 +268,10 @@ class TestCardinalNumberEdgeCases:
             cardinal_number(-1, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE)
 
     def test_cardinal_number_too_large(self) -> None:
-        """Test cardinal_number with numbers >= 10^21."""
-        # Test line 331 in hebrew_numbers.py
-        with pytest.raises(InvalidNumberError, match="Number must be below 10\\^21"):
+        """Test cardinal_number with numbers >= 10^66."""
+        with pytest.raises(InvalidNumberError, match="Number must be below 10\\^66"):
             cardinal_number(
-                10**21, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE
+                10**66, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE
             )
 
 
@@ -289,3 +294,371 @@ def test_decompose_hundreds_invalid_range(n: int) -> None:
     """Test _decompose_hundreds with numbers outside valid range."""
     with pytest.raises(ValueError, match="must be between 1 and 999"):
         _decompose_hundreds(n, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE)
+
+
+@pytest.mark.parametrize(
+    "gender", [GrammaticalGender.FEMININE, GrammaticalGender.MASCULINE]
+)
+@pytest.mark.parametrize(
+    "construct", [ConstructState.ABSOLUTE, ConstructState.CONSTRUCT]
+)
+def test_triad_table(gender: GrammaticalGender, construct: ConstructState) -> None:
+    table = _triad_table(gender, construct)
+    assert len(table) == 1000
+    assert table[0] == ()
+    for n in range(1, 1000):
+        words = [w for w in _decompose_hundreds(n, gender, construct) if w]
+        assert table[n] == tuple(words)
+
+
+def test_group_table() -> None:
+    assert _group_table(1)[1] == "אלף"
+    assert _group_table(1)[2] == "אלפיים"
+    assert _group_table(1)[10] == "עשרת אלפים"
+    assert _group_table(1)[11] == "אַחַד־עשר אלף"
+    assert _group_table(2)[3] == "שלושה מיליון"
+    assert all(len(_group_table(scale)) == 1000 for scale in range(1, 7))
+
+
+def test_cardinal_number_construct79() -> None:
+    assert cardinal_number(7, "f", ConstructState.CONSTRUCT79) == "שְבע"
+    assert cardinal_number(3, "f", ConstructState.CONSTRUCT79) == "שְלוש"
+
+
+VALID_NUMBERS = [n for n in NUMBERS_TO_TEST if 0 < n < 10**66]
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("definite", [False, True])
+def test_batch_matches_scalar(gender: str, definite: bool) -> None:  # noqa: FBT001
+    assert hebrew_numbers.cardinal_numbers(VALID_NUMBERS, gender, definite) == [
+        cardinal_number(n, gender, definite) for n in VALID_NUMBERS
+    ]
+    assert hebrew_numbers.ordinal_numbers(iter(VALID_NUMBERS), gender) == [
+        hebrew_numbers.ordinal_number(n, gender) for n in VALID_NUMBERS
+    ]
+    assert hebrew_numbers.count_prefixes(
+        VALID_NUMBERS[1:], gender, definite=definite
+    ) == [
+        hebrew_numbers.count_prefix(n, gender, definite=definite)
+        for n in VALID_NUMBERS[1:]
+    ]
+    assert hebrew_numbers.count_nouns(
+        VALID_NUMBERS, "ילד", "ילדים", gender, definite=definite
+    ) == [
+        hebrew_numbers.count_noun(n, "ילד", "ילדים", gender, definite=definite)
+        for n in VALID_NUMBERS
+    ]
+    numbers = [-n for n in VALID_NUMBERS] + [0, *VALID_NUMBERS]
+    assert hebrew_numbers.indefinite_numbers(numbers) == [
+        hebrew_numbers.indefinite_number(n) for n in numbers
+    ]
+
+
+def test_batch_out() -> None:
+    out = ["x"]
+    result = hebrew_numbers.cardinal_numbers([1], "f", construct=False, out=out)
+    assert result is out
+    assert out == ["x", "אחת"]
+    assert hebrew_numbers.cardinal_numbers([], "f", construct=False) == []
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "numbers", "match"),
+    [
+        (hebrew_numbers.cardinal_numbers, ("f", False), [1, 0, 2], "positive"),
+        (hebrew_numbers.cardinal_numbers, ("f", False), [1, 10**66], "below"),
+        (hebrew_numbers.ordinal_numbers, ("f",), [3, -1], "positive"),
+        (hebrew_numbers.count_prefixes, ("f",), [3, 1, 2], "'1' is not a prefix"),
+        (hebrew_numbers.count_nouns, ("a", "b", "f"), [1, 0], "positive"),
+        (hebrew_numbers.indefinite_numbers, (), [0, -(10**66)], "below"),
+    ],
+)
+def test_batch_invalid(  # type: ignore[explicit-any]
+    func: Callable[..., list[str]],
+    args: tuple[Any, ...],
+    numbers: list[int],
+    match: str,
+) -> None:
+    out: list[str] = []
+    with pytest.raises(InvalidNumberError, match=match):
+        func(numbers, *args, out=out)
+    assert out == []
+
+
+DIRTY_NUMBERS = [-(10**66), -5, 0, 1, 2, 1000, 10**66 - 1, 10**66]
+
+
+def _convert_or_none(scalar: Callable[[int], str], n: int) -> str | None:
+    try:
+        return scalar(n)
+    except InvalidNumberError:
+        return None
+
+
+@pytest.mark.parametrize(
+    ("func", "scalar"),
+    [
+        (
+            functools.partial(
+                hebrew_numbers.cardinal_numbers, gender="f", construct=False
+            ),
+            functools.partial(cardinal_number, gender="f", construct=False),
+        ),
+        (
+            functools.partial(hebrew_numbers.ordinal_numbers, gender="m"),
+            functools.partial(hebrew_numbers.ordinal_number, gender="m"),
+        ),
+        (
+            functools.partial(hebrew_numbers.count_prefixes, gender="f"),
+            functools.partial(hebrew_numbers.count_prefix, gender="f"),
+        ),
+        (
+            functools.partial(
+                hebrew_numbers.count_nouns,
+                singular_form="a",
+                plural_form="b",
+                gender="f",
+            ),
+            functools.partial(
+                hebrew_numbers.count_noun,
+                singular_form="a",
+                plural_form="b",
+                gender="f",
+            ),
+        ),
+        (hebrew_numbers.indefinite_numbers, hebrew_numbers.indefinite_number),
+        (
+            hebrew_numbers.compile_cardinal("m", construct=True).many,
+            functools.partial(cardinal_number, gender="m", construct=True),
+        ),
+    ],
+)
+@pytest.mark.parametrize("errors", ["none", "empty", str])
+def test_batch_errors(  # type: ignore[explicit-any]
+    func: Callable[..., list[str | None]],
+    scalar: Callable[[int], str],
+    errors: str | Callable[[int], str],
+) -> None:
+    replacements = {"none": None, "empty": ""}
+    expected = [
+        _convert_or_none(scalar, n)
+        or (replacements[errors] if isinstance(errors, str) else errors(n))
+        for n in DIRTY_NUMBERS
+    ]
+    out: list[str | None] = [None]
+    assert func(iter(DIRTY_NUMBERS), errors=errors, out=out) is out
+    assert out == [None, *expected]
+    assert func(DIRTY_NUMBERS, errors=errors) == expected
+
+
+def test_batch_dedup() -> None:
+    numbers = [*VALID_NUMBERS[:20], *VALID_NUMBERS[:20], 0]
+    result = hebrew_numbers.cardinal_numbers(
+        iter(numbers), "m", construct=False, dedup=True, errors="none"
+    )
+    assert result == hebrew_numbers.cardinal_numbers(
+        numbers, "m", construct=False, errors="none"
+    )
+    assert result[0] is result[20]
+    with pytest.raises(InvalidNumberError, match="positive"):
+        hebrew_numbers.ordinal_numbers(numbers, "f", dedup=True)
+    codes, uniques = hebrew_numbers.factorize(iter(numbers))
+    assert uniques == [*VALID_NUMBERS[:20], 0]
+    assert [uniques[code] for code in codes] == numbers
+
+
+def test_batch_invalid_errors() -> None:
+    with pytest.raises(ValueError, match="Invalid errors: ignore"):
+        hebrew_numbers.cardinal_numbers(
+            [1], "f", construct=False, errors="ignore"  # type: ignore[call-overload]
+        )
+
+
+def test_try_cardinal_number() -> None:
+    scalar = functools.partial(cardinal_number, gender="m", construct=False)
+    for n in DIRTY_NUMBERS:
+        assert hebrew_numbers.try_cardinal_number(
+            n, "m", construct=False
+        ) == _convert_or_none(scalar, n)
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("definite", [False, True])
+def test_write_matches_scalar(gender: str, definite: bool) -> None:  # noqa: FBT001
+    out = io.StringIO()
+    fragments: list[str] = []
+    for n in VALID_NUMBERS:
+        for sink in (out, fragments):
+            hebrew_numbers.write_cardinal(n, gender, definite, sink)
+            hebrew_numbers.write_ordinal(n, gender, sink)
+            hebrew_numbers.write_count_noun(
+                n, "ילד", "ילדים", gender, sink, definite=definite
+            )
+            hebrew_numbers.write_indefinite(-n, sink)
+            if n > 1:
+                hebrew_numbers.write_count_prefix(n, gender, sink, definite=definite)
+    expected = "".join(
+        cardinal_number(n, gender, definite)
+        + hebrew_numbers.ordinal_number(n, gender)
+        + hebrew_numbers.count_noun(n, "ילד", "ילדים", gender, definite=definite)
+        + hebrew_numbers.indefinite_number(-n)
+        + (hebrew_numbers.count_prefix(n, gender, definite=definite) if n > 1 else "")
+        for n in VALID_NUMBERS
+    )
+    assert out.getvalue() == expected
+    assert "".join(fragments) == expected
+
+
+def test_write_invalid() -> None:
+    out: list[str] = []
+    with pytest.raises(InvalidNumberError, match="positive"):
+        hebrew_numbers.write_cardinal(0, "f", construct=False, out=out)
+    with pytest.raises(InvalidNumberError, match="'1' is not a prefix"):
+        hebrew_numbers.write_count_prefix(1, "f", out)
+    assert out == []
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("construct", [False, True])
+def test_bytes_match_scalar(gender: str, construct: bool) -> None:  # noqa: FBT001
+    buf = bytearray()
+    for n in VALID_NUMBERS:
+        expected = cardinal_number(n, gender, construct).encode()
+        assert hebrew_numbers.cardinal_number_bytes(n, gender, construct) == expected
+        written = hebrew_numbers.write_cardinal_bytes(n, gender, construct, buf)
+        assert written == len(expected)
+    assert buf == b"".join(
+        cardinal_number(n, gender, construct).encode() for n in VALID_NUMBERS
+    )
+
+
+def test_write_bytes_at_offset() -> None:
+    expected = cardinal_number(2_001_000, "f", construct=False).encode()
+    buf = bytearray(b"-" * (len(expected) + 2))
+    view = memoryview(buf)
+    written = hebrew_numbers.write_cardinal_bytes(
+        2_001_000, "f", construct=False, buf=view, offset=1
+    )
+    assert written == len(expected)
+    assert buf == b"-" + expected + b"-"
+    with pytest.raises(ValueError, match="Cannot write"):
+        hebrew_numbers.write_cardinal_bytes(
+            2_001_000, "f", construct=False, buf=view, offset=3
+        )
+    with pytest.raises(ValueError, match="Cannot write"):
+        hebrew_numbers.write_cardinal_bytes(
+            1, "f", construct=False, buf=view, offset=-1
+        )
+    with pytest.raises(TypeError, match="offset is required"):
+        hebrew_numbers.write_cardinal_bytes(1, "f", construct=False, buf=view)
+    with pytest.raises(InvalidNumberError, match="positive"):
+        hebrew_numbers.write_cardinal_bytes(0, "f", construct=False, buf=buf)
+    assert buf == b"-" + expected + b"-"
+
+
+RANGES = [
+    (1, 1),
+    (5, 3),
+    (1, 2500),
+    (990, 1010),
+    (999_990, 1_001_010),
+    (10**18 - 5, 10**18 + 1005),
+    (10**21 - 3, 10**21 + 1003),
+    (10**66 - 3, 10**66),
+]
+
+
+@pytest.mark.parametrize(("start", "stop"), RANGES)
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("construct", [False, True])
+def test_iter_cardinal(
+    start: int,
+    stop: int,
+    gender: str,
+    construct: bool,  # noqa: FBT001
+) -> None:
+    assert list(hebrew_numbers.iter_cardinal(start, stop, gender, construct)) == [
+        cardinal_number(n, gender, construct) for n in range(start, stop)
+    ]
+
+
+@pytest.mark.parametrize(("start", "stop"), [*RANGES, (1, 12), (3, 8), (8, 20)])
+@pytest.mark.parametrize("gender", ["f", "m"])
+def test_iter_ordinal(start: int, stop: int, gender: str) -> None:
+    assert list(hebrew_numbers.iter_ordinal(start, stop, gender)) == [
+        hebrew_numbers.ordinal_number(n, gender) for n in range(start, stop)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("start", "stop"), [*RANGES, (-1010, 1010), (-5, -1), (0, 1), (-3, 0)]
+)
+def test_iter_indefinite(start: int, stop: int) -> None:
+    assert list(hebrew_numbers.iter_indefinite(start, stop)) == [
+        hebrew_numbers.indefinite_number(n) for n in range(start, stop)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("func", "args"),
+    [
+        (hebrew_numbers.iter_cardinal, (0, 5, "f", False)),
+        (hebrew_numbers.iter_cardinal, (1, 10**66 + 1, "f", False)),
+        (hebrew_numbers.iter_ordinal, (-1, 5, "f")),
+        (hebrew_numbers.iter_indefinite, (-(10**66), 5)),
+    ],
+)
+def test_iter_invalid(  # type: ignore[explicit-any]
+    func: Callable[..., Iterator[str]], args: tuple[Any, ...]
+) -> None:
+    with pytest.raises(InvalidNumberError):
+        func(*args)
+
+
+@pytest.mark.parametrize(
+    "n",
+    [
+        0,
+        1,
+        999,
+        1000,
+        10**48 - 1,
+        10**48,
+        10**66 - 1,
+        pytest.param(3**5000, id="3**5000"),
+        pytest.param(7**20000 + 1, id="7**20000+1"),
+    ],
+)
+def test_split_triads(n: int) -> None:
+    triads = _split_triads(n)
+    assert all(0 <= t < 1000 for t in triads)
+    assert not triads or triads[-1] != 0
+    assert sum(t * 1000**i for i, t in enumerate(triads)) == n
+    assert hebrew_numbers.split_triads(n) == triads
+
+
+def test_split_triads_negative() -> None:
+    with pytest.raises(InvalidNumberError, match="negative"):
+        hebrew_numbers.split_triads(-1)
+
+
+@pytest.mark.parametrize(
+    ("words", "gender"),
+    [
+        (["masculine", "male", "זכר"], GrammaticalGender.MASCULINE),
+        (["feminine", "female", "נקבה"], GrammaticalGender.FEMININE),
+    ],
+)
+def test_gender_from_string(words: list[str], gender: GrammaticalGender) -> None:
+    for word in words:
+        for i in range(1, len(word) + 1):
+            assert GrammaticalGender.from_string(word[:i]) is gender
+            assert GrammaticalGender.from_string(word[:i].upper()) is gender
+    assert GrammaticalGender.from_string(gender) is gender
+
+
+@pytest.mark.parametrize("s", ["x", "males", "Fem ", "נקבי"])
+def test_gender_from_string_invalid(s: str) -> None:
+    with pytest.raises(ValueError, match="Invalid gender"):
+        GrammaticalGender.from_string(s)
@@ -0,0 +1,119 @@
+"""Tests for the NumPy vectorized converters."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+import hebrew_numbers
+from hebrew_numbers import ConstructState, InvalidNumberError
+from hebrew_numbers import numpy as hn_np
+
+rng = np.random.default_rng(0)
+NUMBERS = sorted(
+    {
+        *range(1, 1200),
+        *[10**k for k in range(19)],
+        *[10**k + 1 for k in range(19)],
+        *[10**k - 1 for k in range(1, 19)],
+        *[2 * 10**k for k in range(19)],
+        *rng.integers(1, 2**63, 2000).tolist(),
+        *(rng.integers(1, 2**63, 2000) // 10 ** rng.integers(0, 16, 2000)).tolist(),
+        2**63 - 1,
+    }
+)
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("construct", [False, True])
+def test_cardinal_numbers(gender: str, construct: bool) -> None:  # noqa: FBT001
+    result = hn_np.cardinal_numbers(np.array(NUMBERS), gender, construct)
+    assert result.tolist() == hebrew_numbers.cardinal_numbers(
+        NUMBERS, gender, construct
+    )
+
+
+def test_cardinal_numbers_uint64() -> None:
+    numbers = [2**64 - 1, 10**19, 1]
+    result = hn_np.cardinal_numbers(
+        np.array(numbers, dtype=np.uint64), "f", construct=False
+    )
+    assert result.tolist() == hebrew_numbers.cardinal_numbers(
+        numbers, "f", construct=False
+    )
+
+
+def test_cardinal_numbers_shape_and_dtype() -> None:
+    result = hn_np.cardinal_numbers(
+        np.arange(1, 7, dtype=np.int8).reshape(2, 3), "m", construct=False
+    )
+    assert result.shape == (2, 3)
+    assert result[1, 2] == "שישה"
+    assert hn_np.cardinal_numbers(
+        np.array([], dtype=int), "m", construct=False
+    ).shape == (0,)
+
+
+def test_indefinite_numbers() -> None:
+    numbers = [-n for n in NUMBERS] + [0, *NUMBERS]
+    result = hn_np.indefinite_numbers(np.array(numbers))
+    assert result.tolist() == hebrew_numbers.indefinite_numbers(numbers)
+    assert hn_np.indefinite_numbers(np.array([-(2**63)]))[0] == (
+        hebrew_numbers.indefinite_number(-(2**63))
+    )
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("definite", [False, True])
+def test_count_forms(gender: str, definite: bool) -> None:  # noqa: FBT001
+    arr = np.array(NUMBERS)
+    assert hn_np.ordinal_numbers(arr, gender).tolist() == (
+        hebrew_numbers.ordinal_numbers(NUMBERS, gender)
+    )
+    assert hn_np.count_prefixes(arr[1:], gender, definite=definite).tolist() == (
+        hebrew_numbers.count_prefixes(NUMBERS[1:], gender, definite=definite)
+    )
+    assert hn_np.count_nouns(
+        arr, "ילד", "ילדים", gender, definite=definite
+    ).tolist() == hebrew_numbers.count_nouns(
+        NUMBERS, "ילד", "ילדים", gender, definite=definite
+    )
+
+
+def test_invalid() -> None:
+    with pytest.raises(InvalidNumberError, match="positive"):
+        hn_np.cardinal_numbers(np.array([3, 0]), "f", construct=False)
+    with pytest.raises(InvalidNumberError, match="positive"):
+        hn_np.ordinal_numbers(np.array([-3]), "f")
+    with pytest.raises(InvalidNumberError, match="'1' is not a prefix"):
+        hn_np.count_prefixes(np.array([3, 1]), "f")
+    with pytest.raises(TypeError, match="integer array"):
+        hn_np.cardinal_numbers(np.array([1.0]), "f", construct=False)
+    with pytest.raises(TypeError, match="integer array"):
+        hn_np.cardinal_numbers(np.array([1], dtype=object), "f", construct=False)
+    with pytest.raises(ValueError, match="CONSTRUCT79"):
+        hn_np.cardinal_numbers(np.array([17, 7]), "f", ConstructState.CONSTRUCT79)
+
+
+def test_factorize_and_dedup() -> None:
+    repeated = rng.choice(np.array(NUMBERS[:50]), (40, 25))
+    codes, uniques = hn_np.factorize(repeated)
+    assert codes.shape == repeated.shape
+    assert (uniques[codes] == repeated).all()
+    assert uniques.tolist() == hebrew_numbers.factorize(repeated.flat)[1]
+    for convert, args in [
+        (hn_np.cardinal_numbers, ("f", True)),
+        (hn_np.ordinal_numbers, ("m",)),
+        (hn_np.count_prefixes, ("f",)),
+        (hn_np.count_nouns, ("ילד", "ילדים", "m")),
+        (hn_np.indefinite_numbers, ()),
+    ]:
+        numbers = repeated if convert is not hn_np.count_prefixes else repeated + 1
+        result = convert(numbers, *args, dedup=True)  # type: ignore[operator]
+        assert result.shape == repeated.shape
+        assert (result == convert(numbers, *args)).all()  # type: ignore[operator]
+    with pytest.raises(InvalidNumberError, match="positive"):
+        hn_np.cardinal_numbers(np.array([3, 0, 3]), "f", construct=False, dedup=True)
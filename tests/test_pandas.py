@@ -0,0 +1,91 @@
+"""Tests for the pandas accessor."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pandas")
+
+import pandas as pd
+
+import hebrew_numbers
+from hebrew_numbers import ConstructState, InvalidNumberError
+from hebrew_numbers import pandas as hn_pd
+
+NUMBERS = [5, 1, 5, 1000, 2_000_005, 5, 12, 10**18]
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint64", "Int64", "int64[pyarrow]"])
+def test_accessor_matches_batch(dtype: str) -> None:
+    if dtype.endswith("[pyarrow]"):
+        pytest.importorskip("pyarrow")
+    s = pd.Series(NUMBERS, index=list("abcdefgh"), name="n", dtype=dtype)
+    result = s.hebrew.cardinal(gender="m", construct=True)
+    assert isinstance(s.hebrew, hn_pd.HebrewAccessor)
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert result.index.equals(s.index)
+    assert result.name == "n"
+    assert result.tolist() == hebrew_numbers.cardinal_numbers(
+        NUMBERS, "m", construct=True
+    )
+    assert len(result.cat.categories) == len(set(NUMBERS))
+    assert s.hebrew.ordinal().tolist() == hebrew_numbers.ordinal_numbers(NUMBERS, "f")
+    assert s.hebrew.indefinite().tolist() == (
+        hebrew_numbers.indefinite_numbers(NUMBERS)
+    )
+    assert s.hebrew.count("ילד", "ילדים", "m", definite=True).tolist() == (
+        hebrew_numbers.count_nouns(NUMBERS, "ילד", "ילדים", "m", definite=True)
+    )
+
+
+def test_accessor_string_dtype() -> None:
+    pytest.importorskip("pyarrow")
+    s = pd.Series([3, None, 3], dtype="Int64")
+    result = s.hebrew.cardinal(dtype="string")
+    assert result.dtype == "string[pyarrow]"
+    assert result[0] == result[2] == "שָלוש"
+    assert result.isna().tolist() == [False, True, False]
+
+
+def test_accessor_float_with_missing() -> None:
+    s = pd.Series([3, None, 3, 2.0**53 - 1])
+    assert s.dtype == "float64"
+    result = s.hebrew.cardinal()
+    assert result.isna().tolist() == [False, True, False, False]
+    assert result[[0, 2, 3]].tolist() == hebrew_numbers.cardinal_numbers(
+        [3, 3, 2**53 - 1], "f", construct=False
+    )
+    assert s.hebrew.count("ילד", "ילדים", "m").tolist()[0] == "שלושה ילדים"
+
+
+@pytest.mark.parametrize("dtype", ["int64", "object"])
+def test_accessor_construct79(dtype: str) -> None:
+    s = pd.Series([17, 7, 17], dtype=dtype)
+    result = s.hebrew.cardinal(construct=ConstructState.CONSTRUCT79)
+    assert result.tolist() == hebrew_numbers.cardinal_numbers(
+        [17, 7, 17], "f", ConstructState.CONSTRUCT79
+    )
+
+
+def test_accessor_python_integers() -> None:
+    numbers = [10**30, -5, 10**30]
+    s = pd.Series(numbers, dtype=object)
+    assert s.hebrew.indefinite().tolist() == (
+        hebrew_numbers.indefinite_numbers(numbers)
+    )
+
+
+def test_accessor_invalid() -> None:
+    s = pd.Series([1, 0])
+    with pytest.raises(InvalidNumberError, match="positive"):
+        s.hebrew.cardinal()
+    with pytest.raises(InvalidNumberError, match="integer"):
+        pd.Series([1.5]).hebrew.ordinal()
+    with pytest.raises(InvalidNumberError, match="integer"):
+        pd.Series([3, None, 2.5]).hebrew.cardinal()
+    with pytest.raises(InvalidNumberError, match="2\\^53"):
+        pd.Series([1e23, None]).hebrew.cardinal()
+    with pytest.raises(TypeError, match="integer array"):
+        pd.Series([True]).hebrew.cardinal()
+    with pytest.raises(ValueError, match="Invalid dtype"):
+        s.hebrew.indefinite(dtype="object")
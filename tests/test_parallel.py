@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import multiprocessing
+import sys
+
+import pytest
+
+import hebrew_numbers
+from hebrew_numbers import InvalidNumberError, convert_parallel
+
+NUMBERS = [*range(1, 2000), 10**18 + 5, 10**66 - 1, 7]
+
+
+@pytest.mark.parametrize("numbers", [NUMBERS, range(1, 3001)], ids=["list", "range"])
+def test_convert_parallel_cardinal(numbers: list[int] | range) -> None:
+    expected = hebrew_numbers.cardinal_numbers(numbers, "f", construct=True)
+    for batch in (numbers, iter(numbers)):
+        result = convert_parallel(
+            batch, gender="f", construct=True, workers=2, chunksize=700
+        )
+        assert result == expected
+
+
+def test_convert_parallel_forms() -> None:
+    numbers = NUMBERS[1:]
+    assert convert_parallel(numbers, "ordinal", gender="m") == (
+        hebrew_numbers.ordinal_numbers(numbers, "m")
+    )
+    assert convert_parallel(
+        numbers, "count_prefix", gender="m", definite=True, chunksize=500
+    ) == hebrew_numbers.count_prefixes(numbers, "m", definite=True)
+    negatives = [-n for n in numbers] + [0]
+    assert convert_parallel(negatives, "indefinite", chunksize=500) == (
+        hebrew_numbers.indefinite_numbers(negatives)
+    )
+
+
+def test_convert_parallel_out() -> None:
+    out = ["x"]
+    result = convert_parallel([1, 2], gender="m", out=out)
+    assert result is out
+    assert out == ["x", "אֶחָד", "שניים"]
+    assert convert_parallel([], gender="m") == []
+
+
+def test_convert_parallel_invalid() -> None:
+    with pytest.raises(InvalidNumberError, match="positive"):
+        convert_parallel([*range(1, 10), 0], gender="m", chunksize=2)
+    with pytest.raises(ValueError, match="requires a gender"):
+        convert_parallel([1])
+    with pytest.raises(ValueError, match="Invalid form"):
+        convert_parallel([1], "count_noun", gender="m")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="chunksize"):
+        convert_parallel([1], gender="m", chunksize=0)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 14), reason="requires Python 3.14")
+def test_convert_parallel_interpreters() -> None:
+    numbers = range(1, 3001)
+    assert convert_parallel(
+        numbers, gender="m", workers=2, chunksize=700, backend="interpreters"
+    ) == hebrew_numbers.cardinal_numbers(numbers, "m", construct=False)
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 14), reason="requires Python < 3.14")
+def test_convert_parallel_interpreters_unsupported() -> None:
+    with pytest.raises(ValueError, match=r"requires Python 3\.14"):
+        convert_parallel([1], gender="m", backend="interpreters")
+
+
+def test_convert_parallel_invalid_backend() -> None:
+    with pytest.raises(ValueError, match="Invalid backend"):
+        convert_parallel([1], gender="m", backend="threads")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="mp_context"):
+        convert_parallel(
+            [1],
+            gender="m",
+            backend="interpreters",
+            mp_context=multiprocessing.get_context("spawn"),
+        )
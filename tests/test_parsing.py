@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import pytest
+
+import hebrew_numbers
+from hebrew_numbers import (
+    ConstructState,
+    GrammaticalGender,
+    ParsedNumber,
+    extract_numbers,
+    parse_number,
+)
+from hebrew_numbers.parsing import _strip_niqqud
+
+NUMBERS = [
+    *range(1, 1100),
+    *range(1990, 2030),
+    *range(999_990, 1_000_020),
+    *[10**k for k in range(66)],
+    *[3 * 10**k + 7 for k in range(66)],
+    *[12 * 10**k + 2 for k in range(1, 64)],
+    10**66 - 1,
+]
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("construct", [False, True])
+def test_parse_cardinal(gender: str, construct: bool) -> None:  # noqa: FBT001
+    for n in NUMBERS:
+        text = hebrew_numbers.cardinal_number(n, gender, construct)
+        parsed = parse_number(text)
+        assert parsed.value == n, text
+        # the detected gender and construct state reproduce the text
+        assert parsed.gender in {GrammaticalGender.from_string(gender), None}
+        assert (
+            hebrew_numbers.cardinal_number(n, parsed.gender or gender, parsed.construct)
+            == text
+        )
+        assert parse_number(_strip_niqqud(text)).value == n
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+def test_parse_ordinal(gender: str) -> None:
+    for n in NUMBERS:
+        text = hebrew_numbers.ordinal_number(n, gender)
+        parsed = parse_number(text)
+        assert parsed.value == n, text
+        assert hebrew_numbers.ordinal_number(n, parsed.gender or gender) == text
+
+
+@pytest.mark.parametrize("gender", ["f", "m"])
+@pytest.mark.parametrize("definite", [False, True])
+def test_parse_count_prefix(gender: str, definite: bool) -> None:  # noqa: FBT001
+    for n in NUMBERS:
+        if n == 1:
+            continue
+        text = hebrew_numbers.count_prefix(n, gender, definite=definite)
+        assert parse_number(text).value == n, text
+
+
+def test_parse_indefinite() -> None:
+    for n in [0, *NUMBERS, *(-n for n in NUMBERS)]:
+        text = hebrew_numbers.indefinite_number(n)
+        assert parse_number(text).value == n, text
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            "שלושה עשר",
+            ParsedNumber(13, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE),
+        ),
+        (
+            "שלוש-עשרה",
+            ParsedNumber(13, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE),
+        ),
+        (
+            "שְלוש",
+            ParsedNumber(3, GrammaticalGender.FEMININE, ConstructState.CONSTRUCT),
+        ),
+        ("שלוש", ParsedNumber(3, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)),
+        ("שמונה", ParsedNumber(8, None, ConstructState.ABSOLUTE)),
+        (
+            "שמונָה",
+            ParsedNumber(8, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE),
+        ),
+        ("שני", ParsedNumber(2, GrammaticalGender.MASCULINE, ConstructState.CONSTRUCT)),
+        ("שנייה", ParsedNumber(2, GrammaticalGender.FEMININE, ConstructState.ABSOLUTE)),
+        ("אלף ומאה", ParsedNumber(1100, None, ConstructState.ABSOLUTE)),
+        (
+            "וּשְׁלוֹשָׁה",
+            ParsedNumber(3, GrammaticalGender.MASCULINE, ConstructState.ABSOLUTE),
+        ),
+        ("ויגינטיליון", ParsedNumber(10**63, None, ConstructState.ABSOLUTE)),
+    ],
+)
+def test_parse_words(text: str, expected: ParsedNumber) -> None:
+    assert parse_number(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "ספר",
+        "שלושה ספרים",
+        "מינוס",
+        "מינוס אפס",
+        "שתים",
+        "שתים מאות",
+        "עשרים עשרים",
+        "שלושה ארבעה",
+        "מאה מאה",
+        "אלף אלף",
+        "מיליון מיליארד",
+        "אלפיים אלפיים",
+        "שלושה אלפים מאות",
+        "מאה אלפים",
+        "אפס אפס",
+        "ראשון שני",
+        "עשר עשרה",
+    ],
+)
+def test_parse_invalid(text: str) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        parse_number(text)
+
+
+TEXT = (
+    "בשנת אלפיים ועשרים ושלוש נמכרו שלושת אלפים מאתיים וחמישה ספרים, "
+    "ושְלוש-עשרה מחברות. הטמפרטורה ירדה למינוס שבע; ראשון בתור היה "
+    "אחד עשר שניים שלושה מיליון ואלף ספרים שנים רבות"
+)
+TEXT_MATCHES = [
+    ("אלפיים ועשרים ושלוש", 2023, GrammaticalGender.FEMININE),
+    ("שלושת אלפים מאתיים וחמישה", 3205, GrammaticalGender.MASCULINE),
+    ("שְלוש-עשרה", 13, GrammaticalGender.FEMININE),
+    ("שבע", 7, GrammaticalGender.FEMININE),
+    ("ראשון", 1, GrammaticalGender.MASCULINE),
+    ("אחד עשר", 11, GrammaticalGender.MASCULINE),
+    ("שניים", 2, GrammaticalGender.MASCULINE),
+    ("שלושה מיליון ואלף", 3_001_000, None),
+]
+
+
+def test_extract_numbers() -> None:
+    matches = list(extract_numbers(TEXT))
+    assert [(TEXT[slice(*m.span)], m.value, m.gender) for m in matches] == TEXT_MATCHES
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 50])
+def test_extract_numbers_chunks(size: int) -> None:
+    chunks = (TEXT[i : i + size] for i in range(0, len(TEXT), size))
+    assert list(extract_numbers(chunks)) == list(extract_numbers(TEXT))
+
+
+def test_extract_numbers_empty() -> None:
+    assert list(extract_numbers([])) == []
+    assert list(extract_numbers(["", "no numbers", ""])) == []
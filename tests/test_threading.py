@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hebrew_numbers import ConversionCache, cardinal_number
+from hebrew_numbers.hebrew_numbers import _table_cache
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+THREADS = 8
+NUMBERS = [*range(1, 3000), *(7 * 10**k + 13 for k in range(3, 66))]
+
+
+def _convert(numbers: list[int]) -> list[str]:
+    return [cardinal_number(n, "f", construct=False) for n in numbers]
+
+
+def test_threads_match_serial() -> None:
+    chunks = [NUMBERS[i::THREADS] for i in range(THREADS)]
+    with concurrent.futures.ThreadPoolExecutor(THREADS) as executor:
+        results = list(executor.map(_convert, chunks))
+    assert results == [_convert(chunk) for chunk in chunks]
+
+
+def test_table_cache_publishes_one_table() -> None:
+    barrier = threading.Barrier(THREADS)
+
+    @_table_cache
+    def build(n: int) -> tuple[int, ...]:
+        return tuple(range(n))
+
+    def get(_: int) -> tuple[int, ...]:
+        barrier.wait()
+        return build(10)
+
+    with concurrent.futures.ThreadPoolExecutor(THREADS) as executor:
+        tables = list(executor.map(get, range(THREADS)))
+    assert all(table is tables[0] for table in tables)
+    assert build(10) is tables[0]
+
+
+@pytest.mark.parametrize("shards", [1, 3, 16])
+def test_sharded_cache(shards: int) -> None:
+    cache = ConversionCache(maxsize=100, shards=shards)
+
+    def convert(numbers: list[int]) -> list[str]:
+        return [cache.cardinal_number(n, "f", construct=False) for n in numbers]
+
+    chunks = [NUMBERS[:500]] * THREADS
+    with concurrent.futures.ThreadPoolExecutor(THREADS) as executor:
+        results = list(executor.map(convert, chunks))
+    assert results == [_convert(NUMBERS[:500])] * THREADS
+    info = cache.cache_info()
+    assert info.hits + info.misses == 500 * THREADS
+    assert info.currsize <= 100
+    cache.cache_clear()
+    assert cache.cache_info().currsize == 0
+
+
+def test_sharded_cache_invalid() -> None:
+    with pytest.raises(ValueError, match="shards"):
+        ConversionCache(shards=0)
+
+
+@pytest.mark.parametrize("threads", [1, 2, 4, 8])
+def test_benchmark_thread_scaling(benchmark: BenchmarkFixture, threads: int) -> None:
+    """Convert a fixed amount of work with a growing number of threads.
+
+    Run with `--benchmark-enable` on a free-threaded build to see the scaling.
+    """
+    chunks = [NUMBERS[i::threads] for i in range(threads)]
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        results = benchmark(lambda: list(executor.map(_convert, chunks)))
+    assert sum(map(len, results)) == len(NUMBERS)